@@ -0,0 +1,150 @@
+"""HTTP throughput benchmark for the sync and async database stacks.
+
+Starts the API under uvicorn once per mode (ASYNC_DATABASE=false/true) on a
+fresh file-backed SQLite database, drives it with concurrent clients issuing
+a read-heavy mix of requests, and reports requests per second and latency
+percentiles.
+
+    python -m benchmarks.bench_async_api [--concurrency 64] [--duration 10]
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start_server(async_database: bool, database_url: str, port: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        DATABASE_URL=database_url,
+        ASYNC_DATABASE=str(async_database).lower(),
+        LOG_LEVEL="WARNING",
+    )
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.api.main:app",
+            "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        env=env,
+    )
+
+
+async def _wait_ready(client: httpx.AsyncClient, timeout: float = 20.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+async def _seed(client: httpx.AsyncClient, tasks: int):
+    now = datetime.now(timezone.utc)
+    project = (await client.post("/projects/", json={
+        "title": "Benchmark",
+        "deadline": (now + timedelta(days=365)).isoformat(),
+    })).json()
+    created = (await client.post("/tasks/bulk", json={"tasks": [
+        {
+            "title": f"Task {i}",
+            "deadline": (now + timedelta(days=i % 30 + 1)).isoformat(),
+            "project_id": project["id"],
+        }
+        for i in range(tasks)
+    ]})).json()["created"]
+    return project["id"], [task["id"] for task in created]
+
+
+async def _load(client, project_id, task_ids, concurrency, duration):
+    latencies, errors = [], 0
+    stop_at = time.perf_counter() + duration
+    deadline = (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
+
+    def next_request():
+        roll = random.random()
+        if roll < 0.5:
+            return client.get(f"/tasks/{random.choice(task_ids)}")
+        if roll < 0.7:
+            return client.get(f"/projects/{project_id}/progress")
+        if roll < 0.9:
+            return client.get("/tasks/", params={"project_id": project_id, "limit": 20})
+        return client.post("/tasks/", json={
+            "title": "Load", "deadline": deadline, "project_id": project_id
+        })
+
+    async def worker():
+        nonlocal errors
+        while time.perf_counter() < stop_at:
+            start = time.perf_counter()
+            response = await next_request()
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _bench(label, async_database, concurrency, duration, tasks):
+    with tempfile.TemporaryDirectory() as tmp:
+        port = _free_port()
+        server = _start_server(async_database, f"sqlite:///{os.path.join(tmp, 'bench.db')}", port)
+        limits = httpx.Limits(max_connections=concurrency)
+        try:
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=30
+            ) as client:
+                await _wait_ready(client)
+                project_id, task_ids = await _seed(client, tasks)
+                await _load(client, project_id, task_ids, concurrency, 1)  # warm-up
+                latencies, errors, elapsed = await _load(
+                    client, project_id, task_ids, concurrency, duration
+                )
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(
+        f"{label:<8} {len(latencies) / elapsed:>8.0f} req/s "
+        f"p50 {_percentile(latencies, 50) * 1000:>7.1f} ms "
+        f"p99 {_percentile(latencies, 99) * 1000:>7.1f} ms "
+        f"errors {errors}"
+    )
+
+
+def main(concurrency: int, duration: float, tasks: int) -> None:
+    print(f"{concurrency} concurrent clients, {duration:.0f}s per mode")
+    asyncio.run(_bench("sync", False, concurrency, duration, tasks))
+    asyncio.run(_bench("async", True, concurrency, duration, tasks))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--tasks", type=int, default=500)
+    args = parser.parse_args()
+    main(args.concurrency, args.duration, args.tasks)
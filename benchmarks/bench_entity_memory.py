@@ -0,0 +1,85 @@
+"""Memory benchmark for domain entities and events.
+
+Reports tracemalloc bytes per object for 100k Tasks as a repository loads
+them (constructed, then marked clean), 100k freshly created Tasks, 100k
+Projects and 100k TaskCompletedEvents.
+
+    python -m benchmarks.bench_entity_memory [--count 100000]
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.domain.entities.project import Project
+from src.domain.entities.task import Task
+from src.domain.events.task_events import TaskCompletedEvent
+
+
+def _loaded_task(task_id, now):
+    task = Task(
+        title="Benchmark task",
+        deadline=now + timedelta(days=7),
+        id=task_id,
+        created_at=now,
+        updated_at=now
+    )
+    task.mark_clean()
+    return task
+
+
+def _new_task(task_id, now):
+    return Task(title="Benchmark task", deadline=now + timedelta(days=7), id=task_id)
+
+
+def _loaded_project(project_id, now):
+    project = Project(
+        title="Benchmark project",
+        deadline=now + timedelta(days=30),
+        id=project_id,
+        created_at=now,
+        updated_at=now
+    )
+    project.mark_clean()
+    return project
+
+
+def _event(task_id, now):
+    return TaskCompletedEvent(task_id=task_id, project_id=None, completed_at=now)
+
+
+def bytes_per_object(build, count: int) -> float:
+    """Traced bytes allocated per object when building `count` of them (ids excluded)."""
+    now = datetime.now(timezone.utc)
+    ids = [uuid4() for _ in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [build(object_id, now) for object_id in ids]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del objects
+    return allocated / count
+
+
+def main(count: int) -> None:
+    modes = [
+        ("loaded Task", _loaded_task),
+        ("new Task", _new_task),
+        ("loaded Project", _loaded_project),
+        ("TaskCompletedEvent", _event),
+    ]
+    print(f"{'object':<20} {'bytes / object':>15} {f'MB / {count}':>14}")
+    for label, build in modes:
+        per_object = bytes_per_object(build, count)
+        print(f"{label:<20} {per_object:>15.0f} {per_object * count / 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    main(args.count)
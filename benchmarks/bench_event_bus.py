@@ -0,0 +1,80 @@
+"""Publish-overhead micro-benchmark for the in-memory event bus.
+
+Measures nanoseconds per event for `publish` with 0, 1, 10 and 100 no-op
+subscribers, for `publish_many` over the same events, and for the previous
+bus (exact-type lookup, INFO log per event) as a baseline.
+
+    python -m benchmarks.bench_event_bus [--events 20000]
+"""
+import argparse
+import logging
+import time
+from uuid import uuid4
+
+from src.domain.events.task_events import TaskCompletedEvent
+from src.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+legacy_logger = logging.getLogger("benchmarks.legacy_bus")
+
+
+class _LegacyBus:
+    """The pre-dispatch-table bus: exact-type lookup and an INFO log per publish."""
+    
+    def __init__(self):
+        self._handlers = {}
+    
+    def publish(self, event) -> None:
+        legacy_logger.info(f"Publishing event: {type(event).__name__}")
+        for handler in self._handlers.get(type(event), ()):
+            try:
+                handler(event)
+            except Exception as e:
+                legacy_logger.error(f"Error handling {type(event).__name__}: {e}")
+    
+    def subscribe(self, event_type, handler) -> None:
+        self._handlers.setdefault(event_type, []).append(handler)
+
+
+def _noop(event) -> None:
+    pass
+
+
+def _time(publish, events) -> float:
+    start = time.perf_counter()
+    publish(events)
+    return (time.perf_counter() - start) * 1e9 / len(events)
+
+
+def _loop(bus):
+    def publish(events):
+        for event in events:
+            bus.publish(event)
+    return publish
+
+
+def main(events: int) -> None:
+    project_id = uuid4()
+    batch = [
+        TaskCompletedEvent(task_id=uuid4(), project_id=project_id, completed_at=None)
+        for _ in range(events)
+    ]
+
+    print(f"{'subscribers':>11} {'legacy':>10} {'publish':>10} {'publish_many':>13}  (ns/event)")
+    for subscribers in (0, 1, 10, 100):
+        legacy, bus = _LegacyBus(), InMemoryEventBus()
+        for _ in range(subscribers):
+            legacy.subscribe(TaskCompletedEvent, _noop)
+            bus.subscribe(TaskCompletedEvent, _noop)
+
+        legacy_ns = _time(_loop(legacy), batch)
+        publish_ns = _time(_loop(bus), batch)
+        many_ns = _time(bus.publish_many, batch)
+        print(f"{subscribers:>11} {legacy_ns:>10.0f} {publish_ns:>10.0f} {many_ns:>13.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, handlers=[logging.NullHandler()])
+    main(args.events)
@@ -0,0 +1,72 @@
+"""Event construction micro-benchmark.
+
+Reports TaskCompletedEvents created per second with the previous scheme
+(uuid4 plus a fresh UTC timestamp per event), with the sequence-based
+UUIDv7 ids, and with those ids inside an `event_batch` that reads the
+clock once.
+
+    python -m benchmarks.bench_event_construction [--events 100000] [--repeat 5]
+"""
+import argparse
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from src.domain.entities.base import event_batch
+from src.domain.events.task_events import TaskCompletedEvent
+
+
+@dataclass(slots=True)
+class _LegacyCompletedEvent:
+    """TaskCompletedEvent as it was built before: uuid4 and datetime.now per event."""
+    task_id: UUID
+    project_id: Optional[UUID]
+    completed_at: datetime
+    event_id: UUID = field(init=False)
+    occurred_at: datetime = field(init=False)
+    
+    def __post_init__(self):
+        self.event_id = uuid4()
+        self.occurred_at = datetime.now(timezone.utc)
+
+
+def _build(event_type, task_ids, now):
+    return [event_type(task_id=task_id, project_id=None, completed_at=now) for task_id in task_ids]
+
+
+def _batched(task_ids, now):
+    with event_batch():
+        return _build(TaskCompletedEvent, task_ids, now)
+
+
+def _best_seconds(build, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(count: int, repeat: int) -> None:
+    now = datetime.now(timezone.utc)
+    task_ids = [uuid4() for _ in range(count)]
+    modes = [
+        ("uuid4 + datetime.now", lambda: _build(_LegacyCompletedEvent, task_ids, now)),
+        ("uuidv7 sequence", lambda: _build(TaskCompletedEvent, task_ids, now)),
+        ("uuidv7 + event_batch", lambda: _batched(task_ids, now)),
+    ]
+    print(f"{'mode':<22} {'events / s':>12} {'ns / event':>11}")
+    for label, build in modes:
+        seconds = _best_seconds(build, repeat)
+        print(f"{label:<22} {count / seconds:>12,.0f} {seconds / count * 1e9:>11.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.events, args.repeat)
@@ -0,0 +1,123 @@
+"""GUID storage benchmark: CHAR(36) text vs BINARY(16) ids on SQLite.
+
+Builds one database per storage mode with the same tasks and projects and
+reports the size of the tasks table and its id-bearing indexes (from the
+dbstat virtual table), the file size, and the time for a full table scan,
+point lookups by id and per-project index scans, all through the GUID type.
+
+    python -m benchmarks.bench_guid_storage [--tasks 100000] [--projects 1000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import create_engine, select
+
+from src.infrastructure.database.guid_migration import _target_metadata
+
+_MEASURED = (
+    "tasks",
+    "sqlite_autoindex_tasks_1",
+    "ix_tasks_project_id",
+    "ix_tasks_project_completed",
+    "ix_tasks_created_at_id",
+)
+
+
+def _build(path: str, binary: bool, task_count: int, project_count: int):
+    metadata = _target_metadata(binary)
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    projects, tasks = metadata.tables["projects"], metadata.tables["tasks"]
+    
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    project_ids = [uuid4() for _ in range(project_count)]
+    with engine.begin() as connection:
+        connection.execute(projects.insert(), [
+            {"id": project_id, "title": f"Project {i}", "deadline": now + timedelta(days=60),
+             "completed": False, "created_at": now, "updated_at": now}
+            for i, project_id in enumerate(project_ids)
+        ])
+        connection.execute(tasks.insert(), [
+            {"id": uuid4(), "title": f"Task {i}", "deadline": now + timedelta(days=i % 30),
+             "completed": i % 3 == 0, "project_id": rng.choice(project_ids),
+             "created_at": now + timedelta(microseconds=i), "updated_at": now}
+            for i in range(task_count)
+        ])
+    with engine.connect() as connection:
+        connection.exec_driver_sql("VACUUM")
+        connection.exec_driver_sql("ANALYZE")
+    return engine, tasks, project_ids
+
+
+def _sizes(engine) -> dict:
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            "SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"
+        ).all()
+    return dict(rows)
+
+
+def _timed_ms(run) -> float:
+    start = time.perf_counter()
+    run()
+    return (time.perf_counter() - start) * 1000
+
+
+def _measure(engine, tasks, project_ids, lookups: int) -> dict:
+    with engine.connect() as connection:
+        ids = connection.execute(select(tasks.c.id)).scalars().all()
+        sample = random.Random(7).sample(ids, min(lookups, len(ids)))
+        by_id = select(tasks)
+        
+        def scan():
+            connection.execute(select(tasks)).all()
+        
+        def lookup():
+            for task_id in sample:
+                connection.execute(by_id.where(tasks.c.id == task_id)).one()
+        
+        def per_project():
+            for project_id in project_ids:
+                connection.execute(
+                    select(tasks.c.id).where(tasks.c.project_id == project_id, tasks.c.completed == False)
+                ).all()
+        
+        return {
+            "full scan (ms)": min(_timed_ms(scan) for _ in range(3)),
+            f"{len(sample)} id lookups (ms)": min(_timed_ms(lookup) for _ in range(3)),
+            f"{len(project_ids)} project scans (ms)": min(_timed_ms(per_project) for _ in range(3)),
+        }
+
+
+def main(task_count: int, project_count: int, lookups: int) -> None:
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for label, binary in (("CHAR(36)", False), ("BINARY(16)", True)):
+            path = os.path.join(directory, f"{'binary' if binary else 'text'}.db")
+            engine, tasks, project_ids = _build(path, binary, task_count, project_count)
+            sizes = _sizes(engine)
+            column = {f"{name} (KB)": sizes.get(name, 0) / 1024 for name in _MEASURED}
+            column["file (KB)"] = os.path.getsize(path) / 1024
+            column.update(_measure(engine, tasks, project_ids, lookups))
+            results[label] = column
+            engine.dispose()
+    
+    labels = list(results)
+    print(f"{'':<36}" + "".join(f"{label:>14}" for label in labels))
+    for metric in results[labels[0]]:
+        print(f"{metric:<36}" + "".join(f"{results[label][metric]:>14.1f}" for label in labels))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--lookups", type=int, default=10000)
+    args = parser.parse_args()
+    main(args.tasks, args.projects, args.lookups)
@@ -0,0 +1,89 @@
+"""Write-throughput benchmark for repository saves.
+
+Compares the upsert-based `SQLAlchemyTaskRepository.save` with the previous
+SELECT-then-write approach on a file-backed SQLite database, reporting
+saves per second and SQL statements per save.
+
+    python -m benchmarks.bench_repository_writes [--rows 2000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.task import Task
+from src.infrastructure.database.models import Base, TaskModel
+from src.infrastructure.database.repositories.task_repository import SQLAlchemyTaskRepository
+
+
+def _select_then_write(session, task: Task) -> None:
+    """The pre-upsert save: look the row up, then INSERT or UPDATE every column."""
+    model = session.query(TaskModel).filter_by(id=task.id).first()
+    if model is None:
+        model = TaskModel(id=task.id, created_at=task.created_at)
+        session.add(model)
+    model.title = task.title
+    model.description = task.description
+    model.deadline = task.deadline
+    model.completed = task.completed
+    model.project_id = task.project_id
+    model.updated_at = task.updated_at
+    session.commit()
+
+
+def _run(label, save, tasks, counter):
+    counter["statements"] = 0
+    start = time.perf_counter()
+    for task in tasks:
+        save(task)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {len(tasks) / elapsed:>10.0f} saves/s "
+        f"{counter['statements'] / len(tasks):>6.2f} statements/save"
+    )
+
+
+def main(rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        counter = {"statements": 0}
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _count(*args):
+            counter["statements"] += 1
+
+        session = sessionmaker(bind=engine)()
+        repo = SQLAlchemyTaskRepository(session)
+        deadline = datetime.now(timezone.utc) + timedelta(days=7)
+
+        def new_tasks():
+            return [Task(title=f"Task {i}", deadline=deadline) for i in range(rows)]
+
+        def touch(tasks):
+            for task in tasks:
+                task.title += " (edited)"
+                task.updated_at = datetime.now(timezone.utc)
+            return tasks
+
+        legacy = new_tasks()
+        _run("select-then-write insert", lambda t: _select_then_write(session, t), legacy, counter)
+        _run("select-then-write update", lambda t: _select_then_write(session, t), touch(legacy), counter)
+
+        current = new_tasks()
+        _run("upsert insert", repo.save, current, counter)
+        _run("upsert update", repo.save, touch(current), counter)
+        _run("upsert no-op", repo.save, current, counter)
+
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    main(parser.parse_args().rows)
@@ -0,0 +1,85 @@
+"""Serialization benchmark for list responses.
+
+Encodes 10k domain `Task` objects the way FastAPI does for a `List[TaskResponse]`
+response model (validate from attributes, dump, json.dumps) and with the fast
+path used by the list endpoints (pre-built row serializer + orjson / msgpack),
+reporting milliseconds per 10k tasks.
+
+    python -m benchmarks.bench_serialization [--tasks 10000] [--repeat 5]
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+
+from src.api.schemas.task_schemas import TaskResponse
+from src.api.serialization import FastJSONResponse, MsgpackResponse, RowSerializer, msgpack
+from src.domain.entities.task import Task
+
+
+def _tasks(count: int) -> List[Task]:
+    now = datetime.now(timezone.utc)
+    project_id = uuid4()
+    return [
+        Task(
+            title=f"Task {i}",
+            description="Benchmark task" if i % 2 else None,
+            deadline=now + timedelta(days=i % 30),
+            project_id=project_id
+        )
+        for i in range(count)
+    ]
+
+
+def _pydantic(tasks, adapter) -> bytes:
+    validated = adapter.validate_python(tasks, from_attributes=True)
+    content = adapter.dump_python(validated, mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _fast_json(tasks, rows) -> bytes:
+    return FastJSONResponse(rows.rows(tasks)).body
+
+
+def _fast_msgpack(tasks, rows) -> bytes:
+    return MsgpackResponse(rows.rows(tasks)).body
+
+
+def _best_ms(encode, repeat: int, scale: float) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 * scale
+
+
+def main(count: int, repeat: int) -> None:
+    tasks = _tasks(count)
+    adapter = TypeAdapter(List[TaskResponse])
+    rows = RowSerializer(TaskResponse)
+    scale = 10000 / count
+
+    modes = [
+        ("pydantic response_model", lambda: _pydantic(tasks, adapter)),
+        ("row serializer + orjson", lambda: _fast_json(tasks, rows)),
+    ]
+    if msgpack is not None:
+        modes.append(("row serializer + msgpack", lambda: _fast_msgpack(tasks, rows)))
+
+    print(f"{'mode':<26} {'ms / 10k tasks':>15} {'bytes':>10}")
+    for label, encode in modes:
+        size = len(encode())
+        print(f"{label:<26} {_best_ms(encode, repeat, scale):>15.1f} {size:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.tasks, args.repeat)
@@ -0,0 +1,149 @@
+"""Concurrent read/write throughput on a file-backed SQLite database.
+
+Runs reader threads (paged task listings) and writer threads (load a
+project, insert a task, commit) against three connection setups: the
+previous default (rollback journal, deferred transactions), the pragma
+profile alone (WAL, synchronous=NORMAL, ...), and the profile with the
+single-writer engine (one connection, BEGIN IMMEDIATE). Reports operations
+per second and "database is locked" failures.
+
+    python -m benchmarks.bench_sqlite_concurrency [--readers 4] [--writers 4] [--seconds 5]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.application.ports.repositories import TaskQuery
+from src.domain.entities.project import Project
+from src.domain.entities.task import Task
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.sqlite_profile import apply_sqlite_profile, sqlite_pragmas
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+MODES = ("default", "wal profile", "wal + single writer")
+
+
+def _engines(url: str, mode: str):
+    connect_args = {"check_same_thread": False}
+    reader = create_engine(url, connect_args=connect_args)
+    if mode == "default":
+        return reader, reader
+    
+    apply_sqlite_profile(reader, sqlite_pragmas(settings))
+    if mode == "wal profile":
+        return reader, reader
+    
+    writer = create_engine(url, connect_args=connect_args, pool_size=1, max_overflow=0, pool_timeout=60)
+    apply_sqlite_profile(writer, sqlite_pragmas(settings), begin_immediate=True)
+    return reader, writer
+
+
+def _seed(engine) -> Project:
+    Base.metadata.create_all(engine)
+    project = Project(title="Benchmark", deadline=datetime.now(timezone.utc) + timedelta(days=365))
+    with SQLAlchemyUnitOfWork(sessionmaker(bind=engine)(), close_on_exit=True) as uow:
+        uow.projects.save(project)
+        uow.tasks.save_many([
+            Task(title=f"Seed {i}", deadline=project.deadline - timedelta(days=1), project_id=project.id)
+            for i in range(500)
+        ])
+        uow.commit()
+    return project
+
+
+def _percentile(ordered, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _run(mode: str, readers: int, writers: int, seconds: float) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        reader_engine, writer_engine = _engines(url, mode)
+        project = _seed(writer_engine)
+        read_sessions = sessionmaker(bind=reader_engine, autoflush=False)
+        write_sessions = sessionmaker(bind=writer_engine, autoflush=False)
+        
+        counts = {"reads": 0, "writes": 0, "locked": 0}
+        write_latencies = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+        
+        def read():
+            with SQLAlchemyUnitOfWork(read_sessions(), close_on_exit=True) as uow:
+                uow.tasks.find(TaskQuery(project_id=project.id, limit=50))
+            return "reads"
+        
+        def write():
+            with SQLAlchemyUnitOfWork(write_sessions(), close_on_exit=True) as uow:
+                target = uow.projects.find_by_id(project.id)
+                uow.tasks.save(Task(title="Write", deadline=target.deadline, project_id=target.id))
+                uow.commit()
+            return "writes"
+        
+        def loop(operation):
+            done = {"reads": 0, "writes": 0, "locked": 0}
+            latencies = []
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                try:
+                    done[operation()] += 1
+                except OperationalError as e:
+                    if "locked" not in str(e):
+                        raise
+                    done["locked"] += 1
+                if operation is write:
+                    latencies.append(time.perf_counter() - start)
+            with lock:
+                for key, value in done.items():
+                    counts[key] += value
+                write_latencies.extend(latencies)
+        
+        threads = [threading.Thread(target=loop, args=(read,)) for _ in range(readers)]
+        threads += [threading.Thread(target=loop, args=(write,)) for _ in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        for engine in {reader_engine, writer_engine}:
+            engine.dispose()
+    
+    write_latencies.sort()
+    counts["p50_ms"] = _percentile(write_latencies, 0.50) * 1000
+    counts["p99_ms"] = _percentile(write_latencies, 0.99) * 1000
+    counts["max_ms"] = (write_latencies[-1] if write_latencies else 0.0) * 1000
+    return counts
+
+
+def main(readers: int, writers: int, seconds: float) -> None:
+    print(f"{readers} reader / {writers} writer threads, {seconds:g}s per mode")
+    print(
+        f"{'mode':<22} {'reads / s':>10} {'writes / s':>11} {'locked errors':>14} "
+        f"{'write p50 ms':>13} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for mode in MODES:
+        counts = _run(mode, readers, writers, seconds)
+        print(
+            f"{mode:<22} {counts['reads'] / seconds:>10.0f} "
+            f"{counts['writes'] / seconds:>11.0f} {counts['locked']:>14} "
+            f"{counts['p50_ms']:>13.1f} {counts['p99_ms']:>8.1f} {counts['max_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    main(args.readers, args.writers, args.seconds)
@@ -0,0 +1,62 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def make_etag(*parts) -> str:
+    """Strong entity tag for a representation identified by `parts` (ids, versions, variants)."""
+    key = "|".join(
+        _as_utc(part).isoformat() if isinstance(part, datetime) else str(part)
+        for part in parts
+    )
+    return '"' + hashlib.blake2b(key.encode(), digest_size=12).hexdigest() + '"'
+
+
+def is_conditional(request: Request) -> bool:
+    """Whether the request carries a validator worth checking before loading anything."""
+    headers = request.headers
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match, or failing that If-Modified-Since (RFC 9110, section 13.2.2).
+
+    Without a `last_modified` only If-None-Match can match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == etag for tag in candidates
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+    return False
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime]) -> None:
+    """Attach ETag and Last-Modified headers to a response."""
+    response.headers["ETag"] = etag
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    """An empty 304 response carrying the current validators."""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
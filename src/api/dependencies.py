@@ -1,41 +1,191 @@
+from datetime import timedelta
 from functools import lru_cache
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from typing import Callable
+from fastapi import Depends, Request
+from sqlalchemy.orm import Session, sessionmaker
 
-from ..infrastructure.database.session import SessionLocal
-from ..infrastructure.database.repositories.task_repository import SQLAlchemyTaskRepository
-from ..infrastructure.database.repositories.project_repository import SQLAlchemyProjectRepository
+from ..infrastructure.config.settings import settings
+from ..infrastructure.cache.entity_cache import EntityCache
+from ..infrastructure.database.session import ReadSessionLocal, SessionLocal, WriterSessionLocal
+from ..infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from ..infrastructure.database.async_unit_of_work import (
+    AsyncSQLAlchemyUnitOfWork,
+    ThreadedUnitOfWork
+)
 from ..infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+from ..infrastructure.event_bus.outbox_dispatcher import OutboxDispatcher
+from ..infrastructure.scheduling.deadline_scheduler import DeadlineScheduler
+from ..application.ports.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from ..application.services.async_project_service import AsyncProjectService
+from ..application.services.async_task_service import AsyncTaskService
 from ..application.services.task_service import TaskService
 from ..application.services.project_service import ProjectService
 
 
-def get_db():
-    """Dependency: Database session."""
-    db = SessionLocal()
+# Requests with these methods only read; every other method may write
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_mutation(request: Request) -> bool:
+    """Whether a request should run on the writer path."""
+    return request.method not in READ_ONLY_METHODS
+
+
+def get_db(request: Request):
+    """Dependency: Database session; mutations get one from the writer engine, reads a read-only one."""
+    db = WriterSessionLocal() if is_mutation(request) else ReadSessionLocal()
     try:
         yield db
     finally:
         db.close()
 
 
+def get_session_factory() -> sessionmaker:
+    """Dependency: Session factory for work that outlives the request scope.
+    
+    Streaming responses are sent after `get_db` has already closed its
+    session, so they open (and close) their own; exports only read, so
+    they use the read-only factory.
+    """
+    return ReadSessionLocal
+
+
 @lru_cache()
 def get_event_bus() -> InMemoryEventBus:
     """Dependency: Event bus singleton."""
-    return InMemoryEventBus()
+    return InMemoryEventBus(
+        workers=settings.EVENT_DISPATCH_WORKERS,
+        queue_size=settings.EVENT_QUEUE_SIZE
+    )
+
+
+@lru_cache()
+def get_entity_cache() -> EntityCache:
+    """Entity cache singleton, shared by every unit of work when CACHE_ENABLED."""
+    return EntityCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.CACHE_TTL_SECONDS
+    )
+
+
+def unit_of_work_options(read_only: bool = False) -> dict:
+    """Keyword arguments shared by every SQLAlchemyUnitOfWork the application opens.
+    
+    Only `read_only` units of work are answered from the entity cache;
+    writers load what they change from the database.
+    """
+    options = {}
+    if settings.OUTBOX_ENABLED:
+        options.update(use_outbox=True, on_outbox_commit=get_outbox_dispatcher().wake)
+    if settings.CACHE_ENABLED:
+        options.update(cache=get_entity_cache(), cache_reads=read_only)
+    return options
+
+
+@lru_cache()
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    """Outbox dispatcher singleton, started by the application lifespan."""
+    return OutboxDispatcher(
+        unit_of_work_factory=new_unit_of_work,
+        event_bus=get_event_bus(),
+        batch_size=settings.OUTBOX_BATCH_SIZE,
+        poll_interval=settings.OUTBOX_POLL_INTERVAL,
+        lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+        max_attempts=settings.OUTBOX_MAX_ATTEMPTS
+    )
+
+
+@lru_cache()
+def get_deadline_scheduler() -> DeadlineScheduler:
+    """Deadline scheduler singleton, started by the application lifespan."""
+    return DeadlineScheduler(
+        unit_of_work_factory=new_read_unit_of_work,
+        event_bus=get_event_bus(),
+        window=timedelta(hours=settings.DEADLINE_WARNING_HOURS),
+        refresh_interval=settings.DEADLINE_REFRESH_INTERVAL
+    )
+
+
+def new_unit_of_work() -> UnitOfWork:
+    """Open a unit of work on its own writer session, closed when the `with` block exits."""
+    return SQLAlchemyUnitOfWork(WriterSessionLocal(), close_on_exit=True, **unit_of_work_options())
+
+
+def new_read_unit_of_work() -> UnitOfWork:
+    """Open a unit of work for background work that only reads, off the writer connection."""
+    return SQLAlchemyUnitOfWork(SessionLocal(), close_on_exit=True, **unit_of_work_options(read_only=True))
+
+
+def new_event_loop_unit_of_work() -> UnitOfWork:
+    """Open a unit of work on the async engine for code already running in its greenlet.
+    
+    Inline event handlers run inside the publishing use case, which with
+    ASYNC_DATABASE executes through `AsyncSession.run_sync`; this lets their
+    queries be awaited on the event loop too.
+    """
+    from ..infrastructure.database.async_session import get_async_writer_sessionmaker
+    session = get_async_writer_sessionmaker()().sync_session
+    return SQLAlchemyUnitOfWork(session, close_on_exit=True, **unit_of_work_options())
+
+
+def get_handler_unit_of_work_factory() -> Callable[[], UnitOfWork]:
+    """Pick how event handlers open their units of work.
+    
+    Queued and outbox dispatch run handlers on plain background threads,
+    which need sync sessions.
+    """
+    inline = not settings.EVENT_DISPATCH_WORKERS and not settings.OUTBOX_ENABLED
+    if settings.ASYNC_DATABASE and inline:
+        return new_event_loop_unit_of_work
+    return new_unit_of_work
+
+
+def get_unit_of_work(request: Request, db: Session = Depends(get_db)) -> UnitOfWork:
+    """Dependency: Request-scoped unit of work over the request session."""
+    return SQLAlchemyUnitOfWork(db, **unit_of_work_options(read_only=not is_mutation(request)))
+
+
+def _threaded_unit_of_work(request: Request, db: Session = Depends(get_db)) -> AsyncUnitOfWork:
+    """Request-scoped unit of work that runs use cases in worker threads."""
+    return ThreadedUnitOfWork(db, **unit_of_work_options(read_only=not is_mutation(request)))
+
+
+async def _async_driver_unit_of_work(request: Request):
+    """Request-scoped unit of work that runs use cases on the event loop."""
+    from ..infrastructure.database.async_session import (
+        get_async_read_sessionmaker,
+        get_async_writer_sessionmaker
+    )
+    factory = get_async_writer_sessionmaker() if is_mutation(request) else get_async_read_sessionmaker()
+    async with factory() as session:
+        yield AsyncSQLAlchemyUnitOfWork(session, **unit_of_work_options(read_only=not is_mutation(request)))
+
+
+# Dependency: Request-scoped async unit of work, chosen by Settings.ASYNC_DATABASE
+get_async_unit_of_work = (
+    _async_driver_unit_of_work if settings.ASYNC_DATABASE else _threaded_unit_of_work
+)
+
+
+def build_task_service(db: Session) -> TaskService:
+    """Wire a task service onto an existing session."""
+    return TaskService(SQLAlchemyUnitOfWork(db), get_event_bus())
+
+
+def build_project_service(db: Session) -> ProjectService:
+    """Wire a project service onto an existing session."""
+    return ProjectService(SQLAlchemyUnitOfWork(db), get_event_bus())
 
 
-def get_task_service(db: Session = Depends(get_db)) -> TaskService:
+async def get_task_service(
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncTaskService:
     """Dependency: Task service with all dependencies injected."""
-    task_repo = SQLAlchemyTaskRepository(db)
-    project_repo = SQLAlchemyProjectRepository(db)
-    event_bus = get_event_bus()
-    return TaskService(task_repo, project_repo, event_bus)
+    return AsyncTaskService(uow, get_event_bus())
 
 
-def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
+async def get_project_service(
+    uow: AsyncUnitOfWork = Depends(get_async_unit_of_work)
+) -> AsyncProjectService:
     """Dependency: Project service with all dependencies injected."""
-    project_repo = SQLAlchemyProjectRepository(db)
-    task_repo = SQLAlchemyTaskRepository(db)
-    event_bus = get_event_bus()
-    return ProjectService(project_repo, task_repo, event_bus)
\ No newline at end of file
+    return AsyncProjectService(uow, get_event_bus())
\ No newline at end of file
@@ -1,16 +1,23 @@
 import logging
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+import anyio.to_thread
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from .routers import tasks, projects
-from ..infrastructure.database.models import Base
-from ..infrastructure.database.session import engine, SessionLocal
-from ..infrastructure.database.repositories.task_repository import SQLAlchemyTaskRepository
-from ..infrastructure.database.repositories.project_repository import SQLAlchemyProjectRepository
+from ..infrastructure.database.pooling import ping, ping_async, pool_metrics
+from ..infrastructure.database.session import engine, init_db
 from ..application.event_handlers.setup import setup_event_handlers
-from .dependencies import get_event_bus
+from .dependencies import (
+    get_deadline_scheduler,
+    get_entity_cache,
+    get_event_bus,
+    get_handler_unit_of_work_factory,
+    get_outbox_dispatcher
+)
 from ..infrastructure.config.settings import settings
+from ..domain.entities.base import DomainEvent
 
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
@@ -25,29 +32,48 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting Task Management System...")
     
     logger.info("📊 Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    init_db()
     
     logger.info("🔧 Registering event handlers...")
-    db = SessionLocal()
-    try:
-        task_repo = SQLAlchemyTaskRepository(db)
-        project_repo = SQLAlchemyProjectRepository(db)
-        event_bus = get_event_bus()
-        
-        setup_event_handlers(
-            event_bus=event_bus,
-            task_repo=task_repo,
-            project_repo=project_repo,
-            auto_complete_project=settings.AUTO_COMPLETE_PROJECT
-        )
-    finally:
-        db.close()
+    setup_event_handlers(
+        event_bus=get_event_bus(),
+        unit_of_work_factory=get_handler_unit_of_work_factory()
+    )
+    
+    if settings.CACHE_ENABLED:
+        get_event_bus().subscribe(DomainEvent, get_entity_cache().invalidate_events, batch=True)
+    
+    if settings.OUTBOX_ENABLED:
+        logger.info("📮 Starting outbox dispatcher...")
+        get_outbox_dispatcher().start()
+    
+    if settings.DEADLINE_SCHEDULER_ENABLED:
+        logger.info("⏰ Starting deadline scheduler...")
+        get_deadline_scheduler().subscribe(get_event_bus())
+        get_deadline_scheduler().start()
     
     logger.info("✅ Application started successfully!")
     
     yield
     
     logger.info("👋 Shutting down Task Management System...")
+    if settings.DEADLINE_SCHEDULER_ENABLED:
+        await anyio.to_thread.run_sync(get_deadline_scheduler().stop)
+    if settings.OUTBOX_ENABLED:
+        await anyio.to_thread.run_sync(get_outbox_dispatcher().stop)
+    await anyio.to_thread.run_sync(
+        get_event_bus().shutdown, settings.EVENT_DRAIN_TIMEOUT
+    )
+    if settings.ASYNC_DATABASE:
+        from ..infrastructure.database.async_session import (
+            get_async_engine,
+            get_async_read_engines,
+            get_async_writer_engine
+        )
+        for replica in get_async_read_engines():
+            await replica.dispose()
+        await get_async_writer_engine().dispose()
+        await get_async_engine().dispose()
 
 
 app = FastAPI(
@@ -82,15 +108,65 @@ async def root():
     }
 
 
+@app.get("/health/events", tags=["health"])
+async def event_bus_health():
+    """Event dispatch metrics: queue depth, handler lag and failure counts."""
+    metrics = get_event_bus().metrics()
+    if settings.OUTBOX_ENABLED:
+        metrics["outbox"] = await anyio.to_thread.run_sync(get_outbox_dispatcher().metrics)
+    if settings.DEADLINE_SCHEDULER_ENABLED:
+        metrics["deadline_scheduler"] = get_deadline_scheduler().metrics()
+    return metrics
+
+
+@app.get("/health/cache", tags=["health"])
+async def cache_health():
+    """Entity cache statistics: size, hits, misses, evictions and invalidations."""
+    if not settings.CACHE_ENABLED:
+        return {"enabled": False}
+    return {"enabled": True, **get_entity_cache().stats()}
+
+
+async def _ping_database() -> dict:
+    """Timed `SELECT 1` on the engine that serves requests."""
+    if settings.ASYNC_DATABASE:
+        from ..infrastructure.database.async_session import get_async_engine
+        return await ping_async(get_async_engine())
+    return await anyio.to_thread.run_sync(ping, engine)
+
+
+@app.get("/health/db", tags=["health"])
+async def database_health():
+    """Database round trip and live connection pool numbers, for sizing worker pools."""
+    result = await _ping_database()
+    body = {
+        "status": "healthy" if result["ok"] else "unavailable",
+        "ping": result,
+        "pool_settings": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING
+        },
+        "pools": pool_metrics()
+    }
+    if not result["ok"]:
+        return JSONResponse(body, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return body
+
+
 @app.get("/health", tags=["health"])
 async def health_check():
     """Detailed health check."""
+    database = await _ping_database()
     return {
-        "status": "healthy",
-        "database": "connected",
+        "status": "healthy" if database["ok"] else "degraded",
+        "database": "connected" if database["ok"] else "unavailable",
         "event_bus": "active",
         "config": {
             "auto_complete_project": settings.AUTO_COMPLETE_PROJECT,
+            "async_database": settings.ASYNC_DATABASE,
             "log_level": settings.LOG_LEVEL
         }
     }
\ No newline at end of file
@@ -1,20 +1,52 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import sessionmaker
+from typing import Callable, Dict, List, Optional
 from uuid import UUID
 
-from ..schemas.project_schemas import ProjectCreate, ProjectResponse, ProjectUpdate
+from ..schemas.project_schemas import (
+    ProjectCreate,
+    ProjectDetailResponse,
+    ProjectProgressResponse,
+    ProjectResponse,
+    ProjectUpdate
+)
 from ..schemas.task_schemas import TaskResponse
-from ..dependencies import get_project_service, get_task_service
-from ...application.services.project_service import ProjectService
-from ...application.services.task_service import TaskService
+from ..conditional import is_conditional, is_not_modified, make_etag, not_modified, set_validators
+from ..serialization import RowSerializer, list_response, negotiate
+from ..dependencies import (
+    build_project_service,
+    get_project_service,
+    get_session_factory,
+    get_task_service
+)
+from ..streaming import EXPORT_MEDIA_TYPES, closing_stream, encode_rows
+from ...application.services.async_project_service import AsyncProjectService
+from ...application.services.async_task_service import AsyncTaskService
+from ...domain.entities.project import Project
 from ...domain.exceptions.domain_exceptions import (
     ProjectNotFoundError,
     TaskNotFoundError,
-    InvalidDeadlineError
+    InvalidDeadlineError,
+    InvalidCursorError
 )
+from ...infrastructure.config.settings import settings
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+INCLUDE_PATTERN = r"^progress$"
+
+PROJECT_ROWS = RowSerializer(ProjectDetailResponse, exclude=("progress",))
+PROGRESS_ROWS = RowSerializer(ProjectProgressResponse)
+TASK_ROWS = RowSerializer(TaskResponse)
+
+
+def _progress_extender(overdue: Dict[UUID, int]) -> Callable[[Project, dict], None]:
+    """Embed each project's counters into its list row, with overdue counts read for the page."""
+    def add_progress(project: Project, row: dict) -> None:
+        row["progress"] = PROGRESS_ROWS.row(project.get_progress(overdue.get(project.id, 0)))
+    return add_progress
+
 
 @router.post(
     "/",
@@ -22,53 +54,175 @@ router = APIRouter(prefix="/projects", tags=["projects"])
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project"
 )
-def create_project(
+async def create_project(
     project_data: ProjectCreate,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_project_service)
 ):
     """Create a new project."""
-    project = service.create_project(
+    project = await service.create_project(
         title=project_data.title,
         deadline=project_data.deadline
     )
     return project
 
 
-@router.get("/", response_model=List[ProjectResponse], summary="List all projects")
-def list_projects(
-    service: ProjectService = Depends(get_project_service)
+@router.get(
+    "/",
+    response_model=List[ProjectDetailResponse],
+    response_model_exclude_none=True,
+    summary="List all projects"
+)
+async def list_projects(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    sort: str = Query("-created_at", pattern=r"^-?(created_at|updated_at|deadline)$"),
+    include: Optional[str] = Query(None, pattern=INCLUDE_PATTERN),
+    service: AsyncProjectService = Depends(get_project_service)
+):
+    """Retrieve a list of all projects.
+    
+    Passing `limit` or `cursor` switches to keyset pagination; the cursor for the
+    following page is returned in the `X-Next-Cursor` header. `include=progress`
+    adds each project's task counters, read from the project row itself, plus
+    its overdue tasks, counted for the whole page in one query.
+    Send `Accept: application/msgpack` for a MessagePack body.
+    """
+    headers = None
+    if limit is not None or cursor is not None:
+        try:
+            page = await service.get_projects_page(
+                limit=limit or settings.DEFAULT_PAGE_SIZE,
+                cursor=cursor,
+                sort=sort
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if page.next_cursor:
+            headers = {"X-Next-Cursor": page.next_cursor}
+        projects = page.items
+    else:
+        projects = await service.get_all_projects()
+    
+    extend = None
+    if include == "progress":
+        extend = _progress_extender(await service.count_overdue_tasks([p.id for p in projects]))
+    return list_response(request, projects, PROJECT_ROWS, headers, extend)
+
+
+@router.get("/export", summary="Export projects as NDJSON or CSV")
+def export_projects(
+    format: str = Query("ndjson", pattern=r"^(ndjson|csv)$"),
+    session_factory: sessionmaker = Depends(get_session_factory)
+):
+    """Stream every project with flat memory use."""
+    db = session_factory()
+    projects = build_project_service(db).stream_projects(
+        batch_size=settings.EXPORT_BATCH_SIZE
+    )
+    
+    return StreamingResponse(
+        closing_stream(encode_rows(projects, PROJECT_ROWS, format), db.close),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="projects.{format}"'}
+    )
+
+
+@router.get(
+    "/{project_id}",
+    response_model=ProjectDetailResponse,
+    response_model_exclude_none=True,
+    summary="Get a project"
+)
+async def get_project(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    include: Optional[str] = Query(None, pattern=INCLUDE_PATTERN),
+    service: AsyncProjectService = Depends(get_project_service)
 ):
-    """Retrieve a list of all projects."""
-    return service.get_all_projects()
+    """Retrieve a single project by its ID.
+    
+    The response carries ETag and Last-Modified; a conditional request that
+    still matches is answered with 304 after reading only `updated_at`.
+    With `include=progress` the counters are part of the representation but
+    change without touching `updated_at` (overdue tasks merely age), so that
+    variant is loaded in full, tagged by its counters and has no Last-Modified.
+    """
+    try:
+        if include == "progress":
+            project = await service.get_project(project_id)
+            overdue = await service.count_overdue_tasks([project_id])
+        else:
+            if is_conditional(request):
+                updated_at = await service.get_project_last_modified(project_id)
+                etag = make_etag(project_id, updated_at)
+                if is_not_modified(request, etag, updated_at):
+                    return not_modified(etag, updated_at)
+            project = await service.get_project(project_id)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    result = ProjectDetailResponse.model_validate(project)
+    if include != "progress":
+        set_validators(response, make_etag(project.id, project.updated_at), project.updated_at)
+        return result
+    
+    progress = project.get_progress(overdue.get(project_id, 0))
+    etag = make_etag(
+        project.id,
+        project.updated_at,
+        include,
+        progress.task_count,
+        progress.completed_count,
+        progress.overdue_count
+    )
+    if is_not_modified(request, etag, None):
+        return not_modified(etag, None)
+    set_validators(response, etag, None)
+    result.progress = ProjectProgressResponse.model_validate(progress)
+    return result
 
 
-@router.get("/{project_id}", response_model=ProjectResponse, summary="Get a project")
-def get_project(
+@router.get(
+    "/{project_id}/progress",
+    response_model=ProjectProgressResponse,
+    summary="Get project progress"
+)
+async def get_project_progress(
     project_id: UUID,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_project_service)
 ):
-    """Retrieve a single project by its ID."""
+    """Retrieve a project's done/total counters without loading its tasks."""
     try:
-        return service.get_project(project_id)
+        return await service.get_progress(project_id)
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
 @router.put("/{project_id}", response_model=ProjectResponse, summary="Update a project")
-def update_project(
+async def update_project(
     project_id: UUID,
     project_data: ProjectUpdate,
-    service: ProjectService = Depends(get_project_service)
+    response: Response,
+    service: AsyncProjectService = Depends(get_project_service)
 ):
-    """Update an existing project."""
+    """Update an existing project.
+    
+    Pulling the deadline in moves every later task deadline back to it; the
+    number of tasks moved is returned in the `X-Adjusted-Tasks` header.
+    """
     try:
-        return service.update_project(
+        result = await service.update_project(
             project_id=project_id,
             title=project_data.title,
             deadline=project_data.deadline
         )
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    response.headers["X-Adjusted-Tasks"] = str(result.adjusted_tasks)
+    return result.project
 
 
 @router.delete(
@@ -76,13 +230,13 @@ def update_project(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a project"
 )
-def delete_project(
+async def delete_project(
     project_id: UUID,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_project_service)
 ):
     """Delete a project."""
     try:
-        service.delete_project(project_id)
+        await service.delete_project(project_id)
         return None
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -93,14 +247,14 @@ def delete_project(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Link task to project"
 )
-def link_task_to_project(
+async def link_task_to_project(
     project_id: UUID,
     task_id: UUID,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_project_service)
 ):
     """Link a task to a project."""
     try:
-        service.link_task(project_id, task_id)
+        await service.link_task(project_id, task_id)
         return None
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -115,14 +269,14 @@ def link_task_to_project(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Unlink task from project"
 )
-def unlink_task_from_project(
+async def unlink_task_from_project(
     project_id: UUID,
     task_id: UUID,
-    service: ProjectService = Depends(get_project_service)
+    service: AsyncProjectService = Depends(get_project_service)
 ):
     """Unlink a task from a project."""
     try:
-        service.unlink_task(project_id, task_id)
+        await service.unlink_task(project_id, task_id)
         return None
     except ProjectNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -135,12 +289,28 @@ def unlink_task_from_project(
     response_model=List[TaskResponse],
     summary="Get project tasks"
 )
-def get_project_tasks(
+async def get_project_tasks(
     project_id: UUID,
-    task_service: TaskService = Depends(get_task_service)
+    request: Request,
+    task_service: AsyncTaskService = Depends(get_task_service)
 ):
-    """Retrieve all tasks for a specific project."""
+    """Retrieve all tasks for a specific project.
+    
+    The list's ETag and Last-Modified come from one aggregate query (task
+    count and latest change), so a matching conditional request is answered
+    with 304 without loading the tasks. Send `Accept: application/msgpack`
+    for a MessagePack body.
+    """
     try:
-        return task_service.get_tasks_by_project(project_id)
+        count, last_modified = await task_service.get_project_tasks_version(project_id)
+        etag = make_etag(project_id, "tasks", count, last_modified, negotiate(request))
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+        
+        tasks = await task_service.get_tasks_by_project(project_id)
     except ProjectNotFoundError as e:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    response = list_response(request, tasks, TASK_ROWS)
+    set_validators(response, etag, last_modified)
+    return response
\ No newline at end of file
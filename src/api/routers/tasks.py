@@ -1,18 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import sessionmaker
 from typing import List, Optional
 from uuid import UUID
 
-from ..schemas.task_schemas import TaskCreate, TaskResponse, TaskUpdate
-from ..dependencies import get_task_service
-from ...application.services.task_service import TaskService
+from ..schemas.task_schemas import (
+    TaskBulkCreate,
+    TaskBulkCreateResponse,
+    TaskCreate,
+    TaskIdList,
+    TaskResponse,
+    TaskUpdate
+)
+from ..conditional import is_conditional, is_not_modified, make_etag, not_modified, set_validators
+from ..serialization import RowSerializer, list_response
+from ..dependencies import build_task_service, get_session_factory, get_task_service
+from ..streaming import EXPORT_MEDIA_TYPES, closing_stream, encode_rows
+from ...application.ports.repositories import TaskQuery
+from ...application.services.async_task_service import AsyncTaskService
 from ...domain.exceptions.domain_exceptions import (
     TaskNotFoundError,
     InvalidDeadlineError,
+    InvalidCursorError,
     ProjectNotFoundError
 )
+from ...infrastructure.config.settings import settings
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+TASK_ROWS = RowSerializer(TaskResponse)
+
 
 @router.post(
     "/",
@@ -20,13 +38,13 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
     status_code=status.HTTP_201_CREATED,
     summary="Create a new task"
 )
-def create_task(
+async def create_task(
     task_data: TaskCreate,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_task_service)
 ):
     """Create a new task."""
     try:
-        task = service.create_task(
+        task = await service.create_task(
             title=task_data.title,
             description=task_data.description,
             deadline=task_data.deadline,
@@ -39,54 +57,160 @@ def create_task(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
 
-@router.get("/", response_model=List[TaskResponse], summary="List all tasks")
-def list_tasks(
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateResponse,
+    summary="Create many tasks"
+)
+async def create_tasks_bulk(
+    payload: TaskBulkCreate,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """Create many tasks in one transaction, reporting rejected items by index."""
+    return await service.create_tasks([item.model_dump() for item in payload.tasks])
+
+
+@router.post(
+    "/bulk-complete",
+    response_model=List[TaskResponse],
+    summary="Mark many tasks as completed"
+)
+async def complete_tasks_bulk(
+    payload: TaskIdList,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """Complete many tasks with one update; returns the tasks that changed."""
+    return await service.complete_tasks(payload.task_ids, auto_complete_project=settings.AUTO_COMPLETE_PROJECT)
+
+
+@router.post(
+    "/bulk-reopen",
+    response_model=List[TaskResponse],
+    summary="Reopen many tasks"
+)
+async def reopen_tasks_bulk(
+    payload: TaskIdList,
+    service: AsyncTaskService = Depends(get_task_service)
+):
+    """Reopen many tasks with one update; returns the tasks that changed."""
+    return await service.reopen_tasks(payload.task_ids)
+
+
+async def get_task_query(
     completed: Optional[bool] = Query(None),
     overdue: Optional[bool] = Query(None),
     project_id: Optional[UUID] = Query(None),
-    service: TaskService = Depends(get_task_service)
+    deadline_from: Optional[datetime] = Query(None),
+    deadline_to: Optional[datetime] = Query(None),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    updated_from: Optional[datetime] = Query(None),
+    updated_to: Optional[datetime] = Query(None),
+    sort: str = Query("created_at", pattern=r"^-?(created_at|updated_at|deadline)$")
+) -> TaskQuery:
+    """Dependency: Build a task query spec from the list filters."""
+    return TaskQuery(
+        completed=completed,
+        overdue=overdue,
+        project_id=project_id,
+        deadline_from=deadline_from,
+        deadline_to=deadline_to,
+        created_from=created_from,
+        created_to=created_to,
+        updated_from=updated_from,
+        updated_to=updated_to,
+        sort=sort
+    )
+
+
+@router.get("/", response_model=List[TaskResponse], summary="List all tasks")
+async def list_tasks(
+    request: Request,
+    query: TaskQuery = Depends(get_task_query),
+    limit: Optional[int] = Query(None, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    service: AsyncTaskService = Depends(get_task_service)
 ):
-    """Retrieve a list of tasks with optional filters."""
-    if completed is not None:
-        if completed:
-            return service.get_completed_tasks()
-        else:
-            all_tasks = service.get_all_tasks()
-            return [t for t in all_tasks if not t.completed]
+    """Retrieve a page of tasks; all filters can be combined.
     
-    if overdue:
-        return service.get_overdue_tasks()
+    Results are keyset-paginated, `DEFAULT_PAGE_SIZE` at a time unless `limit`
+    is given. The `X-Next-Cursor` header carries the cursor for the following
+    page, and is empty on the last one. Send `Accept: application/msgpack`
+    for a MessagePack body.
+    """
+    query.limit = limit or settings.DEFAULT_PAGE_SIZE
+    query.after = cursor
     
-    if project_id:
-        try:
-            return service.get_tasks_by_project(project_id)
-        except ProjectNotFoundError as e:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    try:
+        page = await service.find_tasks(query)
+    except ProjectNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
-    return service.get_all_tasks()
+    headers = {"X-Next-Cursor": page.next_cursor or ""}
+    return list_response(request, page.items, TASK_ROWS, headers)
+
+
+@router.get("/export", summary="Export tasks as NDJSON or CSV")
+def export_tasks(
+    format: str = Query("ndjson", pattern=r"^(ndjson|csv)$"),
+    query: TaskQuery = Depends(get_task_query),
+    session_factory: sessionmaker = Depends(get_session_factory)
+):
+    """Stream every task matching the list filters with flat memory use."""
+    db = session_factory()
+    try:
+        tasks = build_task_service(db).stream_tasks(
+            query, batch_size=settings.EXPORT_BATCH_SIZE
+        )
+    except ProjectNotFoundError as e:
+        db.close()
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    return StreamingResponse(
+        closing_stream(encode_rows(tasks, TASK_ROWS, format), db.close),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{format}"'}
+    )
 
 
 @router.get("/{task_id}", response_model=TaskResponse, summary="Get a task")
-def get_task(
+async def get_task(
     task_id: UUID,
-    service: TaskService = Depends(get_task_service)
+    request: Request,
+    response: Response,
+    service: AsyncTaskService = Depends(get_task_service)
 ):
-    """Retrieve a single task by its ID."""
+    """Retrieve a single task by its ID.
+    
+    The response carries ETag and Last-Modified; a conditional request that
+    still matches is answered with 304 after reading only `updated_at`.
+    """
     try:
-        return service.get_task(task_id)
+        if is_conditional(request):
+            updated_at = await service.get_task_last_modified(task_id)
+            etag = make_etag(task_id, updated_at)
+            if is_not_modified(request, etag, updated_at):
+                return not_modified(etag, updated_at)
+        
+        task = await service.get_task(task_id)
     except TaskNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    
+    set_validators(response, make_etag(task.id, task.updated_at), task.updated_at)
+    return task
 
 
 @router.put("/{task_id}", response_model=TaskResponse, summary="Update a task")
-def update_task(
+async def update_task(
     task_id: UUID,
     task_data: TaskUpdate,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_task_service)
 ):
     """Update an existing task."""
     try:
-        return service.update_task(
+        return await service.update_task(
             task_id=task_id,
             title=task_data.title,
             description=task_data.description,
@@ -103,13 +227,13 @@ def update_task(
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a task"
 )
-def delete_task(
+async def delete_task(
     task_id: UUID,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_task_service)
 ):
     """Delete a task."""
     try:
-        service.delete_task(task_id)
+        await service.delete_task(task_id)
         return None
     except TaskNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -120,13 +244,13 @@ def delete_task(
     response_model=TaskResponse,
     summary="Mark task as completed"
 )
-def complete_task(
+async def complete_task(
     task_id: UUID,
-    service: TaskService = Depends(get_task_service)
+    service: AsyncTaskService = Depends(get_task_service)
 ):
     """Mark a task as completed."""
     try:
-        return service.complete_task(task_id, auto_complete_project=True)
+        return await service.complete_task(task_id, auto_complete_project=settings.AUTO_COMPLETE_PROJECT)
     except TaskNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -21,6 +21,18 @@ class ProjectUpdate(BaseModel):
     deadline: Optional[datetime] = None
 
 
+class ProjectProgressResponse(BaseModel):
+    """Schema for a project's task counters."""
+    project_id: UUID
+    task_count: int
+    completed_count: int
+    overdue_count: int
+    percent_complete: float
+    
+    class Config:
+        from_attributes = True
+
+
 class ProjectResponse(ProjectBase):
     """Schema for project responses."""
     id: UUID
@@ -31,3 +43,8 @@ class ProjectResponse(ProjectBase):
     class Config:
         from_attributes = True
 
+
+class ProjectDetailResponse(ProjectResponse):
+    """Schema for project responses that may embed the project's progress."""
+    progress: Optional[ProjectProgressResponse] = None
+
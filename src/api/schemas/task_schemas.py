@@ -1,8 +1,10 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
+from ...infrastructure.config.settings import settings
+
 
 class TaskBase(BaseModel):
     """Base schema for task data."""
@@ -33,3 +35,31 @@ class TaskResponse(TaskBase):
     
     class Config:
         from_attributes = True
+
+
+class TaskBulkCreate(BaseModel):
+    """Schema for creating many tasks in one request."""
+    tasks: List[TaskCreate] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+
+class BulkItemErrorResponse(BaseModel):
+    """Schema for a rejected item in a bulk request."""
+    index: int
+    detail: str
+    
+    class Config:
+        from_attributes = True
+
+
+class TaskBulkCreateResponse(BaseModel):
+    """Schema for bulk task creation results."""
+    created: List[TaskResponse]
+    errors: List[BulkItemErrorResponse]
+    
+    class Config:
+        from_attributes = True
+
+
+class TaskIdList(BaseModel):
+    """Schema for bulk operations on existing tasks."""
+    task_ids: List[UUID] = Field(..., min_length=1, max_length=settings.BULK_MAX_ITEMS)
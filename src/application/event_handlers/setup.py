@@ -1,41 +1,40 @@
 import logging
+from typing import Callable
+
 from ..ports.event_bus import EventBus
-from ..ports.repositories import TaskRepository, ProjectRepository
-from ...domain.events.task_events import TaskCompletedEvent, TaskReopenedEvent
-from ...domain.events.project_events import ProjectDeadlineChangedEvent
+from ..ports.unit_of_work import UnitOfWork
+from ...domain.events.task_events import (
+    TaskCompletedEvent,
+    TaskDeadlineApproachingEvent,
+    TaskReopenedEvent
+)
 from .task_event_handlers import (
     TaskCompletedHandler,
     TaskReopenedHandler,
     DeadlineApproachingHandler
 )
-from .project_event_handlers import ProjectDeadlineChangedHandler
 
 logger = logging.getLogger(__name__)
 
 
 def setup_event_handlers(
     event_bus: EventBus,
-    task_repo: TaskRepository,
-    project_repo: ProjectRepository,
-    auto_complete_project: bool = False
+    unit_of_work_factory: Callable[[], UnitOfWork]
 ) -> None:
-    """Register all event handlers with the event bus."""
+    """Register all event handlers with the event bus.
+    
+    Handlers open a fresh unit of work per event, so their writes commit
+    independently of the request that published the event.
+    """
     logger.info("🔧 Setting up event handlers...")
     
-    task_completed_handler = TaskCompletedHandler(
-        task_repo=task_repo,
-        project_repo=project_repo,
-        auto_complete_project=auto_complete_project
-    )
-    event_bus.subscribe(TaskCompletedEvent, task_completed_handler.handle)
+    task_completed_handler = TaskCompletedHandler()
+    event_bus.subscribe(TaskCompletedEvent, task_completed_handler.handle_batch, batch=True)
     
-    task_reopened_handler = TaskReopenedHandler(project_repo=project_repo)
+    task_reopened_handler = TaskReopenedHandler(unit_of_work_factory=unit_of_work_factory)
     event_bus.subscribe(TaskReopenedEvent, task_reopened_handler.handle)
     
-    deadline_changed_handler = ProjectDeadlineChangedHandler(
-        task_repo=task_repo,
-        project_repo=project_repo
-    )
-    event_bus.subscribe(ProjectDeadlineChangedEvent, deadline_changed_handler.handle)
+    deadline_approaching_handler = DeadlineApproachingHandler(unit_of_work_factory=unit_of_work_factory)
+    event_bus.subscribe(TaskDeadlineApproachingEvent, deadline_approaching_handler.handle)
     
     logger.info("✅ Event handlers registered successfully")
\ No newline at end of file
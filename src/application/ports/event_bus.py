@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Callable, Type
+from typing import Callable, Iterable, List, Type
 
 from ...domain.entities.base import DomainEvent
 
@@ -12,7 +12,29 @@ class EventBus(ABC):
         """Publish a domain event."""
         pass
     
+    def publish_many(self, events: Iterable[DomainEvent]) -> None:
+        """Publish several domain events in order."""
+        for event in events:
+            self.publish(event)
+    
+    def deliver_many(self, events: Iterable[DomainEvent]) -> List[DomainEvent]:
+        """Publish several events and return once their handlers have run.
+        
+        Returns the events a handler failed on, so a caller that must not
+        lose events (the outbox) only acknowledges fully handled ones.
+        """
+        self.publish_many(events)
+        return []
+    
+    @abstractmethod
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable, batch: bool = False) -> None:
+        """Subscribe a handler to an event type and its subclasses.
+        
+        A `batch` handler receives a list of events of one type per call.
+        """
+        pass
+    
     @abstractmethod
-    def subscribe(self, event_type: Type[DomainEvent], handler: Callable) -> None:
-        """Subscribe a handler to an event type."""
+    def has_subscribers(self, event_type: Type[DomainEvent]) -> bool:
+        """Whether publishing this event type would reach any handler."""
         pass
@@ -1,11 +1,53 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
+from ...domain.entities.base import DomainEvent
 from ...domain.entities.task import Task
 from ...domain.entities.project import Project
 
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """One slice of a keyset-paginated listing."""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class TaskQuery:
+    """Composable filter, sort and paging spec for task listings.
+    
+    Every field left as None is ignored; the rest are combined with AND.
+    Ranges are inclusive on both ends. `limit=None` returns all matches.
+    """
+    completed: Optional[bool] = None
+    overdue: Optional[bool] = None
+    project_id: Optional[UUID] = None
+    deadline_from: Optional[datetime] = None
+    deadline_to: Optional[datetime] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+    sort: str = "created_at"
+    limit: Optional[int] = None
+    after: Optional[str] = None
+
+
+@dataclass
+class ProjectCounterDelta:
+    """Signed change to one project's task counters."""
+    tasks: int = 0
+    completed: int = 0
+    
+    def __bool__(self) -> bool:
+        return bool(self.tasks or self.completed)
+
 
 class TaskRepository(ABC):
     """Port (interface) for Task persistence."""
@@ -15,16 +57,65 @@ class TaskRepository(ABC):
         """Save or update a task."""
         pass
     
+    @abstractmethod
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """Insert many new tasks in one round of multi-row INSERTs."""
+        pass
+    
+    @abstractmethod
+    def set_completed(self, task_ids: List[UUID], completed: bool) -> List[Task]:
+        """Set the completion flag on many tasks; return only the tasks that changed."""
+        pass
+    
+    @abstractmethod
+    def has_open_tasks(self, project_id: UUID) -> bool:
+        """Whether the project has at least one task that is not completed."""
+        pass
+    
+    @abstractmethod
+    def unlink_project(self, project_id: UUID, return_ids: bool = False) -> List[UUID]:
+        """Detach every task from a project; return the detached IDs only if asked."""
+        pass
+    
+    @abstractmethod
+    def clamp_deadlines(
+        self,
+        project_id: UUID,
+        max_deadline: datetime
+    ) -> List[Tuple[UUID, datetime]]:
+        """Move project tasks due after `max_deadline` back to it; return (task_id, old_deadline) pairs."""
+        pass
+    
     @abstractmethod
     def find_by_id(self, task_id: UUID) -> Optional[Task]:
         """Find a task by ID."""
         pass
     
+    @abstractmethod
+    def find_updated_at(self, task_id: UUID) -> Optional[datetime]:
+        """Read only a task's `updated_at`, or None if it does not exist."""
+        pass
+    
+    @abstractmethod
+    def project_tasks_version(self, project_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Count a project's tasks and find their latest `updated_at`, in one aggregate query."""
+        pass
+    
     @abstractmethod
     def find_all(self) -> List[Task]:
         """Retrieve all tasks."""
         pass
     
+    @abstractmethod
+    def find(self, query: TaskQuery) -> Page[Task]:
+        """Find tasks matching a query spec, ordered by (sort key, id), after an opaque cursor."""
+        pass
+    
+    @abstractmethod
+    def stream(self, query: TaskQuery, batch_size: int = 1000) -> Iterator[Task]:
+        """Lazily iterate over all tasks matching a query spec (paging fields are ignored)."""
+        pass
+    
     @abstractmethod
     def find_by_project_id(self, project_id: UUID) -> List[Task]:
         """Find all tasks belonging to a project."""
@@ -40,6 +131,16 @@ class TaskRepository(ABC):
         """Find all overdue tasks."""
         pass
     
+    @abstractmethod
+    def count_overdue_by_project(self, project_ids: List[UUID]) -> Dict[UUID, int]:
+        """Count open tasks past their deadline per project; projects without any are left out."""
+        pass
+    
+    @abstractmethod
+    def find_due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Find open tasks due in (start, end], soonest first."""
+        pass
+    
     @abstractmethod
     def delete(self, task_id: UUID) -> bool:
         """Delete a task by ID."""
@@ -59,13 +160,102 @@ class ProjectRepository(ABC):
         """Find a project by ID."""
         pass
     
+    @abstractmethod
+    def find_updated_at(self, project_id: UUID) -> Optional[datetime]:
+        """Read only a project's `updated_at`, or None if it does not exist."""
+        pass
+    
+    @abstractmethod
+    def find_by_ids(self, project_ids: List[UUID]) -> List[Project]:
+        """Find all projects whose ID is in the given list."""
+        pass
+    
     @abstractmethod
     def find_all(self) -> List[Project]:
         """Retrieve all projects."""
         pass
     
+    @abstractmethod
+    def complete_if_no_open_tasks(self, project_id: UUID) -> Optional[datetime]:
+        """Atomically complete a project that has tasks, none of them open.
+        
+        Returns the completion time if this call completed the project, or None
+        if it was already completed, has no tasks, or still has open tasks.
+        """
+        pass
+    
+    @abstractmethod
+    def adjust_counters(self, deltas: Dict[UUID, ProjectCounterDelta]) -> None:
+        """Add signed deltas to the task counters of several projects in one round trip."""
+        pass
+    
+    @abstractmethod
+    def reconcile_counters(self) -> int:
+        """Recount every project's task counters from the tasks table.
+        
+        Returns the number of projects whose stored counters were wrong.
+        """
+        pass
+    
+    @abstractmethod
+    def find_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        sort: str = "-created_at"
+    ) -> Page[Project]:
+        """Retrieve up to `limit` projects ordered by (sort key, id), after an opaque cursor."""
+        pass
+    
+    @abstractmethod
+    def stream(self, batch_size: int = 1000) -> Iterator[Project]:
+        """Lazily iterate over all projects, newest first."""
+        pass
+    
     @abstractmethod
     def delete(self, project_id: UUID) -> bool:
         """Delete a project by ID."""
         pass
 
+
+class OutboxRepository(ABC):
+    """Port (interface) for the transactional outbox of domain events."""
+    
+    @abstractmethod
+    def add(self, events: List[DomainEvent]) -> None:
+        """Append events, in order, to the outbox within the current transaction."""
+        pass
+    
+    @abstractmethod
+    def claim(self, batch_size: int, lease_seconds: float) -> Tuple[str, List[DomainEvent]]:
+        """Lease up to `batch_size` of the oldest unclaimed events, in sequence order.
+        
+        Returns a claim token and the events. Claims whose lease expired (e.g.
+        because their dispatcher died) can be claimed again.
+        """
+        pass
+    
+    @abstractmethod
+    def acknowledge(self, claim_token: str) -> int:
+        """Remove the delivered events of a claim; returns how many were removed."""
+        pass
+    
+    @abstractmethod
+    def record_failures(self, claim_token: str, event_ids: List[UUID], max_attempts: int) -> int:
+        """Count a failed delivery for some events of a claim and release them from it.
+        
+        They stay leased until the claim expires, then are retried; an event
+        whose attempts reach `max_attempts` is parked instead and no longer
+        claimed. Returns how many events were parked.
+        """
+        pass
+    
+    @abstractmethod
+    def pending_count(self) -> int:
+        """Number of events not yet delivered, excluding parked ones."""
+        pass
+    
+    @abstractmethod
+    def parked_count(self) -> int:
+        """Number of events parked after failing `max_attempts` times."""
+        pass
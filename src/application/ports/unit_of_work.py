@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, TypeVar
+
+from ...domain.entities.base import DomainEvent
+from .repositories import OutboxRepository, ProjectRepository, TaskRepository
+
+T = TypeVar("T")
+
+
+class UnitOfWork(ABC):
+    """Port (interface) for an atomic unit of persistence work.
+    
+    Repositories obtained from a unit of work only stage their changes; nothing
+    becomes durable until `commit` is called. Leaving the `with` block because of
+    an exception rolls everything back.
+    
+    Domain events are recorded on the unit of work rather than published
+    directly: they either ride along in the commit (outbox) or are handed back
+    by `collect_events` once the commit succeeded, so a failed write never
+    announces anything.
+    """
+    
+    tasks: TaskRepository
+    projects: ProjectRepository
+    outbox: OutboxRepository
+    
+    def __enter__(self) -> "UnitOfWork":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            self.rollback()
+    
+    @abstractmethod
+    def commit(self) -> None:
+        """Make all staged changes durable."""
+        pass
+    
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard all staged changes."""
+        pass
+    
+    @abstractmethod
+    def record(self, *events: DomainEvent) -> None:
+        """Stage domain events to go out with the next commit."""
+        pass
+    
+    @abstractmethod
+    def collect_events(self) -> List[DomainEvent]:
+        """Hand over committed events that the caller still has to publish."""
+        pass
+
+
+class AsyncUnitOfWork(ABC):
+    """Port (interface) for running unit-of-work code from async callers.
+    
+    Use cases stay synchronous; an implementation decides where they run (a
+    worker thread, or the event loop over an async driver) so that awaiting
+    them never blocks the loop.
+    """
+    
+    @abstractmethod
+    async def run(self, work: Callable[[UnitOfWork], T]) -> T:
+        """Call `work` with a unit of work and return its result."""
+        pass
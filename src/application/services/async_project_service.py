@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, TypeVar
+from uuid import UUID
+
+from ...domain.entities.project import Project, ProjectProgress
+from ..ports.event_bus import EventBus
+from ..ports.repositories import Page
+from ..ports.unit_of_work import AsyncUnitOfWork
+from .project_service import ProjectService, ProjectUpdateResult
+
+T = TypeVar("T")
+
+
+class AsyncProjectService:
+    """Async facade over ProjectService for `async def` routes.
+    
+    Each use case runs through an AsyncUnitOfWork, which decides whether the
+    synchronous business logic executes in a worker thread or on the event
+    loop over an async database driver.
+    """
+    
+    def __init__(self, unit_of_work: AsyncUnitOfWork, event_bus: EventBus):
+        self.uow = unit_of_work
+        self.event_bus = event_bus
+    
+    async def create_project(self, title: str, deadline: datetime) -> Project:
+        """Use Case: Create a new project."""
+        return await self._run(lambda s: s.create_project(title, deadline))
+    
+    async def get_project(self, project_id: UUID) -> Project:
+        """Use Case: Retrieve a project by ID."""
+        return await self._run(lambda s: s.get_project(project_id))
+    
+    async def get_project_last_modified(self, project_id: UUID) -> datetime:
+        """Use Case: Read when a project last changed, without loading it."""
+        return await self._run(lambda s: s.get_project_last_modified(project_id))
+    
+    async def get_all_projects(self) -> List[Project]:
+        """Use Case: Retrieve all projects."""
+        return await self._run(lambda s: s.get_all_projects())
+    
+    async def get_projects_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: str = "-created_at"
+    ) -> Page[Project]:
+        """Use Case: Retrieve one page of projects."""
+        return await self._run(lambda s: s.get_projects_page(limit, cursor, sort))
+    
+    async def get_progress(self, project_id: UUID) -> ProjectProgress:
+        """Use Case: Read a project's task counters without touching its tasks."""
+        return await self._run(lambda s: s.get_progress(project_id))
+    
+    async def count_overdue_tasks(self, project_ids: List[UUID]) -> Dict[UUID, int]:
+        """Use Case: Count the overdue tasks of several projects at once."""
+        return await self._run(lambda s: s.count_overdue_tasks(project_ids))
+    
+    async def update_project(
+        self,
+        project_id: UUID,
+        title: Optional[str] = None,
+        deadline: Optional[datetime] = None
+    ) -> ProjectUpdateResult:
+        """Use Case: Update project details."""
+        return await self._run(lambda s: s.update_project(project_id, title, deadline))
+    
+    async def delete_project(self, project_id: UUID) -> bool:
+        """Use Case: Delete a project."""
+        return await self._run(lambda s: s.delete_project(project_id))
+    
+    async def link_task(self, project_id: UUID, task_id: UUID) -> None:
+        """Use Case: Link a task to a project."""
+        return await self._run(lambda s: s.link_task(project_id, task_id))
+    
+    async def unlink_task(self, project_id: UUID, task_id: UUID) -> None:
+        """Use Case: Unlink a task from a project."""
+        return await self._run(lambda s: s.unlink_task(project_id, task_id))
+    
+    async def _run(self, use_case: Callable[[ProjectService], T]) -> T:
+        """Helper: Run a sync use case on a ProjectService bound to the unit of work."""
+        return await self.uow.run(lambda uow: use_case(ProjectService(uow, self.event_bus)))
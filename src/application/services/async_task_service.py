@@ -0,0 +1,104 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from uuid import UUID
+
+from ...domain.entities.task import Task
+from ..ports.event_bus import EventBus
+from ..ports.repositories import Page, TaskQuery
+from ..ports.unit_of_work import AsyncUnitOfWork
+from .task_service import BulkCreateResult, TaskService
+
+T = TypeVar("T")
+
+
+class AsyncTaskService:
+    """Async facade over TaskService for `async def` routes.
+    
+    Each use case runs through an AsyncUnitOfWork, which decides whether the
+    synchronous business logic executes in a worker thread or on the event
+    loop over an async database driver.
+    """
+    
+    def __init__(self, unit_of_work: AsyncUnitOfWork, event_bus: EventBus):
+        self.uow = unit_of_work
+        self.event_bus = event_bus
+    
+    async def create_task(
+        self,
+        title: str,
+        deadline: datetime,
+        description: Optional[str] = None,
+        project_id: Optional[UUID] = None
+    ) -> Task:
+        """Use Case: Create a new task."""
+        return await self._run(lambda s: s.create_task(title, deadline, description, project_id))
+    
+    async def create_tasks(self, items: List[Dict[str, Any]]) -> BulkCreateResult:
+        """Use Case: Create many tasks at once."""
+        return await self._run(lambda s: s.create_tasks(items))
+    
+    async def get_task(self, task_id: UUID) -> Task:
+        """Use Case: Retrieve a task by ID."""
+        return await self._run(lambda s: s.get_task(task_id))
+    
+    async def get_task_last_modified(self, task_id: UUID) -> datetime:
+        """Use Case: Read when a task last changed, without loading it."""
+        return await self._run(lambda s: s.get_task_last_modified(task_id))
+    
+    async def get_all_tasks(self) -> List[Task]:
+        """Use Case: Retrieve all tasks."""
+        return await self._run(lambda s: s.get_all_tasks())
+    
+    async def find_tasks(self, query: TaskQuery) -> Page[Task]:
+        """Use Case: List tasks matching a combination of filters."""
+        return await self._run(lambda s: s.find_tasks(query))
+    
+    async def update_task(
+        self,
+        task_id: UUID,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime] = None
+    ) -> Task:
+        """Use Case: Update task details."""
+        return await self._run(lambda s: s.update_task(task_id, title, description, deadline))
+    
+    async def delete_task(self, task_id: UUID) -> bool:
+        """Use Case: Delete a task."""
+        return await self._run(lambda s: s.delete_task(task_id))
+    
+    async def complete_task(self, task_id: UUID, auto_complete_project: bool = False) -> Task:
+        """Use Case: Mark a task as completed."""
+        return await self._run(lambda s: s.complete_task(task_id, auto_complete_project))
+    
+    async def complete_tasks(
+        self,
+        task_ids: List[UUID],
+        auto_complete_project: bool = False
+    ) -> List[Task]:
+        """Use Case: Mark many tasks as completed at once."""
+        return await self._run(lambda s: s.complete_tasks(task_ids, auto_complete_project))
+    
+    async def reopen_tasks(self, task_ids: List[UUID]) -> List[Task]:
+        """Use Case: Reopen many completed tasks at once."""
+        return await self._run(lambda s: s.reopen_tasks(task_ids))
+    
+    async def get_tasks_by_project(self, project_id: UUID) -> List[Task]:
+        """Use Case: Get all tasks for a project."""
+        return await self._run(lambda s: s.get_tasks_by_project(project_id))
+    
+    async def get_project_tasks_version(self, project_id: UUID) -> Tuple[int, datetime]:
+        """Use Case: Summarise a project's task list as (task count, last change) without loading it."""
+        return await self._run(lambda s: s.get_project_tasks_version(project_id))
+    
+    async def get_overdue_tasks(self) -> List[Task]:
+        """Use Case: Get all overdue tasks."""
+        return await self._run(lambda s: s.get_overdue_tasks())
+    
+    async def get_completed_tasks(self) -> List[Task]:
+        """Use Case: Get all completed tasks."""
+        return await self._run(lambda s: s.get_completed_tasks())
+    
+    async def _run(self, use_case: Callable[[TaskService], T]) -> T:
+        """Helper: Run a sync use case on a TaskService bound to the unit of work."""
+        return await self.uow.run(lambda uow: use_case(TaskService(uow, self.event_bus)))
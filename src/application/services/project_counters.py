@@ -0,0 +1,44 @@
+from collections import defaultdict
+from typing import Dict, Optional
+from uuid import UUID
+
+from ...domain.entities.task import Task
+from ..ports.repositories import ProjectCounterDelta, ProjectRepository
+
+
+class ProjectCounterTracker:
+    """Collects how one use case changes the task counters of the projects it touches.
+    
+    Call `remove` with a task's state before a change and `add` with its state
+    after; `apply` then writes the net deltas in one round trip, inside the
+    same unit of work as the task writes. Overdue tasks are not counted here:
+    a task becomes overdue by time passing, without any write, so they are
+    counted when progress is read.
+    """
+    
+    def __init__(self):
+        self.deltas: Dict[UUID, ProjectCounterDelta] = defaultdict(ProjectCounterDelta)
+    
+    def add(self, task: Task, sign: int = 1, completed: Optional[bool] = None) -> None:
+        """Count a task's state towards its project; `completed` overrides the task's flag."""
+        if not task.project_id:
+            return
+        
+        if completed is None:
+            completed = task.completed
+        
+        delta = self.deltas[task.project_id]
+        delta.tasks += sign
+        if completed:
+            delta.completed += sign
+    
+    def remove(self, task: Task, completed: Optional[bool] = None) -> None:
+        """Take a task's (previous) state back out of its project's counters."""
+        self.add(task, sign=-1, completed=completed)
+    
+    def apply(self, project_repo: ProjectRepository) -> None:
+        """Write the accumulated deltas, skipping projects whose counters net to zero."""
+        changed = {project_id: delta for project_id, delta in self.deltas.items() if delta}
+        if changed:
+            project_repo.adjust_counters(changed)
+        self.deltas.clear()
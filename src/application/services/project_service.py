@@ -1,34 +1,50 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
 
-from ...domain.entities.project import Project
+from ...domain.entities.base import event_batch
+from ...domain.entities.project import Project, ProjectProgress
+from ...domain.events.task_events import TaskDeadlineChangedEvent, TaskUnlinkedEvent
 from ...domain.exceptions.domain_exceptions import ProjectNotFoundError
-from ..ports.repositories import ProjectRepository, TaskRepository
+from ..ports.repositories import Page
 from ..ports.event_bus import EventBus
+from ..ports.unit_of_work import UnitOfWork
+from .project_counters import ProjectCounterTracker
+
+
+@dataclass
+class ProjectUpdateResult:
+    """Outcome of a project update."""
+    project: Project
+    adjusted_tasks: int = 0
 
 
 class ProjectService:
-    """Application service for project-related use cases."""
+    """Application service for project-related use cases.
     
-    def __init__(
-        self,
-        project_repository: ProjectRepository,
-        task_repository: TaskRepository,
-        event_bus: EventBus
-    ):
-        self.project_repo = project_repository
-        self.task_repo = task_repository
+    Each mutating use case records its domain events on the unit of work and
+    commits exactly once; events are published only after that commit
+    succeeds, or written to the outbox in the same transaction when it is on.
+    """
+    
+    def __init__(self, unit_of_work: UnitOfWork, event_bus: EventBus):
+        self.uow = unit_of_work
+        self.project_repo = unit_of_work.projects
+        self.task_repo = unit_of_work.tasks
         self.event_bus = event_bus
     
     def create_project(self, title: str, deadline: datetime) -> Project:
         """Use Case: Create a new project."""
         project = Project(title=title, deadline=deadline)
         
-        # Publish events BEFORE saving (since save returns a new entity without events)
-        self._publish_events(project)
+        with self.uow:
+            saved_project = self.project_repo.save(project)
+            self.uow.record(*saved_project.collect_events())
+            self.uow.commit()
+        
+        self._publish_committed()
         
-        saved_project = self.project_repo.save(project)
         return saved_project
     
     def get_project(self, project_id: UUID) -> Project:
@@ -38,72 +54,154 @@ class ProjectService:
             raise ProjectNotFoundError(f"Project {project_id} not found")
         return project
     
+    def get_project_last_modified(self, project_id: UUID) -> datetime:
+        """Use Case: Read when a project last changed, without loading it."""
+        updated_at = self.project_repo.find_updated_at(project_id)
+        if updated_at is None:
+            raise ProjectNotFoundError(f"Project {project_id} not found")
+        return updated_at
+    
     def get_all_projects(self) -> List[Project]:
         """Use Case: Retrieve all projects."""
         return self.project_repo.find_all()
     
+    def get_projects_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        sort: str = "-created_at"
+    ) -> Page[Project]:
+        """Use Case: Retrieve one page of projects."""
+        return self.project_repo.find_page(limit=limit, after=cursor, sort=sort)
+    
+    def get_progress(self, project_id: UUID) -> ProjectProgress:
+        """Use Case: Read a project's task counters, counting only its overdue tasks."""
+        project = self.get_project(project_id)
+        overdue = self.task_repo.count_overdue_by_project([project_id])
+        return project.get_progress(overdue.get(project_id, 0))
+    
+    def count_overdue_tasks(self, project_ids: List[UUID]) -> Dict[UUID, int]:
+        """Use Case: Count the overdue tasks of several projects at once."""
+        return self.task_repo.count_overdue_by_project(project_ids)
+    
+    def reconcile_counters(self) -> int:
+        """Use Case: Rebuild every project's task counters from scratch."""
+        with self.uow:
+            repaired = self.project_repo.reconcile_counters()
+            self.uow.commit()
+        return repaired
+    
+    def stream_projects(self, batch_size: int = 1000) -> Iterator[Project]:
+        """Use Case: Export every project without loading them all at once."""
+        return self.project_repo.stream(batch_size=batch_size)
+    
     def update_project(
         self,
         project_id: UUID,
         title: Optional[str] = None,
         deadline: Optional[datetime] = None
-    ) -> Project:
-        """Use Case: Update project details."""
-        project = self.get_project(project_id)
-        
-        if title is not None:
-            project.title = title
+    ) -> ProjectUpdateResult:
+        """Use Case: Update project details.
         
-        if deadline is not None:
-            project.update_deadline(deadline)
+        Pulling the deadline in also pulls every task due after it back to the
+        new deadline, in the same transaction, with one set-based UPDATE and
+        one TaskDeadlineChangedEvent per moved task.
+        """
+        adjusted = []
+        with self.uow:
+            project = self.get_project(project_id)
+            old_deadline = project.deadline
+            
+            if title is not None:
+                project.title = title
+            
+            if deadline is not None:
+                project.update_deadline(deadline)
+            
+            project.updated_at = datetime.now(timezone.utc)
+            
+            updated_project = self.project_repo.save(project)
+            self.uow.record(*updated_project.collect_events())
+            
+            if deadline is not None and deadline < old_deadline:
+                adjusted = self.task_repo.clamp_deadlines(project_id, deadline)
+                with event_batch():
+                    self.uow.record(*(
+                        TaskDeadlineChangedEvent(
+                            task_id=task_id,
+                            old_deadline=task_deadline,
+                            new_deadline=deadline
+                        )
+                        for task_id, task_deadline in adjusted
+                    ))
+            self.uow.commit()
         
-        project.updated_at = datetime.now(timezone.utc)
+        self._publish_committed()
         
-        # Publish events BEFORE saving (since save returns a new entity without events)
-        self._publish_events(project)
-        
-        updated_project = self.project_repo.save(project)
-        
-        return updated_project
+        return ProjectUpdateResult(project=updated_project, adjusted_tasks=len(adjusted))
     
     def delete_project(self, project_id: UUID) -> bool:
-        """Use Case: Delete a project."""
-        project = self.get_project(project_id)
+        """Use Case: Delete a project.
         
-        tasks = self.task_repo.find_by_project_id(project_id)
-        for task in tasks:
-            task.unlink_from_project()
-            self.task_repo.save(task)
+        Tasks are detached with one set-based update; their IDs are only fetched
+        when someone is subscribed to TaskUnlinkedEvent.
+        """
+        notify = self.event_bus.has_subscribers(TaskUnlinkedEvent)
+        
+        with self.uow:
+            self.get_project(project_id)
+            unlinked = self.task_repo.unlink_project(project_id, return_ids=notify)
+            deleted = self.project_repo.delete(project_id)
+            with event_batch():
+                self.uow.record(*(
+                    TaskUnlinkedEvent(task_id=task_id, project_id=project_id)
+                    for task_id in unlinked
+                ))
+            self.uow.commit()
         
-        return self.project_repo.delete(project_id)
+        self._publish_committed()
+        
+        return deleted
     
     def link_task(self, project_id: UUID, task_id: UUID) -> None:
         """Use Case: Link a task to a project."""
-        project = self.get_project(project_id)
-        task = self.task_repo.find_by_id(task_id)
-        
-        if not task:
-            from ...domain.exceptions.domain_exceptions import TaskNotFoundError
-            raise TaskNotFoundError(f"Task {task_id} not found")
-        
-        task.link_to_project(project.id, project.deadline)
-        self.task_repo.save(task)
+        with self.uow:
+            project = self.get_project(project_id)
+            task = self.task_repo.find_by_id(task_id)
+            
+            if not task:
+                from ...domain.exceptions.domain_exceptions import TaskNotFoundError
+                raise TaskNotFoundError(f"Task {task_id} not found")
+            
+            counters = ProjectCounterTracker()
+            counters.remove(task)
+            task.link_to_project(project.id, project.deadline)
+            self.task_repo.save(task)
+            counters.add(task)
+            counters.apply(self.project_repo)
+            self.uow.commit()
     
     def unlink_task(self, project_id: UUID, task_id: UUID) -> None:
         """Use Case: Unlink a task from a project."""
-        project = self.get_project(project_id)
-        task = self.task_repo.find_by_id(task_id)
-        
-        if not task:
-            from ...domain.exceptions.domain_exceptions import TaskNotFoundError
-            raise TaskNotFoundError(f"Task {task_id} not found")
+        with self.uow:
+            self.get_project(project_id)
+            task = self.task_repo.find_by_id(task_id)
+            
+            if not task:
+                from ...domain.exceptions.domain_exceptions import TaskNotFoundError
+                raise TaskNotFoundError(f"Task {task_id} not found")
+            
+            counters = ProjectCounterTracker()
+            counters.remove(task)
+            task.unlink_from_project()
+            self.task_repo.save(task)
+            counters.apply(self.project_repo)
+            self.uow.record(*task.collect_events())
+            self.uow.commit()
         
-        task.unlink_from_project()
-        self.task_repo.save(task)
-    
-    def _publish_events(self, entity) -> None:
-        """Helper: Publish all domain events from an entity."""
-        events = entity.collect_events()
-        for event in events:
-            self.event_bus.publish(event)
+        self._publish_committed()
+    
+    def _publish_committed(self) -> None:
+        """Helper: Publish the events of the last commit that did not go to the outbox."""
+        self.event_bus.publish_many(self.uow.collect_events())
 
@@ -1,24 +1,45 @@
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
+from ...domain.entities.base import event_batch
 from ...domain.entities.task import Task
+from ...domain.events.project_events import ProjectCompletedEvent
+from ...domain.events.task_events import TaskCompletedEvent, TaskCreatedEvent, TaskReopenedEvent
 from ...domain.exceptions.domain_exceptions import TaskNotFoundError, ProjectNotFoundError
-from ..ports.repositories import TaskRepository, ProjectRepository
+from ..ports.repositories import Page, TaskQuery
 from ..ports.event_bus import EventBus
+from ..ports.unit_of_work import UnitOfWork
+from .project_counters import ProjectCounterTracker
+
+
+@dataclass
+class BulkItemError:
+    """Why one item of a bulk request was rejected."""
+    index: int
+    detail: str
+
+
+@dataclass
+class BulkCreateResult:
+    """Outcome of a bulk task creation."""
+    created: List[Task] = field(default_factory=list)
+    errors: List[BulkItemError] = field(default_factory=list)
 
 
 class TaskService:
-    """Application service for task-related use cases."""
+    """Application service for task-related use cases.
     
-    def __init__(
-        self,
-        task_repository: TaskRepository,
-        project_repository: ProjectRepository,
-        event_bus: EventBus
-    ):
-        self.task_repo = task_repository
-        self.project_repo = project_repository
+    Each mutating use case records its domain events on the unit of work and
+    commits exactly once; events are published only after that commit
+    succeeds, or written to the outbox in the same transaction when it is on.
+    """
+    
+    def __init__(self, unit_of_work: UnitOfWork, event_bus: EventBus):
+        self.uow = unit_of_work
+        self.task_repo = unit_of_work.tasks
+        self.project_repo = unit_of_work.projects
         self.event_bus = event_bus
     
     def create_task(
@@ -29,29 +50,86 @@ class TaskService:
         project_id: Optional[UUID] = None
     ) -> Task:
         """Use Case: Create a new task."""
-        if project_id:
-            project = self.project_repo.find_by_id(project_id)
-            if not project:
-                raise ProjectNotFoundError(f"Project {project_id} not found")
-            
-            if deadline > project.deadline:
-                from ...domain.exceptions.domain_exceptions import InvalidDeadlineError
-                raise InvalidDeadlineError(
-                    f"Task deadline cannot be later than project deadline {project.deadline}"
-                )
-        
-        task = Task(
-            title=title,
-            description=description,
-            deadline=deadline,
-            project_id=project_id
-        )
-        
-        saved_task = self.task_repo.save(task)
-        self._publish_events(saved_task)
+        with self.uow:
+            if project_id:
+                project = self.project_repo.find_by_id(project_id)
+                if not project:
+                    raise ProjectNotFoundError(f"Project {project_id} not found")
+                
+                if deadline > project.deadline:
+                    from ...domain.exceptions.domain_exceptions import InvalidDeadlineError
+                    raise InvalidDeadlineError(
+                        f"Task deadline cannot be later than project deadline {project.deadline}"
+                    )
+            
+            task = Task(
+                title=title,
+                description=description,
+                deadline=deadline,
+                project_id=project_id
+            )
+            
+            saved_task = self.task_repo.save(task)
+            
+            counters = ProjectCounterTracker()
+            counters.add(saved_task)
+            counters.apply(self.project_repo)
+            
+            self.uow.record(self._created_event(saved_task))
+            self.uow.commit()
+        
+        self._publish_committed()
         
         return saved_task
     
+    def create_tasks(self, items: List[Dict[str, Any]]) -> BulkCreateResult:
+        """Use Case: Create many tasks at once.
+        
+        Each item takes the same keyword arguments as `create_task`. Projects are
+        resolved with one lookup for all distinct IDs, valid tasks are inserted in
+        a single transaction, and invalid items are reported by index.
+        """
+        project_ids = {item["project_id"] for item in items if item.get("project_id")}
+        projects = {p.id: p for p in self.project_repo.find_by_ids(list(project_ids))}
+        
+        result = BulkCreateResult()
+        tasks = []
+        for index, item in enumerate(items):
+            project_id = item.get("project_id")
+            if project_id:
+                project = projects.get(project_id)
+                if not project:
+                    result.errors.append(BulkItemError(index, f"Project {project_id} not found"))
+                    continue
+                if item["deadline"] > project.deadline:
+                    result.errors.append(BulkItemError(
+                        index,
+                        f"Task deadline cannot be later than project deadline {project.deadline}"
+                    ))
+                    continue
+            
+            tasks.append(Task(
+                title=item["title"],
+                description=item.get("description"),
+                deadline=item["deadline"],
+                project_id=project_id
+            ))
+        
+        with self.uow:
+            result.created = self.task_repo.save_many(tasks)
+            
+            counters = ProjectCounterTracker()
+            for task in result.created:
+                counters.add(task)
+            counters.apply(self.project_repo)
+            
+            self.uow.record(*(self._created_event(task) for task in result.created))
+            self.uow.commit()
+        
+        self._publish_committed()
+        
+        return result
+    
     def get_task(self, task_id: UUID) -> Task:
         """Use Case: Retrieve a task by ID."""
         task = self.task_repo.find_by_id(task_id)
@@ -59,10 +137,37 @@ class TaskService:
             raise TaskNotFoundError(f"Task {task_id} not found")
         return task
     
+    def get_task_last_modified(self, task_id: UUID) -> datetime:
+        """Use Case: Read when a task last changed, without loading it."""
+        updated_at = self.task_repo.find_updated_at(task_id)
+        if updated_at is None:
+            raise TaskNotFoundError(f"Task {task_id} not found")
+        return updated_at
+    
     def get_all_tasks(self) -> List[Task]:
         """Use Case: Retrieve all tasks."""
         return self.task_repo.find_all()
     
+    def find_tasks(self, query: TaskQuery) -> Page[Task]:
+        """Use Case: List tasks matching a combination of filters."""
+        if query.project_id is not None:
+            if not self.project_repo.find_by_id(query.project_id):
+                raise ProjectNotFoundError(f"Project {query.project_id} not found")
+        
+        return self.task_repo.find(query)
+    
+    def stream_tasks(self, query: TaskQuery, batch_size: int = 1000) -> Iterator[Task]:
+        """Use Case: Export every task matching the filters without loading them all at once.
+        
+        The project check runs immediately; rows are only fetched while the
+        returned iterator is consumed.
+        """
+        if query.project_id is not None:
+            if not self.project_repo.find_by_id(query.project_id):
+                raise ProjectNotFoundError(f"Project {query.project_id} not found")
+        
+        return self.task_repo.stream(query, batch_size=batch_size)
+    
     def update_task(
         self,
         task_id: UUID,
@@ -71,49 +176,133 @@ class TaskService:
         deadline: Optional[datetime] = None
     ) -> Task:
         """Use Case: Update task details."""
-        task = self.get_task(task_id)
-        
-        if title is not None:
-            task.title = title
-        
-        if description is not None:
-            task.description = description
-        
-        if deadline is not None:
-            project_deadline = None
-            if task.project_id:
-                project = self.project_repo.find_by_id(task.project_id)
-                if project:
-                    project_deadline = project.deadline
+        with self.uow:
+            task = self.get_task(task_id)
+            counters = ProjectCounterTracker()
+            counters.remove(task)
             
-            task.update_deadline(deadline, project_deadline)
-        
-        task.updated_at = datetime.now(timezone.utc)
+            if title is not None:
+                task.title = title
+            
+            if description is not None:
+                task.description = description
+            
+            if deadline is not None:
+                project_deadline = None
+                if task.project_id:
+                    project = self.project_repo.find_by_id(task.project_id)
+                    if project:
+                        project_deadline = project.deadline
+                
+                task.update_deadline(deadline, project_deadline)
+            
+            task.updated_at = datetime.now(timezone.utc)
+            
+            updated_task = self.task_repo.save(task)
+            counters.add(updated_task)
+            counters.apply(self.project_repo)
+            self.uow.record(*updated_task.collect_events())
+            self.uow.commit()
         
-        updated_task = self.task_repo.save(task)
-        self._publish_events(updated_task)
+        self._publish_committed()
         
         return updated_task
     
     def delete_task(self, task_id: UUID) -> bool:
         """Use Case: Delete a task."""
-        task = self.get_task(task_id)
-        return self.task_repo.delete(task_id)
+        with self.uow:
+            task = self.get_task(task_id)
+            deleted = self.task_repo.delete(task_id)
+            
+            counters = ProjectCounterTracker()
+            counters.remove(task)
+            counters.apply(self.project_repo)
+            
+            self.uow.commit()
+        return deleted
     
     def complete_task(self, task_id: UUID, auto_complete_project: bool = False) -> Task:
         """Use Case: Mark a task as completed."""
-        task = self.get_task(task_id)
+        with self.uow:
+            task = self.get_task(task_id)
+            counters = ProjectCounterTracker()
+            counters.remove(task)
+            
+            task.mark_completed()
+            
+            completed_task = self.task_repo.save(task)
+            counters.add(completed_task)
+            counters.apply(self.project_repo)
+            
+            self.uow.record(*completed_task.collect_events())
+            if auto_complete_project and task.project_id:
+                project_completed = self._try_auto_complete_project(task.project_id)
+                if project_completed:
+                    self.uow.record(project_completed)
+            
+            self.uow.commit()
         
-        task.mark_completed()
+        self._publish_committed()
         
-        completed_task = self.task_repo.save(task)
+        return completed_task
+    
+    def complete_tasks(self, task_ids: List[UUID], auto_complete_project: bool = False) -> List[Task]:
+        """Use Case: Mark many tasks as completed at once.
         
-        self._publish_events(completed_task)
+        Returns the tasks that actually changed; IDs that are unknown or already
+        completed are ignored. Auto-completion runs once per affected project.
+        """
+        with self.uow:
+            completed_tasks = self.task_repo.set_completed(task_ids, completed=True)
+            self._count_flips(completed_tasks)
+            
+            with event_batch():
+                self.uow.record(*(
+                    TaskCompletedEvent(
+                        task_id=task.id,
+                        project_id=task.project_id,
+                        completed_at=task.updated_at
+                    )
+                    for task in completed_tasks
+                ))
+            
+            if auto_complete_project:
+                for project_id in self._project_ids(completed_tasks):
+                    project_completed = self._try_auto_complete_project(project_id)
+                    if project_completed:
+                        self.uow.record(project_completed)
+            self.uow.commit()
         
-        if auto_complete_project and task.project_id:
-            self._try_auto_complete_project(task.project_id)
+        self._publish_committed()
         
-        return completed_task
+        return completed_tasks
+    
+    def reopen_tasks(self, task_ids: List[UUID]) -> List[Task]:
+        """Use Case: Reopen many completed tasks at once.
+        
+        Completed projects that contain a reopened task are reopened once each.
+        """
+        with self.uow:
+            reopened_tasks = self.task_repo.set_completed(task_ids, completed=False)
+            self._count_flips(reopened_tasks)
+            
+            project_ids = self._project_ids(reopened_tasks)
+            for project in self.project_repo.find_by_ids(list(project_ids)):
+                if project.completed:
+                    project.reopen()
+                    self.project_repo.save(project)
+                    self.uow.record(*project.collect_events())
+            
+            with event_batch():
+                self.uow.record(*(
+                    TaskReopenedEvent(task_id=task.id, project_id=task.project_id)
+                    for task in reopened_tasks
+                ))
+            self.uow.commit()
+        
+        self._publish_committed()
+        
+        return reopened_tasks
     
     def get_tasks_by_project(self, project_id: UUID) -> List[Task]:
         """Use Case: Get all tasks for a project."""
@@ -123,6 +312,20 @@ class TaskService:
         
         return self.task_repo.find_by_project_id(project_id)
     
+    def get_project_tasks_version(self, project_id: UUID) -> Tuple[int, datetime]:
+        """Use Case: Summarise a project's task list as (task count, last change) without loading it.
+        
+        Tasks deleted or moved out change the count; tasks added, moved in or
+        edited bring a newer `updated_at`. The project's own `updated_at`
+        covers edits of the project itself, not its counters.
+        """
+        project_updated_at = self.project_repo.find_updated_at(project_id)
+        if project_updated_at is None:
+            raise ProjectNotFoundError(f"Project {project_id} not found")
+        
+        count, latest = self.task_repo.project_tasks_version(project_id)
+        return count, max(project_updated_at, latest) if latest else project_updated_at
+    
     def get_overdue_tasks(self) -> List[Task]:
         """Use Case: Get all overdue tasks."""
         return self.task_repo.find_overdue()
@@ -131,20 +334,34 @@ class TaskService:
         """Use Case: Get all completed tasks."""
         return self.task_repo.find_completed()
     
-    def _try_auto_complete_project(self, project_id: UUID) -> None:
-        """Helper: Auto-complete project if all tasks are done."""
-        tasks = self.task_repo.find_by_project_id(project_id)
-        all_completed = all(task.completed for task in tasks)
-        
-        if all_completed and tasks:
-            project = self.project_repo.find_by_id(project_id)
-            if project and not project.completed:
-                project.mark_completed(all_tasks_completed=True)
-                self.project_repo.save(project)
-                self._publish_events(project)
-    
-    def _publish_events(self, entity) -> None:
-        """Helper: Publish all domain events from an entity."""
-        events = entity.collect_events()
-        for event in events:
-            self.event_bus.publish(event)
+    def _try_auto_complete_project(self, project_id: UUID) -> Optional[ProjectCompletedEvent]:
+        """Helper: Auto-complete project if all tasks are done.
+        
+        One conditional UPDATE, guarded by EXISTS subqueries, checks for open
+        tasks and completes the project without loading its tasks; returns the
+        completion event only if this call was the one that completed it.
+        """
+        completed_at = self.project_repo.complete_if_no_open_tasks(project_id)
+        if completed_at is None:
+            return None
+        return ProjectCompletedEvent(project_id=project_id, completed_at=completed_at)
+    
+    def _count_flips(self, tasks: List[Task]) -> None:
+        """Helper: Move tasks whose completion flag just flipped between project counters."""
+        counters = ProjectCounterTracker()
+        for task in tasks:
+            counters.remove(task, completed=not task.completed)
+            counters.add(task)
+        counters.apply(self.project_repo)
+    
+    def _project_ids(self, tasks: List[Task]) -> set:
+        """Helper: Distinct project IDs of the given tasks."""
+        return {task.project_id for task in tasks if task.project_id}
+    
+    def _created_event(self, task: Task) -> TaskCreatedEvent:
+        """Helper: Build the creation event for a persisted task."""
+        return TaskCreatedEvent(task_id=task.id, title=task.title, deadline=task.deadline)
+    
+    def _publish_committed(self) -> None:
+        """Helper: Publish the events of the last commit that did not go to the outbox."""
+        self.event_bus.publish_many(self.uow.collect_events())
@@ -0,0 +1,70 @@
+"""Maintenance commands.
+
+Usage:
+    python -m src.cli reconcile-counters
+    python -m src.cli migrate-guids --to binary|text
+"""
+import argparse
+import sys
+
+from .application.services.project_service import ProjectService
+from .infrastructure.config.settings import settings
+from .infrastructure.database.guid_migration import detect_guid_storage, migrate_guid_storage
+from .infrastructure.database.session import SessionLocal, engine, init_db
+from .infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from .infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+
+def reconcile_counters(args: argparse.Namespace) -> int:
+    """Rebuild every project's task counters from the tasks table."""
+    init_db()
+    uow = SQLAlchemyUnitOfWork(SessionLocal(), close_on_exit=True)
+    repaired = ProjectService(uow, InMemoryEventBus()).reconcile_counters()
+    print(f"Reconciled task counters: {repaired} project(s) repaired")
+    return 0
+
+
+def migrate_guids(args: argparse.Namespace) -> int:
+    """Rewrite id columns between CHAR(36) text and BINARY(16) storage (SQLite, application stopped)."""
+    if engine.dialect.name != "sqlite":
+        print(f"Nothing to migrate: GUID storage is only configurable on SQLite, not {engine.dialect.name}")
+        return 1
+
+    current = detect_guid_storage(engine)
+    if current == args.to:
+        print(f"Ids are already stored as {args.to}")
+        return 0
+
+    copied = migrate_guid_storage(engine, binary=args.to == "binary", vacuum=not args.no_vacuum)
+    print(
+        f"Rewrote ids as {args.to}: "
+        + ", ".join(f"{table} {rows} row(s)" for table, rows in copied.items())
+    )
+    if settings.BINARY_GUIDS != (args.to == "binary"):
+        print(f"Set BINARY_GUIDS={'true' if args.to == 'binary' else 'false'} before starting the application")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser(
+        "reconcile-counters",
+        help="Recount task_count/completed_count for every project"
+    ).set_defaults(handler=reconcile_counters)
+
+    migrate = commands.add_parser(
+        "migrate-guids",
+        help="Rewrite id columns as BINARY(16) or CHAR(36) text (SQLite)"
+    )
+    migrate.add_argument("--to", choices=("binary", "text"), required=True)
+    migrate.add_argument("--no-vacuum", action="store_true", help="Skip reclaiming the freed pages")
+    migrate.set_defaults(handler=migrate_guids)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
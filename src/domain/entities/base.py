@@ -1,14 +1,147 @@
+import itertools
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from typing import Callable, FrozenSet, Iterator, Optional
+from uuid import UUID
 
 
-@dataclass
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class EventIdGenerator:
+    """UUIDv7-formatted event ids without touching os.urandom per event.
+    
+    Each id is a fixed per-process prefix (start time in milliseconds plus 42
+    random node bits) followed by a 32-bit sequence number, so ids are unique
+    across processes and strictly increasing within one. They are ordered
+    within a process only: the embedded timestamp is when the prefix was
+    drawn, not when the event happened, so ids of a long-running process sort
+    before later-started processes' ids for earlier events. Use `occurred_at`
+    for event time. The prefix is re-drawn when the sequence wraps and in
+    forked children.
+    """
+    
+    _SEQUENCE_BITS = 32
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._reseed()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+    
+    def _after_fork(self) -> None:
+        # The parent's lock may have been held by a thread that does not exist here
+        self._lock = threading.Lock()
+        self._reseed()
+    
+    def _reseed(self) -> None:
+        with self._lock:
+            unix_ms = max(time.time_ns() // 1_000_000, self._last_ms + 1)
+            self._last_ms = unix_ms
+            prefix = (
+                (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+                | 0x7 << 76
+                | secrets.randbits(12) << 64
+                | 0b10 << 62
+                | secrets.randbits(30) << self._SEQUENCE_BITS
+            )
+            # One attribute, so a reader never pairs an old prefix with a fresh sequence
+            self._state = (prefix, itertools.count())
+    
+    def __call__(self) -> UUID:
+        prefix, counter = self._state
+        sequence = next(counter)
+        if sequence >> self._SEQUENCE_BITS:
+            self._reseed()
+            return self()
+        return UUID(int=prefix | sequence)
+
+
+next_event_id = EventIdGenerator()
+
+_event_clock: Callable[[], datetime] = _utc_now
+_batch_occurred_at: ContextVar[Optional[datetime]] = ContextVar("batch_occurred_at", default=None)
+
+
+def set_event_clock(clock: Optional[Callable[[], datetime]] = None) -> None:
+    """Inject the clock that stamps `occurred_at` (e.g. a fixed one in tests); None restores UTC now."""
+    global _event_clock
+    _event_clock = clock or _utc_now
+
+
+@contextmanager
+def event_batch(occurred_at: Optional[datetime] = None) -> Iterator[datetime]:
+    """Stamp every event created inside the block with one shared `occurred_at`.
+    
+    Bulk operations use it so a few thousand events read the clock once.
+    """
+    if occurred_at is None:
+        occurred_at = _event_clock()
+    reset_token = _batch_occurred_at.set(occurred_at)
+    try:
+        yield occurred_at
+    finally:
+        _batch_occurred_at.reset(reset_token)
+
+
+@dataclass(slots=True)
 class DomainEvent:
-    """Base class for all domain events."""
+    """Base class for all domain events.
+    
+    Events are slotted dataclasses; subclasses must also pass `slots=True`
+    and must not override `__post_init__` with a zero-argument `super()`,
+    which slotted dataclasses do not support.
+    
+    `event_id` comes from `next_event_id` and `occurred_at` from the batch
+    timestamp (see `event_batch`) or else the injected event clock.
+    """
     event_id: UUID = field(init=False)
     occurred_at: datetime = field(init=False)
     
     def __post_init__(self):
-        self.event_id = uuid4()
-        self.occurred_at = datetime.now(timezone.utc)
+        self.event_id = next_event_id()
+        self.occurred_at = _batch_occurred_at.get() or _event_clock()
+
+
+
+class Entity:
+    """Base class for entities that track which fields changed since they were loaded.
+    
+    Every assignment to a public attribute is recorded, so a freshly constructed
+    entity reports all of its fields as dirty until a repository calls `mark_clean`.
+    
+    Entities use `__slots__` (subclasses must declare their own) so large
+    result sets carry no per-instance `__dict__`; a clean entity holds no
+    change set at all until its next assignment.
+    """
+    
+    __slots__ = ("_dirty",)
+    
+    def __init__(self):
+        object.__setattr__(self, "_dirty", set())
+    
+    def __setattr__(self, name: str, value) -> None:
+        if name[0] != "_":
+            dirty = getattr(self, "_dirty", None)
+            if dirty is None:
+                object.__setattr__(self, "_dirty", {name})
+            else:
+                dirty.add(name)
+        object.__setattr__(self, name, value)
+    
+    @property
+    def dirty_fields(self) -> FrozenSet[str]:
+        """Names of fields assigned since the entity was last persisted or loaded."""
+        return frozenset(self._dirty or ())
+    
+    def mark_clean(self) -> None:
+        """Forget recorded changes once the entity matches its stored state."""
+        object.__setattr__(self, "_dirty", None)
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
@@ -7,12 +8,46 @@ from ..events.project_events import (
     ProjectDeadlineChangedEvent,
     ProjectReopenedEvent
 )
+from .base import Entity
 from ..exceptions.domain_exceptions import ProjectCompletionError
 
 
-class Project:
+@dataclass(frozen=True, slots=True)
+class ProjectProgress:
+    """Read model: a project's maintained task counters.
+    
+    `task_count` and `completed_count` are kept on the project row;
+    `overdue_count` (open tasks past their deadline) is counted when read,
+    since tasks become overdue without being written.
+    """
+    project_id: UUID
+    task_count: int
+    completed_count: int
+    overdue_count: int
+    
+    @property
+    def percent_complete(self) -> float:
+        """Share of completed tasks, 0-100."""
+        if not self.task_count:
+            return 0.0
+        return round(100 * self.completed_count / self.task_count, 1)
+
+
+class Project(Entity):
     """Project entity - represents a container for tasks."""
     
+    __slots__ = (
+        "id",
+        "title",
+        "deadline",
+        "completed",
+        "created_at",
+        "updated_at",
+        "task_count",
+        "completed_count",
+        "_events",
+    )
+    
     def __init__(
         self,
         title: str,
@@ -20,15 +55,20 @@ class Project:
         id: Optional[UUID] = None,
         completed: bool = False,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        task_count: int = 0,
+        completed_count: int = 0
     ):
+        super().__init__()
         self.id = id or uuid4()
         self.title = title
         self.deadline = deadline
         self.completed = completed
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
-        self._events: list = []
+        self.task_count = task_count
+        self.completed_count = completed_count
+        self._events: Optional[list] = None
     
     def mark_completed(self, all_tasks_completed: bool) -> None:
         """Mark project as completed."""
@@ -67,14 +107,24 @@ class Project:
             new_deadline=new_deadline
         ))
     
+    def get_progress(self, overdue_count: int = 0) -> ProjectProgress:
+        """Snapshot of the project's task counters, with the separately counted overdue tasks."""
+        return ProjectProgress(
+            project_id=self.id,
+            task_count=self.task_count,
+            completed_count=self.completed_count,
+            overdue_count=overdue_count
+        )
+    
     def _add_event(self, event) -> None:
-        """Add domain event to internal queue."""
+        """Add domain event to internal queue, allocating it on first use."""
+        if self._events is None:
+            self._events = []
         self._events.append(event)
     
     def collect_events(self) -> list:
         """Collect and clear domain events."""
-        events = self._events.copy()
-        self._events.clear()
+        events, self._events = self._events or [], None
         return events
     
     def __repr__(self) -> str:
@@ -2,13 +2,31 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 
-from ..events.task_events import TaskCompletedEvent, TaskCreatedEvent, TaskDeadlineChangedEvent
+from ..events.task_events import (
+    TaskCompletedEvent,
+    TaskCreatedEvent,
+    TaskDeadlineChangedEvent,
+    TaskUnlinkedEvent
+)
+from .base import Entity
 from ..exceptions.domain_exceptions import InvalidDeadlineError
 
 
-class Task:
+class Task(Entity):
     """Task entity - represents a unit of work."""
     
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "deadline",
+        "completed",
+        "project_id",
+        "created_at",
+        "updated_at",
+        "_events",
+    )
+    
     def __init__(
         self,
         title: str,
@@ -20,6 +38,7 @@ class Task:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
     ):
+        super().__init__()
         self.id = id or uuid4()
         self.title = title
         self.description = description
@@ -28,7 +47,7 @@ class Task:
         self.project_id = project_id
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
-        self._events: list = []
+        self._events: Optional[list] = None
         
     def mark_completed(self) -> None:
         """Mark task as completed and emit domain event."""
@@ -76,8 +95,12 @@ class Task:
     
     def unlink_from_project(self) -> None:
         """Remove task from project."""
+        project_id = self.project_id
         self.project_id = None
         self.updated_at = datetime.utcnow()
+        
+        if project_id:
+            self._add_event(TaskUnlinkedEvent(task_id=self.id, project_id=project_id))
     
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
@@ -92,13 +115,14 @@ class Task:
         return 0 < time_until_deadline <= hours
     
     def _add_event(self, event) -> None:
-        """Add domain event to internal queue."""
+        """Add domain event to internal queue, allocating it on first use."""
+        if self._events is None:
+            self._events = []
         self._events.append(event)
     
     def collect_events(self) -> list:
         """Collect and clear domain events."""
-        events = self._events.copy()
-        self._events.clear()
+        events, self._events = self._events or [], None
         return events
     
     def __repr__(self) -> str:
@@ -6,44 +6,47 @@ from uuid import UUID
 from ..entities.base import DomainEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskCreatedEvent(DomainEvent):
     """Emitted when a new task is created."""
     task_id: UUID
     title: str
     deadline: datetime
-    
-    def __post_init__(self):
-        super().__post_init__()
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskCompletedEvent(DomainEvent):
     """Emitted when a task is marked as completed."""
     task_id: UUID
     project_id: Optional[UUID]
     completed_at: datetime
-    
-    def __post_init__(self):
-        super().__post_init__()
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskReopenedEvent(DomainEvent):
     """Emitted when a completed task is reopened."""
     task_id: UUID
     project_id: Optional[UUID]
-    
-    def __post_init__(self):
-        super().__post_init__()
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDeadlineChangedEvent(DomainEvent):
     """Emitted when a task's deadline is changed."""
     task_id: UUID
     old_deadline: datetime
     new_deadline: datetime
-    
-    def __post_init__(self):
-        super().__post_init__()
\ No newline at end of file
+
+
+@dataclass(slots=True)
+class TaskUnlinkedEvent(DomainEvent):
+    """Emitted when a task is detached from its project."""
+    task_id: UUID
+    project_id: UUID
+
+
+@dataclass(slots=True)
+class TaskDeadlineApproachingEvent(DomainEvent):
+    """Emitted once when an open task enters its deadline warning window."""
+    task_id: UUID
+    project_id: Optional[UUID]
+    deadline: datetime
\ No newline at end of file
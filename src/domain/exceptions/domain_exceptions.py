@@ -25,4 +25,9 @@ class ProjectNotFoundError(DomainException):
 
 class TaskAlreadyLinkedError(DomainException):
     """Raised when attempting to link a task that's already linked."""
+    pass
+
+
+class InvalidCursorError(DomainException):
+    """Raised when a pagination cursor is malformed or does not match the requested sort."""
     pass
\ No newline at end of file
@@ -0,0 +1,254 @@
+from datetime import datetime
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from ...application.ports.repositories import (
+    Page,
+    ProjectCounterDelta,
+    ProjectRepository,
+    TaskQuery,
+    TaskRepository
+)
+from ...domain.entities.project import Project
+from ...domain.entities.task import Task
+from .entity_cache import EntityCache
+
+
+class _WriteTracker:
+    """Remembers which rows one unit of work wrote, so it never caches uncommitted state.
+    
+    Written rows are dropped from the shared cache right away and again once
+    the transaction ends (`release`), which also covers readers that loaded
+    the old committed row in between. Rows are only added to the cache while
+    `may_fill()` holds, which keeps out rows read from a lagging replica.
+    
+    Lookups are only answered from the cache with `serve_cached`: units of
+    work that write load what they change from the database, because the
+    cache is per process and another worker may have changed the row.
+    """
+    
+    kind: str
+    
+    def __init__(
+        self,
+        cache: EntityCache,
+        may_fill: Optional[Callable[[], bool]] = None,
+        serve_cached: bool = True
+    ):
+        self.cache = cache
+        self.may_fill = may_fill or (lambda: True)
+        self.serve_cached = serve_cached
+        self._written: Set[Hashable] = set()
+        self._written_all = False
+    
+    def release(self) -> None:
+        """Invalidate everything written in the finished transaction and start over."""
+        if self._written_all:
+            self.cache.invalidate_kind(self.kind)
+        elif self._written:
+            self.cache.invalidate((self.kind, entity_id) for entity_id in self._written)
+        self._written = set()
+        self._written_all = False
+    
+    def _wrote(self, ids: Iterable[Hashable]) -> None:
+        ids = list(ids)
+        self._written.update(ids)
+        self.cache.invalidate((self.kind, entity_id) for entity_id in ids)
+    
+    def _wrote_all(self) -> None:
+        self._written_all = True
+        self.cache.invalidate_kind(self.kind)
+    
+    def _cacheable(self, entity_id: Hashable) -> bool:
+        return not self._written_all and entity_id not in self._written
+    
+    def _servable(self, entity_id: Hashable) -> bool:
+        return self.serve_cached and self._cacheable(entity_id)
+    
+    def _cached_updated_at(self, entity_id: Hashable, load) -> Optional[datetime]:
+        """Answer a version probe from a cached copy when there is one, else from `load`."""
+        if self._servable(entity_id):
+            cached = self.cache.get((self.kind, entity_id))
+            if cached is not None:
+                return cached.updated_at
+        return load(entity_id)
+    
+    def _cached_find(self, entity_id: Hashable, load):
+        """Read-through lookup that bypasses the cache for rows this transaction wrote."""
+        if not self._cacheable(entity_id):
+            return load(entity_id)
+        
+        key = (self.kind, entity_id)
+        cached = self.cache.get(key) if self.serve_cached else None
+        if cached is not None:
+            return cached
+        
+        token = self.cache.token()
+        entity = load(entity_id)
+        if entity is not None and self.may_fill():
+            self.cache.put(key, entity, token)
+        return entity
+    
+    def _cached_find_many(self, entity_ids: List[Hashable], load_many) -> list:
+        """Batched `_cached_find`: serves cached rows and loads the rest with one `load_many` call."""
+        found, missing = [], []
+        for entity_id in entity_ids:
+            cached = self.cache.get((self.kind, entity_id)) if self._servable(entity_id) else None
+            if cached is not None:
+                found.append(cached)
+            else:
+                missing.append(entity_id)
+        
+        if missing:
+            token = self.cache.token()
+            loaded = load_many(missing)
+            if self.may_fill():
+                for entity in loaded:
+                    if self._cacheable(entity.id):
+                        self.cache.put((self.kind, entity.id), entity, token)
+            found.extend(loaded)
+        return found
+
+
+class CachingTaskRepository(_WriteTracker, TaskRepository):
+    """Decorator: Serves `find_by_id` from a shared EntityCache in front of another TaskRepository."""
+    
+    kind = "task"
+    
+    def __init__(
+        self,
+        inner: TaskRepository,
+        cache: EntityCache,
+        may_fill: Optional[Callable[[], bool]] = None,
+        serve_cached: bool = True
+    ):
+        super().__init__(cache, may_fill, serve_cached)
+        self.inner = inner
+    
+    def save(self, task: Task) -> Task:
+        self._wrote([task.id])
+        return self.inner.save(task)
+    
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        self._wrote(task.id for task in tasks)
+        return self.inner.save_many(tasks)
+    
+    def set_completed(self, task_ids: List[UUID], completed: bool) -> List[Task]:
+        self._wrote(task_ids)
+        return self.inner.set_completed(task_ids, completed)
+    
+    def has_open_tasks(self, project_id: UUID) -> bool:
+        return self.inner.has_open_tasks(project_id)
+    
+    def unlink_project(self, project_id: UUID, return_ids: bool = False) -> List[UUID]:
+        task_ids = self.inner.unlink_project(project_id, return_ids)
+        if return_ids:
+            self._wrote(task_ids)
+        else:
+            self._wrote_all()
+        return task_ids
+    
+    def clamp_deadlines(
+        self,
+        project_id: UUID,
+        max_deadline: datetime
+    ) -> List[Tuple[UUID, datetime]]:
+        moved = self.inner.clamp_deadlines(project_id, max_deadline)
+        self._wrote(task_id for task_id, _ in moved)
+        return moved
+    
+    def find_by_id(self, task_id: UUID) -> Optional[Task]:
+        return self._cached_find(task_id, self.inner.find_by_id)
+    
+    def find_updated_at(self, task_id: UUID) -> Optional[datetime]:
+        return self._cached_updated_at(task_id, self.inner.find_updated_at)
+    
+    def project_tasks_version(self, project_id: UUID) -> Tuple[int, Optional[datetime]]:
+        return self.inner.project_tasks_version(project_id)
+    
+    def find_all(self) -> List[Task]:
+        return self.inner.find_all()
+    
+    def find(self, query: TaskQuery) -> Page[Task]:
+        return self.inner.find(query)
+    
+    def stream(self, query: TaskQuery, batch_size: int = 1000) -> Iterator[Task]:
+        return self.inner.stream(query, batch_size)
+    
+    def find_by_project_id(self, project_id: UUID) -> List[Task]:
+        return self.inner.find_by_project_id(project_id)
+    
+    def find_completed(self) -> List[Task]:
+        return self.inner.find_completed()
+    
+    def find_overdue(self) -> List[Task]:
+        return self.inner.find_overdue()
+    
+    def count_overdue_by_project(self, project_ids: List[UUID]) -> Dict[UUID, int]:
+        return self.inner.count_overdue_by_project(project_ids)
+    
+    def find_due_between(self, start: datetime, end: datetime) -> List[Task]:
+        return self.inner.find_due_between(start, end)
+    
+    def delete(self, task_id: UUID) -> bool:
+        self._wrote([task_id])
+        return self.inner.delete(task_id)
+
+
+class CachingProjectRepository(_WriteTracker, ProjectRepository):
+    """Decorator: Serves `find_by_id`/`find_by_ids` from a shared EntityCache in front of another ProjectRepository."""
+    
+    kind = "project"
+    
+    def __init__(
+        self,
+        inner: ProjectRepository,
+        cache: EntityCache,
+        may_fill: Optional[Callable[[], bool]] = None,
+        serve_cached: bool = True
+    ):
+        super().__init__(cache, may_fill, serve_cached)
+        self.inner = inner
+    
+    def save(self, project: Project) -> Project:
+        self._wrote([project.id])
+        return self.inner.save(project)
+    
+    def find_by_id(self, project_id: UUID) -> Optional[Project]:
+        return self._cached_find(project_id, self.inner.find_by_id)
+    
+    def find_updated_at(self, project_id: UUID) -> Optional[datetime]:
+        return self._cached_updated_at(project_id, self.inner.find_updated_at)
+    
+    def find_by_ids(self, project_ids: List[UUID]) -> List[Project]:
+        return self._cached_find_many(project_ids, self.inner.find_by_ids)
+    
+    def find_all(self) -> List[Project]:
+        return self.inner.find_all()
+    
+    def complete_if_no_open_tasks(self, project_id: UUID) -> Optional[datetime]:
+        self._wrote([project_id])
+        return self.inner.complete_if_no_open_tasks(project_id)
+    
+    def adjust_counters(self, deltas: Dict[UUID, ProjectCounterDelta]) -> None:
+        self._wrote(deltas)
+        self.inner.adjust_counters(deltas)
+    
+    def reconcile_counters(self) -> int:
+        self._wrote_all()
+        return self.inner.reconcile_counters()
+    
+    def find_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        sort: str = "-created_at"
+    ) -> Page[Project]:
+        return self.inner.find_page(limit, after, sort)
+    
+    def stream(self, batch_size: int = 1000) -> Iterator[Project]:
+        return self.inner.stream(batch_size)
+    
+    def delete(self, project_id: UUID) -> bool:
+        self._wrote([project_id])
+        return self.inner.delete(project_id)
@@ -0,0 +1,138 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional, Tuple
+
+from ...domain.entities.base import DomainEvent, Entity
+
+CacheKey = Tuple[str, Hashable]
+
+
+def clone_entity(entity: Entity) -> Entity:
+    """Copy an entity so callers can mutate it without touching the cached one.
+
+    Fields are immutable values (UUIDs, datetimes, strings), so a shallow copy
+    that starts clean and without pending events is a full snapshot.
+    """
+    clone = copy.copy(entity)
+    clone.mark_clean()
+    if getattr(clone, "_events", None) is not None:
+        object.__setattr__(clone, "_events", None)
+    return clone
+
+
+class EntityCache:
+    """Process-wide, thread-safe LRU cache of entities with a time-to-live.
+    
+    Keys are (kind, id) pairs such as ("task", task_id). Loads that started
+    before an invalidation are not stored (see `token` / `put`), so a slow
+    reader cannot put back a value that a concurrent commit just replaced.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Entity]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+    
+    def get(self, key: CacheKey) -> Optional[Entity]:
+        """Return a private copy of a live cached entity, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            expires_at, entity = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return clone_entity(entity)
+    
+    def token(self) -> int:
+        """Take before loading from the database; pass to `put` with the loaded entity."""
+        return self._generation
+    
+    def put(self, key: CacheKey, entity: Entity, token: int) -> None:
+        """Store a snapshot of an entity unless something was invalidated since `token`."""
+        snapshot = clone_entity(entity)
+        with self._lock:
+            if token != self._generation:
+                return
+            
+            self._entries[key] = (self.clock() + self.ttl_seconds, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def invalidate(self, keys: Iterable[CacheKey]) -> None:
+        """Drop entries, e.g. for rows written by a transaction."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    self._invalidations += 1
+    
+    def invalidate_kind(self, kind: str) -> None:
+        """Drop every entry of one kind, for bulk writes that do not report their rows."""
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries if key[0] == kind]
+            for key in stale:
+                del self._entries[key]
+            self._invalidations += len(stale)
+    
+    def invalidate_events(self, events: Iterable[DomainEvent]) -> None:
+        """Event bus handler: drop the tasks and projects that events refer to."""
+        keys = []
+        for event in events:
+            task_id = getattr(event, "task_id", None)
+            if task_id is not None:
+                keys.append(("task", task_id))
+            project_id = getattr(event, "project_id", None)
+            if project_id is not None:
+                keys.append(("project", project_id))
+        if keys:
+            self.invalidate(keys)
+    
+    def clear(self) -> None:
+        """Drop everything."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+    
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
@@ -1,12 +1,80 @@
-from pydantic_settings import BaseSettings
+import json
+from typing import List
+
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode
+from typing_extensions import Annotated
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
     DATABASE_URL: str = "sqlite:///./task_management.db"
+    # Read replicas for read-only requests, comma-separated (or a JSON list); empty reads from DATABASE_URL
+    DATABASE_READ_URL: Annotated[List[str], NoDecode] = []
+    # Complete a project in the same transaction as its last open task
     AUTO_COMPLETE_PROJECT: bool = True
     LOG_LEVEL: str = "INFO"
+    DEFAULT_PAGE_SIZE: int = 50
+    MAX_PAGE_SIZE: int = 500
+    EXPORT_BATCH_SIZE: int = 1000
+    BULK_MAX_ITEMS: int = 1000
+    # Encode list responses straight from domain objects (orjson/msgpack) instead of re-validating them
+    FAST_SERIALIZATION: bool = True
+    # Serve requests over an asyncio driver (aiosqlite/asyncpg) instead of worker threads
+    ASYNC_DATABASE: bool = False
+    # Connection pool; size, overflow and timeout apply to queue pools (PostgreSQL, SQLite files).
+    # DB_POOL_RECYCLE replaces connections older than this many seconds (-1: never)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = True
+    # Store ids as BINARY(16) instead of CHAR(36) text on non-PostgreSQL databases;
+    # convert an existing database first with `python -m src.cli migrate-guids --to binary`
+    BINARY_GUIDS: bool = False
+    # SQLite connection profile, applied to every new connection (ignored on other databases)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_CACHE_SIZE_KB: int = 65536
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_FOREIGN_KEYS: bool = True
+    # Send mutations through one dedicated connection that takes the write lock at BEGIN;
+    # no busy-waiting inside SQLite, but lower write throughput (see benchmarks/bench_sqlite_concurrency.py)
+    SQLITE_SINGLE_WRITER: bool = False
+    SQLITE_WRITER_TIMEOUT: float = 30.0
+    # 0 runs event handlers inline in publish(); N > 0 hands events to N worker threads
+    EVENT_DISPATCH_WORKERS: int = 0
+    # Per-worker queue bound; a full queue blocks the publisher (under ASYNC_DATABASE, the event loop)
+    EVENT_QUEUE_SIZE: int = 1000
+    # Seconds shutdown waits for queued events to be handled
+    EVENT_DRAIN_TIMEOUT: float = 10.0
+    # Write events to an outbox table in the business transaction; a dispatcher delivers them
+    OUTBOX_ENABLED: bool = False
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL: float = 0.5
+    OUTBOX_LEASE_SECONDS: float = 60.0
+    # Failed deliveries after which an event is parked in the outbox instead of retried
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    # Publish TaskDeadlineApproachingEvent when open tasks come within DEADLINE_WARNING_HOURS
+    DEADLINE_SCHEDULER_ENABLED: bool = True
+    DEADLINE_WARNING_HOURS: float = 24.0
+    DEADLINE_REFRESH_INTERVAL: float = 60.0
+    # Per-process read-through cache for task/project lookups by id; read-only requests only
+    CACHE_ENABLED: bool = False
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_TTL_SECONDS: float = 30.0
+    
+    @field_validator("DATABASE_READ_URL", mode="before")
+    @classmethod
+    def _split_urls(cls, value):
+        if isinstance(value, str):
+            if value.lstrip().startswith("["):
+                return json.loads(value)
+            return [url.strip() for url in value.split(",") if url.strip()]
+        return value
     
     class Config:
         env_file = ".env"
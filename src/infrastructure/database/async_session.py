@@ -0,0 +1,117 @@
+from functools import lru_cache
+from typing import Tuple
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..config.settings import settings
+from .pooling import monitor_pool, pool_options
+from .replicas import ReplicaRoutingSession, RoundRobin
+from .sqlite_profile import apply_sqlite_profile, is_sqlite, is_sqlite_file, sqlite_pragmas
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Swap the driver of a sync database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """Create the async engine on first use, so sync deployments need no async driver."""
+    url = async_database_url(settings.DATABASE_URL)
+    engine = create_async_engine(
+        url,
+        echo=settings.LOG_LEVEL == "DEBUG",
+        **pool_options(url, settings)
+    )
+    if is_sqlite(settings.DATABASE_URL):
+        apply_sqlite_profile(engine.sync_engine, sqlite_pragmas(settings))
+    monitor_pool("async", engine.sync_engine)
+    return engine
+
+
+@lru_cache()
+def get_async_writer_engine() -> AsyncEngine:
+    """Engine for mutations: one connection taking the write lock at BEGIN on a SQLite file (see session.py)."""
+    if not (settings.SQLITE_SINGLE_WRITER and is_sqlite_file(settings.DATABASE_URL)):
+        return get_async_engine()
+    
+    url = async_database_url(settings.DATABASE_URL)
+    engine = create_async_engine(
+        url,
+        echo=settings.LOG_LEVEL == "DEBUG",
+        **dict(
+            pool_options(url, settings),
+            poolclass=AsyncAdaptedQueuePool,  # aiosqlite defaults to NullPool
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=settings.SQLITE_WRITER_TIMEOUT
+        )
+    )
+    apply_sqlite_profile(engine.sync_engine, sqlite_pragmas(settings), begin_immediate=True)
+    monitor_pool("async_writer", engine.sync_engine)
+    return engine
+
+
+@lru_cache()
+def get_async_sessionmaker() -> async_sessionmaker:
+    """Session factory bound to the async engine."""
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+@lru_cache()
+def get_async_writer_sessionmaker() -> async_sessionmaker:
+    """Session factory bound to the async writer engine."""
+    return async_sessionmaker(
+        bind=get_async_writer_engine(),
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+@lru_cache()
+def get_async_read_engines() -> Tuple[AsyncEngine, ...]:
+    """One async engine per DATABASE_READ_URL replica."""
+    replicas = []
+    for index, url in enumerate(settings.DATABASE_READ_URL):
+        async_url = async_database_url(url)
+        replica = create_async_engine(
+            async_url,
+            echo=settings.LOG_LEVEL == "DEBUG",
+            **pool_options(async_url, settings)
+        )
+        if is_sqlite(url):
+            apply_sqlite_profile(replica.sync_engine, sqlite_pragmas(settings))
+        monitor_pool(f"async_replica_{index}", replica.sync_engine)
+        replicas.append(replica)
+    return tuple(replicas)
+
+
+@lru_cache()
+def get_async_read_sessionmaker() -> async_sessionmaker:
+    """Session factory for read-only requests: replica routing as in session.py, else the async engine."""
+    replicas = get_async_read_engines()
+    if not replicas:
+        return get_async_sessionmaker()
+    
+    return async_sessionmaker(
+        sync_session_class=ReplicaRoutingSession,
+        primary=get_async_engine().sync_engine,
+        replicas=RoundRobin([replica.sync_engine for replica in replicas]),
+        autoflush=False,
+        expire_on_commit=False
+    )
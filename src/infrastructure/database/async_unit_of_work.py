@@ -0,0 +1,44 @@
+from typing import Callable, TypeVar
+
+import anyio.to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...application.ports.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from .unit_of_work import SQLAlchemyUnitOfWork
+
+T = TypeVar("T")
+
+
+class ThreadedUnitOfWork(AsyncUnitOfWork):
+    """Adapter: Runs unit-of-work code on a sync session in AnyIO's worker thread pool."""
+    
+    def __init__(self, session: Session, **options):
+        self.session = session
+        self.options = options
+    
+    async def run(self, work: Callable[[UnitOfWork], T]) -> T:
+        """Run `work` in a worker thread; the event loop stays free meanwhile."""
+        return await anyio.to_thread.run_sync(
+            work, SQLAlchemyUnitOfWork(self.session, **self.options)
+        )
+
+
+class AsyncSQLAlchemyUnitOfWork(AsyncUnitOfWork):
+    """Adapter: Runs unit-of-work code on the event loop over an async driver.
+    
+    `AsyncSession.run_sync` executes the regular SQLAlchemy repositories in a
+    greenlet whose I/O is awaited on the driver (aiosqlite/asyncpg), so every
+    query is non-blocking without a second copy of the repository code and
+    without taking a thread from the pool.
+    """
+    
+    def __init__(self, session: AsyncSession, **options):
+        self.session = session
+        self.options = options
+    
+    async def run(self, work: Callable[[UnitOfWork], T]) -> T:
+        """Run `work` against the async session's sync facade."""
+        return await self.session.run_sync(
+            lambda sync_session: work(SQLAlchemyUnitOfWork(sync_session, **self.options))
+        )
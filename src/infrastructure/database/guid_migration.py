@@ -0,0 +1,147 @@
+"""Offline rewrite of GUID columns between CHAR(36) text and BINARY(16) storage on SQLite.
+
+SQLite cannot change a column's type in place, so every model table is
+rebuilt: the old table is renamed, recreated from the models with the target
+GUID storage, refilled with converted ids and dropped, all in one
+transaction. Stop the application first, then start it again with the
+matching BINARY_GUIDS setting.
+"""
+import uuid
+from typing import Dict, List, Optional
+
+from sqlalchemy import MetaData
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from .models import GUID, Base
+
+_OLD_PREFIX = "_guid_old_"
+
+
+def _to_binary(value):
+    if value is None or isinstance(value, bytes):
+        return value
+    return uuid.UUID(value).bytes
+
+
+def _to_text(value):
+    if isinstance(value, bytes):
+        return str(uuid.UUID(bytes=value))
+    return value
+
+
+def _target_metadata(binary: bool) -> MetaData:
+    """A copy of the model metadata whose GUID columns use the target storage."""
+    target = MetaData()
+    for table in Base.metadata.sorted_tables:
+        copy = table.to_metadata(target)
+        for column in copy.columns:
+            if isinstance(column.type, GUID):
+                column.type = GUID(binary=binary)
+    return target
+
+
+def detect_guid_storage(engine: Engine) -> Optional[str]:
+    """"binary" or "text" depending on how the stored task/project ids look; None when there are none."""
+    with engine.connect() as connection:
+        for table in ("tasks", "projects"):
+            if not engine.dialect.has_table(connection, table):
+                continue
+            row = connection.exec_driver_sql(f"SELECT typeof(id) FROM {table} LIMIT 1").first()
+            if row is not None:
+                return "binary" if row[0] == "blob" else "text"
+    return None
+
+
+def migrate_guid_storage(engine: Engine, binary: bool, vacuum: bool = True) -> Dict[str, int]:
+    """Rewrite every model table so its GUID columns use the target storage.
+
+    Rows already in the target form are copied unchanged, so running it twice
+    is harmless. Returns the number of rows copied per table.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError(
+            f"GUID storage migration supports SQLite only, not {engine.dialect.name}"
+        )
+
+    target = _target_metadata(binary)
+    convert = _to_binary if binary else _to_text
+    copied: Dict[str, int] = {}
+
+    raw = engine.raw_connection()
+    try:
+        connection = raw.driver_connection
+        connection.create_function("guid_convert", 1, convert, deterministic=True)
+        previous_isolation = connection.isolation_level
+        (previous_foreign_keys,) = connection.execute("PRAGMA foreign_keys").fetchone()
+        connection.isolation_level = None  # issue BEGIN/COMMIT ourselves so DDL is transactional
+        try:
+            connection.execute("PRAGMA foreign_keys=OFF")
+            existing = {
+                name for (name,) in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+            tables = [table for table in target.sorted_tables if table.name in existing]
+
+            connection.execute("BEGIN")
+            try:
+                old_columns: Dict[str, List[str]] = {}
+                for table in tables:
+                    old_columns[table.name] = [
+                        row[1] for row in connection.execute(f"PRAGMA table_info({table.name})")
+                    ]
+                    indexes = connection.execute(
+                        "SELECT name FROM sqlite_master "
+                        "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+                        (table.name,)
+                    ).fetchall()
+                    for (index_name,) in indexes:
+                        connection.execute(f'DROP INDEX "{index_name}"')
+                    connection.execute(f'ALTER TABLE "{table.name}" RENAME TO "{_OLD_PREFIX}{table.name}"')
+
+                for table in tables:
+                    connection.execute(str(CreateTable(table).compile(dialect=engine.dialect)))
+                    for index in table.indexes:
+                        connection.execute(str(CreateIndex(index).compile(dialect=engine.dialect)))
+
+                for table in tables:
+                    columns = [column for column in table.columns if column.name in old_columns[table.name]]
+                    names = ", ".join(f'"{column.name}"' for column in columns)
+                    values = ", ".join(
+                        f'guid_convert("{column.name}")' if isinstance(column.type, GUID) else f'"{column.name}"'
+                        for column in columns
+                    )
+                    cursor = connection.execute(
+                        f'INSERT INTO "{table.name}" ({names}) '
+                        f'SELECT {values} FROM "{_OLD_PREFIX}{table.name}"'
+                    )
+                    copied[table.name] = cursor.rowcount
+
+                if "sqlite_sequence" in existing:
+                    # Keep AUTOINCREMENT counters (the outbox sequence) from reusing numbers of deleted rows
+                    for table in tables:
+                        connection.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table.name,))
+                        connection.execute(
+                            "UPDATE sqlite_sequence SET name = ? WHERE name = ?",
+                            (table.name, f"{_OLD_PREFIX}{table.name}")
+                        )
+
+                for table in reversed(tables):
+                    connection.execute(f'DROP TABLE "{_OLD_PREFIX}{table.name}"')
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+            if vacuum:
+                connection.execute("VACUUM")
+        finally:
+            # The connection goes back to the pool: leave it as the engine configured it
+            connection.execute(f"PRAGMA foreign_keys={'ON' if previous_foreign_keys else 'OFF'}")
+            connection.create_function("guid_convert", 1, None)
+            connection.isolation_level = previous_isolation
+    finally:
+        raw.close()
+
+    return copied
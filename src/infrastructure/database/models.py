@@ -1,23 +1,33 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Index, Integer, Text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.types import TypeDecorator, CHAR
+from sqlalchemy.types import TypeDecorator, BINARY, CHAR
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
+
+from ..config.settings import settings
 
 Base = declarative_base()
 
 
 class GUID(TypeDecorator):
     """Platform-independent GUID type.
-    Uses PostgreSQL's UUID type, otherwise uses CHAR(36), storing as stringified hex values.
+    Uses PostgreSQL's UUID type, otherwise uses CHAR(36), storing as stringified hex values,
+    or with `binary` (default: settings.BINARY_GUIDS) BINARY(16), storing the 16 raw bytes.
     """
     impl = CHAR
     cache_ok = True
 
+    def __init__(self, binary: Optional[bool] = None):
+        super().__init__()
+        self.binary = settings.BINARY_GUIDS if binary is None else binary
+
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
             from sqlalchemy.dialects.postgresql import UUID
             return dialect.type_descriptor(UUID())
+        elif self.binary:
+            return dialect.type_descriptor(BINARY(16))
         else:
             return dialect.type_descriptor(CHAR(36))
 
@@ -26,6 +36,10 @@ class GUID(TypeDecorator):
             return value
         elif dialect.name == 'postgresql':
             return str(value)
+        elif self.binary:
+            if not isinstance(value, uuid.UUID):
+                return uuid.UUID(value).bytes
+            return value.bytes
         else:
             if not isinstance(value, uuid.UUID):
                 return str(uuid.UUID(value))
@@ -35,6 +49,8 @@ class GUID(TypeDecorator):
     def process_result_value(self, value, dialect):
         if value is None:
             return value
+        elif isinstance(value, bytes):
+            return uuid.UUID(bytes=value)
         else:
             if not isinstance(value, uuid.UUID):
                 return uuid.UUID(value)
@@ -54,7 +70,7 @@ class TaskModel(Base):
     
     title = Column(String(200), nullable=False, index=True)
     description = Column(String(1000), nullable=True)
-    deadline = Column(DateTime, nullable=False, index=True)
+    deadline = Column(DateTime, nullable=False)
     completed = Column(Boolean, default=False, nullable=False, index=True)
     
     project_id = Column(
@@ -70,6 +86,9 @@ class TaskModel(Base):
     __table_args__ = (
         Index('ix_tasks_project_completed', 'project_id', 'completed'),
         Index('ix_tasks_completed_deadline', 'completed', 'deadline'),
+        Index('ix_tasks_created_at_id', 'created_at', 'id'),
+        Index('ix_tasks_updated_at_id', 'updated_at', 'id'),
+        Index('ix_tasks_deadline_id', 'deadline', 'id'),
     )
     
     def __repr__(self):
@@ -88,12 +107,47 @@ class ProjectModel(Base):
     )
     
     title = Column(String(200), nullable=False, index=True)
-    deadline = Column(DateTime, nullable=False, index=True)
+    deadline = Column(DateTime, nullable=False)
     completed = Column(Boolean, default=False, nullable=False, index=True)
     
+    # Denormalized counters, kept current by the task write paths
+    task_count = Column(Integer, default=0, server_default="0", nullable=False)
+    completed_count = Column(Integer, default=0, server_default="0", nullable=False)
+    
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, nullable=False, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
     
+    __table_args__ = (
+        Index('ix_projects_created_at_id', 'created_at', 'id'),
+        Index('ix_projects_updated_at_id', 'updated_at', 'id'),
+        Index('ix_projects_deadline_id', 'deadline', 'id'),
+    )
+    
     def __repr__(self):
         return f"<ProjectModel(id={self.id}, title='{self.title}', completed={self.completed})>"
 
+
+class OutboxModel(Base):
+    """SQLAlchemy ORM model for domain events awaiting delivery (transactional outbox)."""
+    __tablename__ = "outbox"
+    
+    sequence = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(GUID(), nullable=False, unique=True)
+    event_type = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)
+    occurred_at = Column(DateTime, nullable=False)
+    
+    # Set while a dispatcher holds the row; an expired lease makes it claimable again
+    claim_token = Column(String(36), nullable=True, index=True)
+    claimed_until = Column(DateTime, nullable=True)
+    
+    # Failed deliveries so far; a row that reached the limit is parked and never claimed again
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+    parked_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        {"sqlite_autoincrement": True},
+    )
+    
+    def __repr__(self):
+        return f"<OutboxModel(sequence={self.sequence}, event_type='{self.event_type}')>"
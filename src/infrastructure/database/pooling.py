@@ -0,0 +1,133 @@
+"""Connection pool configuration and live pool metrics.
+
+Engines that should show up in /health/db are registered with
+`monitor_pool`, which counts pool events (new connections, checkouts,
+invalidations) and reads current occupancy straight from the pool.
+"""
+import threading
+import time
+from typing import Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
+
+from ..config.settings import Settings
+
+_monitors: Dict[str, "PoolMonitor"] = {}
+
+
+def pool_options(url: str, config: Settings) -> dict:
+    """`create_engine` keyword arguments for the configured pool.
+
+    Size, overflow and timeout only apply where SQLAlchemy uses a queue pool
+    (PostgreSQL, sync SQLite files); in-memory SQLite and aiosqlite keep
+    their own pool classes.
+    """
+    options = {
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    }
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        if parsed.get_driver_name() == "aiosqlite" or parsed.database in (None, "", ":memory:"):
+            return options
+    options.update(
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+class PoolMonitor:
+    """Pool event counters and occupancy for one engine."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._connects = 0
+        self._checkouts = 0
+        self._invalidations = 0
+        self._saturations = 0
+        self._peak_checked_out = 0
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        pool = self.engine.pool
+        checked_out = pool.checkedout() if isinstance(pool, QueuePool) else 0
+        with self._lock:
+            self._checkouts += 1
+            self._peak_checked_out = max(self._peak_checked_out, checked_out)
+            if isinstance(pool, QueuePool) and checked_out >= pool.size() + pool._max_overflow:
+                # The next checkout will wait up to pool_timeout: the pool is too small for the load
+                self._saturations += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+    def metrics(self) -> dict:
+        """Current occupancy (queue pools only) plus counters since start."""
+        pool = self.engine.pool
+        stats = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                max_overflow=pool._max_overflow,
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+            )
+        with self._lock:
+            stats.update(
+                peak_checked_out=self._peak_checked_out,
+                connects=self._connects,
+                checkouts=self._checkouts,
+                invalidations=self._invalidations,
+                saturations=self._saturations,
+            )
+        return stats
+
+
+def monitor_pool(name: str, engine: Engine) -> PoolMonitor:
+    """Start reporting an engine's pool under `name` (for async engines pass `sync_engine`)."""
+    monitor = _monitors.get(name)
+    if monitor is None or monitor.engine is not engine:
+        monitor = _monitors[name] = PoolMonitor(engine)
+    return monitor
+
+
+def pool_metrics() -> Dict[str, dict]:
+    """Metrics of every monitored pool, by name."""
+    return {name: monitor.metrics() for name, monitor in list(_monitors.items())}
+
+
+def ping(engine: Engine) -> dict:
+    """Time a `SELECT 1` round trip on a pooled connection."""
+    start = time.perf_counter()
+    try:
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1").scalar()
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 3)}
+
+
+async def ping_async(engine: AsyncEngine) -> dict:
+    """`ping` for an async engine."""
+    start = time.perf_counter()
+    try:
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 3)}
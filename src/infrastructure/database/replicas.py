@@ -0,0 +1,48 @@
+"""Read-replica routing for sessions that serve read-only use cases.
+
+A `ReplicaRoutingSession` picks one replica when it is created (round
+robin over DATABASE_READ_URL) and sends its queries there, until it writes
+something: from the first flush or INSERT/UPDATE/DELETE on, every query of
+that session goes to the primary, so it reads its own writes.
+"""
+import itertools
+from typing import Optional, Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+class RoundRobin:
+    """Hands out engines in turn; safe to share between threads."""
+
+    def __init__(self, engines: Sequence[Engine]):
+        if not engines:
+            raise ValueError("RoundRobin needs at least one engine")
+        self.engines = list(engines)
+        self._counter = itertools.count()
+
+    def next(self) -> Engine:
+        return self.engines[next(self._counter) % len(self.engines)]
+
+
+class ReplicaRoutingSession(Session):
+    """Session that reads from a replica and sticks to the primary once it writes."""
+
+    def __init__(self, *args, primary: Engine, replicas: Optional[RoundRobin] = None, **kwargs):
+        kwargs["bind"] = primary  # sessionmaker/AsyncSession always pass their own (unset) bind
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replica = replicas.next() if replicas is not None else None
+        self.sticky = False
+
+    @property
+    def reads_from_replica(self) -> bool:
+        """Whether the next query may be answered by a (possibly lagging) replica."""
+        return self.replica is not None and not self.sticky
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if not self.sticky and (self._flushing or getattr(clause, "is_dml", False)):
+            self.sticky = True
+        if self.sticky or self.replica is None:
+            return self.primary
+        return self.replica
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from typing import List, Tuple
+from uuid import UUID, uuid4
+from sqlalchemy import case, delete, func, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from ....application.ports.repositories import OutboxRepository
+from ....domain.entities.base import DomainEvent
+from ...event_bus.event_serializer import deserialize_event, serialize_event
+from ..models import OutboxModel
+
+
+class SQLAlchemyOutboxRepository(OutboxRepository):
+    """Adapter: Implements OutboxRepository port using SQLAlchemy.
+    
+    Rows are appended inside the caller's transaction; claiming and
+    acknowledging are set-based statements, never a read-modify-write loop.
+    """
+    
+    def __init__(self, session: Session):
+        self.session = session
+    
+    def add(self, events: List[DomainEvent]) -> None:
+        """Append events with one multi-row INSERT; the sequence preserves their order."""
+        if not events:
+            return
+        
+        self.session.execute(insert(OutboxModel), [
+            {
+                "event_id": event.event_id,
+                "event_type": type(event).__name__,
+                "payload": serialize_event(event),
+                "occurred_at": event.occurred_at,
+            }
+            for event in events
+        ])
+    
+    def claim(self, batch_size: int, lease_seconds: float) -> Tuple[str, List[DomainEvent]]:
+        """Lease the oldest claimable rows with one UPDATE, then read them back by token."""
+        now = datetime.utcnow()
+        claim_token = str(uuid4())
+        claimable = or_(OutboxModel.claimed_until.is_(None), OutboxModel.claimed_until < now)
+        claimable = claimable & OutboxModel.parked_at.is_(None)
+        
+        oldest = select(OutboxModel.sequence)\
+            .where(claimable)\
+            .order_by(OutboxModel.sequence)\
+            .limit(batch_size)\
+            .scalar_subquery()
+        self.session.execute(
+            update(OutboxModel)
+            .where(OutboxModel.sequence.in_(oldest), claimable)
+            .values(claim_token=claim_token, claimed_until=now + timedelta(seconds=lease_seconds)),
+            execution_options={"synchronize_session": False}
+        )
+        
+        rows = self.session.execute(
+            select(OutboxModel.event_type, OutboxModel.payload)
+            .where(OutboxModel.claim_token == claim_token)
+            .order_by(OutboxModel.sequence)
+        ).all()
+        return claim_token, [deserialize_event(event_type, payload) for event_type, payload in rows]
+    
+    def acknowledge(self, claim_token: str) -> int:
+        """Delete a claim's rows with one DELETE."""
+        result = self.session.execute(
+            delete(OutboxModel).where(OutboxModel.claim_token == claim_token),
+            execution_options={"synchronize_session": False}
+        )
+        return result.rowcount
+    
+    def record_failures(self, claim_token: str, event_ids: List[UUID], max_attempts: int) -> int:
+        """Bump attempts and drop the claim token with one UPDATE; the lease keeps them back until it expires."""
+        if not event_ids:
+            return 0
+        
+        now = datetime.utcnow()
+        failed = (OutboxModel.claim_token == claim_token) & OutboxModel.event_id.in_(event_ids)
+        self.session.execute(
+            update(OutboxModel)
+            .where(failed)
+            .values(
+                claim_token=None,
+                attempts=OutboxModel.attempts + 1,
+                parked_at=case((OutboxModel.attempts + 1 >= max_attempts, now), else_=None)
+            ),
+            execution_options={"synchronize_session": False}
+        )
+        return self.session.scalar(
+            select(func.count()).select_from(OutboxModel)
+            .where(OutboxModel.event_id.in_(event_ids), OutboxModel.attempts >= max_attempts)
+        )
+    
+    def pending_count(self) -> int:
+        """Count rows still waiting in the outbox."""
+        return self.session.scalar(
+            select(func.count()).select_from(OutboxModel).where(OutboxModel.parked_at.is_(None))
+        )
+    
+    def parked_count(self) -> int:
+        """Count rows parked after too many failed deliveries."""
+        return self.session.scalar(
+            select(func.count()).select_from(OutboxModel).where(OutboxModel.parked_at.isnot(None))
+        )
@@ -0,0 +1,98 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from ....domain.exceptions.domain_exceptions import InvalidCursorError
+
+SORT_FIELDS = ("created_at", "updated_at", "deadline")
+
+
+def encode_cursor(sort: str, value: datetime, last_id: UUID) -> str:
+    """Encode the position of the last row of a page as an opaque, URL-safe token."""
+    payload = json.dumps([sort, value.isoformat(), str(last_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_cursor` for the same sort order."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        position = (datetime.fromisoformat(value), UUID(last_id))
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidCursorError("Invalid pagination cursor")
+
+    if cursor_sort != sort:
+        raise InvalidCursorError(
+            f"Cursor was issued for sort '{cursor_sort}', not '{sort}'"
+        )
+    return position
+
+
+def _sort_column(model, sort: str):
+    field_name = sort.lstrip("-")
+    if field_name not in SORT_FIELDS:
+        raise ValueError(f"Unsupported sort key: {sort}")
+    return getattr(model, field_name)
+
+
+def order_by_sort(query: Query, model, sort: str) -> Query:
+    """Order by (sort column, id), descending when the key is prefixed with '-'."""
+    column = _sort_column(model, sort)
+    if sort.startswith("-"):
+        return query.order_by(column.desc(), model.id.desc())
+    return query.order_by(column, model.id)
+
+
+def paginate(
+    query: Query,
+    model,
+    sort: str,
+    limit: Optional[int],
+    after: Optional[str] = None
+) -> Tuple[List, Optional[str]]:
+    """Apply a keyset seek on (sort column, id) and return one page of rows plus the next cursor.
+
+    The WHERE clause only ever compares against the last row seen, so the database
+    walks the (sort column, id) index from that point instead of skipping an OFFSET.
+    The plain bound on the sort column is implied by the OR but is what lets the
+    planner start the index walk there rather than at the first row.
+    With `limit=None` every remaining row is returned and there is no next cursor.
+    """
+    field_name = sort.lstrip("-")
+    descending = sort.startswith("-")
+    column = _sort_column(model, sort)
+
+    if after:
+        value, last_id = decode_cursor(after, sort)
+        if descending:
+            query = query.filter(column <= value, or_(
+                column < value,
+                and_(column == value, model.id < last_id)
+            ))
+        else:
+            query = query.filter(column >= value, or_(
+                column > value,
+                and_(column == value, model.id > last_id)
+            ))
+
+    query = order_by_sort(query, model, sort)
+
+    if limit is None:
+        return query.all(), None
+
+    rows = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, getattr(last, field_name), last.id)
+
+    return rows, next_cursor
@@ -1,42 +1,32 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from uuid import UUID
+from sqlalchemy import Integer, bindparam, func, or_, select, update
 from sqlalchemy.orm import Session
-from datetime import timezone
+from sqlalchemy.orm.util import identity_key
+from datetime import datetime, timezone
 
-from ....application.ports.repositories import ProjectRepository
+from ....application.ports.repositories import Page, ProjectCounterDelta, ProjectRepository
 from ....domain.entities.project import Project
-from ..models import ProjectModel
+from ..models import ProjectModel, TaskModel
+from .pagination import paginate
+from .upsert import upsert
 
 
 class SQLAlchemyProjectRepository(ProjectRepository):
-    """Adapter: Implements ProjectRepository port using SQLAlchemy."""
+    """Adapter: Implements ProjectRepository port using SQLAlchemy.
+    
+    Writes are flushed but never committed; the surrounding unit of work owns the transaction.
+    """
     
     def __init__(self, session: Session):
         self.session = session
     
     def save(self, project: Project) -> Project:
-        """Save or update a project."""
-        project_model = self.session.query(ProjectModel)\
-            .filter_by(id=project.id).first()
-        
-        if project_model:
-            project_model.title = project.title
-            project_model.deadline = project.deadline
-            project_model.completed = project.completed
-            project_model.updated_at = project.updated_at
-        else:
-            project_model = ProjectModel(
-                id=project.id,
-                title=project.title,
-                deadline=project.deadline,
-                completed=project.completed,
-                created_at=project.created_at,
-                updated_at=project.updated_at
-            )
-            self.session.add(project_model)
-        
-        self.session.commit()
-        return self._to_domain(project_model)
+        """Save or update a project with one upsert of its changed fields."""
+        if project.dirty_fields:
+            upsert(self.session, ProjectModel, self._to_row(project), project.dirty_fields)
+            project.mark_clean()
+        return project
     
     def find_by_id(self, project_id: UUID) -> Optional[Project]:
         """Retrieve a project by its ID."""
@@ -44,6 +34,24 @@ class SQLAlchemyProjectRepository(ProjectRepository):
             .filter_by(id=project_id).first()
         return self._to_domain(project_model) if project_model else None
     
+    def find_updated_at(self, project_id: UUID) -> Optional[datetime]:
+        """Read one project's `updated_at` by primary key, without loading the row."""
+        updated_at = self.session.execute(
+            select(ProjectModel.updated_at).where(ProjectModel.id == project_id)
+        ).scalar_one_or_none()
+        if updated_at is None:
+            return None
+        return updated_at.replace(tzinfo=timezone.utc) if updated_at.tzinfo is None else updated_at
+    
+    def find_by_ids(self, project_ids: List[UUID]) -> List[Project]:
+        """Retrieve many projects with a single IN lookup."""
+        if not project_ids:
+            return []
+        project_models = self.session.query(ProjectModel)\
+            .filter(ProjectModel.id.in_(set(project_ids)))\
+            .all()
+        return [self._to_domain(pm) for pm in project_models]
+    
     def find_all(self) -> List[Project]:
         """Retrieve all projects."""
         project_models = self.session.query(ProjectModel)\
@@ -51,16 +59,148 @@ class SQLAlchemyProjectRepository(ProjectRepository):
             .all()
         return [self._to_domain(pm) for pm in project_models]
     
+    def find_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        sort: str = "-created_at"
+    ) -> Page[Project]:
+        """Retrieve one keyset page of projects."""
+        project_models, next_cursor = paginate(
+            self.session.query(ProjectModel), ProjectModel, sort, limit, after
+        )
+        return Page(
+            items=[self._to_domain(pm) for pm in project_models],
+            next_cursor=next_cursor
+        )
+    
+    def complete_if_no_open_tasks(self, project_id: UUID) -> Optional[datetime]:
+        """Complete a project with one conditional UPDATE guarded by EXISTS subqueries.
+        
+        The guard is evaluated by the database as part of the write, so two
+        workers finishing the last tasks concurrently complete the project once.
+        """
+        tasks_of_project = select(TaskModel.id).where(TaskModel.project_id == project_id)
+        open_tasks = tasks_of_project.where(TaskModel.completed == False)
+        completed_at = datetime.now(timezone.utc)
+        
+        result = self.session.execute(
+            update(ProjectModel)
+            .where(
+                ProjectModel.id == project_id,
+                ProjectModel.completed == False,
+                tasks_of_project.exists(),
+                ~open_tasks.exists()
+            )
+            .values(completed=True, updated_at=completed_at),
+            execution_options={"synchronize_session": False}
+        )
+        if result.rowcount != 1:
+            return None
+        
+        self._expire_cached([project_id])
+        return completed_at
+    
+    def adjust_counters(self, deltas: Dict[UUID, ProjectCounterDelta]) -> None:
+        """Apply counter deltas with one executemany UPDATE.
+        
+        Counters are incremented in SQL (`task_count = task_count + :delta`) rather
+        than read and written back, so concurrent writers cannot lose updates.
+        `updated_at` is kept as is: task writes are not project changes, and the
+        column drives Last-Modified, ETags and `sort=updated_at` pages.
+        """
+        rows = [
+            {
+                "p_id": project_id,
+                "d_tasks": delta.tasks,
+                "d_completed": delta.completed,
+            }
+            for project_id, delta in deltas.items() if delta
+        ]
+        if not rows:
+            return
+        
+        projects = ProjectModel.__table__
+        stmt = update(projects)\
+            .where(projects.c.id == bindparam("p_id"))\
+            .values(
+                task_count=projects.c.task_count + bindparam("d_tasks", type_=Integer),
+                completed_count=projects.c.completed_count + bindparam("d_completed", type_=Integer),
+                updated_at=projects.c.updated_at  # suppress the column's onupdate
+            )
+        self.session.connection(bind_arguments={"clause": stmt}).execute(stmt, rows)
+        self._expire_cached([row["p_id"] for row in rows])
+    
+    def reconcile_counters(self) -> int:
+        """Rebuild all counters with one UPDATE of correlated COUNT subqueries.
+        
+        Only projects whose stored counters disagree with the recount are written.
+        """
+        def count(*conditions):
+            return select(func.count(TaskModel.id))\
+                .where(TaskModel.project_id == ProjectModel.id, *conditions)\
+                .scalar_subquery()
+        
+        task_count = count()
+        completed_count = count(TaskModel.completed == True)
+        
+        result = self.session.execute(
+            update(ProjectModel)
+            .where(or_(
+                ProjectModel.task_count != task_count,
+                ProjectModel.completed_count != completed_count
+            ))
+            .values(
+                task_count=task_count,
+                completed_count=completed_count,
+                updated_at=ProjectModel.updated_at
+            ),
+            execution_options={"synchronize_session": False}
+        )
+        
+        for cached in list(self.session.identity_map.values()):
+            if isinstance(cached, ProjectModel):
+                self.session.expire(cached)
+        return result.rowcount
+    
+    def stream(self, batch_size: int = 1000) -> Iterator[Project]:
+        """Yield all projects newest first, fetching `batch_size` rows at a time."""
+        rows = self.session.query(ProjectModel)\
+            .order_by(ProjectModel.created_at.desc(), ProjectModel.id.desc())\
+            .yield_per(batch_size)
+        for project_model in rows:
+            yield self._to_domain(project_model)
+    
     def delete(self, project_id: UUID) -> bool:
         """Delete a project by ID."""
         project_model = self.session.query(ProjectModel)\
             .filter_by(id=project_id).first()
         if project_model:
             self.session.delete(project_model)
-            self.session.commit()
+            self.session.flush()
             return True
         return False
     
+    def _expire_cached(self, project_ids: List[UUID]) -> None:
+        """Drop cached ORM copies of rows changed by a statement that bypassed the ORM."""
+        for project_id in project_ids:
+            cached = self.session.identity_map.get(identity_key(ProjectModel, project_id))
+            if cached is not None:
+                self.session.expire(cached)
+    
+    def _to_row(self, project: Project) -> dict:
+        """Convert domain entity to a column/value mapping."""
+        return {
+            "id": project.id,
+            "title": project.title,
+            "deadline": project.deadline,
+            "completed": project.completed,
+            "task_count": project.task_count,
+            "completed_count": project.completed_count,
+            "created_at": project.created_at,
+            "updated_at": project.updated_at,
+        }
+    
     def _to_domain(self, model: ProjectModel) -> Project:
         """Convert database model to domain entity."""
         # Ensure timezone-aware datetimes
@@ -76,11 +216,15 @@ class SQLAlchemyProjectRepository(ProjectRepository):
         if updated_at.tzinfo is None:
             updated_at = updated_at.replace(tzinfo=timezone.utc)
         
-        return Project(
+        project = Project(
             id=model.id,
             title=model.title,
             deadline=deadline,
             completed=model.completed,
             created_at=created_at,
-            updated_at=updated_at
+            updated_at=updated_at,
+            task_count=model.task_count,
+            completed_count=model.completed_count
         )
+        project.mark_clean()
+        return project
@@ -1,56 +1,203 @@
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
+from sqlalchemy import and_, func, insert, not_, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
 from datetime import datetime, timezone
 
-from ....application.ports.repositories import TaskRepository
+from ....application.ports.repositories import Page, TaskQuery, TaskRepository
 from ....domain.entities.task import Task
 from ..models import TaskModel
+from .pagination import order_by_sort, paginate
+from .upsert import upsert
 
 
 class SQLAlchemyTaskRepository(TaskRepository):
-    """Adapter: Implements TaskRepository port using SQLAlchemy."""
+    """Adapter: Implements TaskRepository port using SQLAlchemy.
+    
+    Writes are flushed but never committed; the surrounding unit of work owns the transaction.
+    """
     
     def __init__(self, session: Session):
         self.session = session
     
     def save(self, task: Task) -> Task:
-        """Save or update a task."""
-        task_model = self.session.query(TaskModel).filter_by(id=task.id).first()
+        """Save or update a task with one upsert of its changed fields."""
+        if task.dirty_fields:
+            upsert(self.session, TaskModel, self._to_row(task), task.dirty_fields)
+            task.mark_clean()
+        return task
+    
+    def save_many(self, tasks: List[Task]) -> List[Task]:
+        """Insert new tasks with multi-row INSERT statements."""
+        if not tasks:
+            return []
         
-        if task_model:
-            task_model.title = task.title
-            task_model.description = task.description
-            task_model.deadline = task.deadline
-            task_model.completed = task.completed
-            task_model.project_id = task.project_id
-            task_model.updated_at = task.updated_at
-        else:
-            task_model = TaskModel(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                deadline=task.deadline,
-                completed=task.completed,
-                project_id=task.project_id,
-                created_at=task.created_at,
-                updated_at=task.updated_at
+        self.session.execute(insert(TaskModel), [self._to_row(task) for task in tasks])
+        for task in tasks:
+            task.mark_clean()
+        return tasks
+    
+    def set_completed(self, task_ids: List[UUID], completed: bool) -> List[Task]:
+        """Flip the completion flag of many tasks with one UPDATE, returning those that changed."""
+        if not task_ids:
+            return []
+        
+        task_models = self._update_returning(
+            [TaskModel.id.in_(set(task_ids)), TaskModel.completed != completed],
+            {"completed": completed, "updated_at": datetime.now(timezone.utc)}
+        )
+        return [self._to_domain(tm) for tm in task_models]
+    
+    def has_open_tasks(self, project_id: UUID) -> bool:
+        """Probe ix_tasks_project_completed for one open task instead of loading the project's tasks."""
+        return self.session.scalar(
+            select(
+                select(TaskModel.id)
+                .where(TaskModel.project_id == project_id, TaskModel.completed == False)
+                .exists()
             )
-            self.session.add(task_model)
+        )
+    
+    def unlink_project(self, project_id: UUID, return_ids: bool = False) -> List[UUID]:
+        """Detach every task from a project with one UPDATE.
+        
+        IDs are only collected when asked for, via RETURNING where the dialect
+        supports it and a preceding id-only SELECT otherwise.
+        """
+        conditions = [TaskModel.project_id == project_id]
+        stmt = update(TaskModel).where(*conditions).values(
+            project_id=None,
+            updated_at=datetime.now(timezone.utc)
+        )
+        options = {"synchronize_session": False}
+        
+        if not return_ids:
+            self.session.execute(stmt, execution_options=options)
+            self._expire_cached_for_project(project_id)
+            return []
         
-        self.session.commit()
-        return self._to_domain(task_model)
+        if self.session.get_bind().dialect.update_returning:
+            unlinked = list(self.session.scalars(
+                stmt.returning(TaskModel.id), execution_options=options
+            ))
+        else:
+            unlinked = list(self.session.scalars(select(TaskModel.id).where(*conditions)))
+            self.session.execute(stmt, execution_options=options)
+        
+        self._expire_cached(unlinked)
+        return unlinked
+    
+    def clamp_deadlines(
+        self,
+        project_id: UUID,
+        max_deadline: datetime
+    ) -> List[Tuple[UUID, datetime]]:
+        """Pull every project task due after `max_deadline` back to it with one UPDATE.
+        
+        The (id, deadline) pairs are read first because RETURNING only yields
+        post-update values; RETURNING then confirms which rows were actually
+        moved where the dialect supports it.
+        """
+        conditions = [TaskModel.project_id == project_id, TaskModel.deadline > max_deadline]
+        old_deadlines = dict(self.session.execute(
+            select(TaskModel.id, TaskModel.deadline).where(*conditions)
+        ).all())
+        if not old_deadlines:
+            return []
+        
+        stmt = update(TaskModel).where(*conditions).values(
+            deadline=max_deadline,
+            updated_at=datetime.now(timezone.utc)
+        )
+        options = {"synchronize_session": False}
+        if self.session.get_bind().dialect.update_returning:
+            moved = list(self.session.scalars(
+                stmt.returning(TaskModel.id), execution_options=options
+            ))
+        else:
+            self.session.execute(stmt, execution_options=options)
+            moved = list(old_deadlines)
+        
+        self._expire_cached(moved)
+        return [
+            (task_id, self._as_utc(old_deadlines.get(task_id, max_deadline)))
+            for task_id in moved
+        ]
     
     def find_by_id(self, task_id: UUID) -> Optional[Task]:
         """Retrieve a task by its ID."""
         task_model = self.session.query(TaskModel).filter_by(id=task_id).first()
         return self._to_domain(task_model) if task_model else None
     
+    def find_updated_at(self, task_id: UUID) -> Optional[datetime]:
+        """Read one task's `updated_at` by primary key, without loading the row."""
+        updated_at = self.session.execute(
+            select(TaskModel.updated_at).where(TaskModel.id == task_id)
+        ).scalar_one_or_none()
+        return self._as_utc(updated_at) if updated_at else None
+    
+    def project_tasks_version(self, project_id: UUID) -> Tuple[int, Optional[datetime]]:
+        """Count a project's tasks and take their latest `updated_at` from ix_tasks_project_completed."""
+        count, latest = self.session.execute(
+            select(func.count(), func.max(TaskModel.updated_at))
+            .where(TaskModel.project_id == project_id)
+        ).one()
+        return count, self._as_utc(latest) if latest else None
+    
     def find_all(self) -> List[Task]:
         """Retrieve all tasks."""
         task_models = self.session.query(TaskModel).all()
         return [self._to_domain(tm) for tm in task_models]
     
+    def find(self, query: TaskQuery) -> Page[Task]:
+        """Find tasks matching a query spec with a single SQL statement."""
+        task_models, next_cursor = paginate(
+            self._filtered(query),
+            TaskModel,
+            query.sort,
+            query.limit,
+            query.after
+        )
+        return Page(
+            items=[self._to_domain(tm) for tm in task_models],
+            next_cursor=next_cursor
+        )
+    
+    def stream(self, query: TaskQuery, batch_size: int = 1000) -> Iterator[Task]:
+        """Yield tasks matching a query spec, fetching `batch_size` rows at a time."""
+        rows = order_by_sort(self._filtered(query), TaskModel, query.sort)\
+            .yield_per(batch_size)
+        for task_model in rows:
+            yield self._to_domain(task_model)
+    
+    def _filtered(self, query: TaskQuery):
+        """Build the filtered (unordered) SELECT for a query spec."""
+        conditions = []
+        
+        if query.project_id is not None:
+            conditions.append(TaskModel.project_id == query.project_id)
+        if query.completed is not None:
+            conditions.append(TaskModel.completed == query.completed)
+        if query.overdue is not None:
+            is_overdue = and_(
+                TaskModel.completed == False,
+                TaskModel.deadline < datetime.utcnow()
+            )
+            conditions.append(is_overdue if query.overdue else not_(is_overdue))
+        
+        for column, lower, upper in (
+            (TaskModel.deadline, query.deadline_from, query.deadline_to),
+            (TaskModel.created_at, query.created_from, query.created_to),
+            (TaskModel.updated_at, query.updated_from, query.updated_to),
+        ):
+            if lower is not None:
+                conditions.append(column >= lower)
+            if upper is not None:
+                conditions.append(column <= upper)
+        
+        return self.session.query(TaskModel).filter(*conditions)
+    
     def find_by_project_id(self, project_id: UUID) -> List[Task]:
         """Find all tasks belonging to a specific project."""
         task_models = self.session.query(TaskModel)\
@@ -79,15 +226,98 @@ class SQLAlchemyTaskRepository(TaskRepository):
             .all()
         return [self._to_domain(tm) for tm in task_models]
     
+    def count_overdue_by_project(self, project_ids: List[UUID]) -> Dict[UUID, int]:
+        """Count open tasks past their deadline per project with one grouped query."""
+        if not project_ids:
+            return {}
+        rows = self.session.execute(
+            select(TaskModel.project_id, func.count(TaskModel.id))
+            .where(
+                TaskModel.project_id.in_(project_ids),
+                TaskModel.completed == False,
+                TaskModel.deadline < datetime.utcnow()
+            )
+            .group_by(TaskModel.project_id)
+        ).all()
+        return dict(rows)
+    
+    def find_due_between(self, start: datetime, end: datetime) -> List[Task]:
+        """Find open tasks due in (start, end], soonest first.
+        
+        A range scan of ix_tasks_completed_deadline, so the cost follows the
+        number of tasks due in the window rather than the table size.
+        """
+        task_models = self.session.query(TaskModel)\
+            .filter(
+                TaskModel.completed == False,
+                TaskModel.deadline > start,
+                TaskModel.deadline <= end
+            )\
+            .order_by(TaskModel.deadline)\
+            .all()
+        return [self._to_domain(tm) for tm in task_models]
+    
     def delete(self, task_id: UUID) -> bool:
         """Delete a task by ID."""
         task_model = self.session.query(TaskModel).filter_by(id=task_id).first()
         if task_model:
             self.session.delete(task_model)
-            self.session.commit()
+            self.session.flush()
             return True
         return False
     
+    def _update_returning(self, conditions: list, values: dict) -> List[TaskModel]:
+        """Run a set-based UPDATE and return the affected rows.
+        
+        Uses UPDATE ... RETURNING where the dialect supports it; otherwise the
+        matching IDs are selected first so the result is the same.
+        """
+        if self.session.get_bind().dialect.update_returning:
+            return list(self.session.scalars(
+                update(TaskModel).where(*conditions).values(**values).returning(TaskModel)
+            ))
+        
+        ids = list(self.session.scalars(select(TaskModel.id).where(*conditions)))
+        if not ids:
+            return []
+        self.session.execute(
+            update(TaskModel).where(TaskModel.id.in_(ids)).values(**values)
+        )
+        return list(self.session.scalars(
+            select(TaskModel).where(TaskModel.id.in_(ids))
+        ))
+    
+    def _expire_cached(self, task_ids: List[UUID]) -> None:
+        """Drop cached ORM copies of rows changed by a statement that bypassed the ORM."""
+        for task_id in task_ids:
+            cached = self.session.identity_map.get(identity_key(TaskModel, task_id))
+            if cached is not None:
+                self.session.expire(cached)
+    
+    def _expire_cached_for_project(self, project_id: UUID) -> None:
+        """Drop cached ORM copies of a project's tasks when their IDs are unknown."""
+        for cached in list(self.session.identity_map.values()):
+            if isinstance(cached, TaskModel) and cached.project_id == project_id:
+                self.session.expire(cached)
+    
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        """Treat naive datetimes read back from the database as UTC."""
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+    
+    def _to_row(self, task: Task) -> dict:
+        """Convert domain entity to a column/value mapping."""
+        return {
+            "id": task.id,
+            "title": task.title,
+            "description": task.description,
+            "deadline": task.deadline,
+            "completed": task.completed,
+            "project_id": task.project_id,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+    
     def _to_domain(self, model: TaskModel) -> Task:
         """Convert database model to domain entity."""
         # Ensure timezone-aware datetimes
@@ -103,7 +333,7 @@ class SQLAlchemyTaskRepository(TaskRepository):
         if updated_at.tzinfo is None:
             updated_at = updated_at.replace(tzinfo=timezone.utc)
         
-        return Task(
+        task = Task(
             id=model.id,
             title=model.title,
             description=model.description,
@@ -113,3 +343,5 @@ class SQLAlchemyTaskRepository(TaskRepository):
             created_at=created_at,
             updated_at=updated_at
         )
+        task.mark_clean()
+        return task
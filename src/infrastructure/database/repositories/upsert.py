@@ -0,0 +1,44 @@
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+
+@lru_cache(maxsize=256)
+def _upsert_statement(model, dialect: str, update_fields: FrozenSet[str]):
+    """Build (once per model/dialect/field set) an upsert that takes row values as parameters."""
+    if dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    stmt = insert(model.__table__)
+    if update_fields:
+        return stmt.on_conflict_do_update(
+            index_elements=[model.__table__.c.id],
+            set_={field: stmt.excluded[field] for field in sorted(update_fields)}
+        )
+    return stmt.on_conflict_do_nothing(index_elements=[model.__table__.c.id])
+
+
+def upsert(session: Session, model, values: Dict, update_fields: Iterable[str]) -> None:
+    """Write one row with a single INSERT ... ON CONFLICT (id) DO UPDATE.
+
+    The INSERT carries every column so new rows are complete, but on conflict
+    only `update_fields` are overwritten. Dialects without native upsert fall
+    back to `Session.merge`, which costs an extra SELECT.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect not in ("sqlite", "postgresql"):
+        session.merge(model(**values))
+        return
+
+    stmt = _upsert_statement(model, dialect, frozenset(update_fields) - {"id"})
+    # Passing the statement lets routing sessions (read replicas) send the write to the primary
+    session.connection(bind_arguments={"clause": stmt}).execute(stmt, values)
+
+    # The statement bypasses the ORM, so drop any cached copy of the row.
+    cached = session.identity_map.get(identity_key(model, values["id"]))
+    if cached is not None:
+        session.expire(cached)
@@ -0,0 +1,61 @@
+"""Additive schema upgrades for databases created by an older version of the models.
+
+`create_all` only creates missing tables. Columns and indexes added to an
+existing model later are created here: a missing column is added with
+`ALTER TABLE ... ADD COLUMN`, which SQLite and PostgreSQL both do in place
+as long as the column is nullable or has a server default, and a missing
+index is created by name. Nothing is ever dropped or altered.
+"""
+import logging
+from typing import List
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import Column
+
+from .models import Base
+
+logger = logging.getLogger(__name__)
+
+
+def _column_ddl(column: Column, engine: Engine) -> str:
+    ddl = f"{column.name} {column.type.compile(dialect=engine.dialect)}"
+    if column.server_default is not None:
+        ddl += f" DEFAULT {column.server_default.arg}"
+    elif not column.nullable:
+        raise RuntimeError(
+            f"Cannot add NOT NULL column {column.table.name}.{column.name} "
+            "without a server default to an existing table"
+        )
+    if not column.nullable:
+        ddl += " NOT NULL"
+    return ddl
+
+
+def upgrade_schema(engine: Engine) -> List[str]:
+    """Add the model columns and indexes an existing database lacks; returns what was added."""
+    inspector = inspect(engine)
+    added: List[str] = []
+
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    connection.exec_driver_sql(
+                        f"ALTER TABLE {table.name} ADD COLUMN {_column_ddl(column, engine)}"
+                    )
+                    added.append(f"{table.name}.{column.name}")
+
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(connection)
+                    added.append(index.name)
+
+    for name in added:
+        logger.info(f"Schema upgrade: added {name}")
+    return added
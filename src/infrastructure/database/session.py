@@ -1,13 +1,20 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from ..config.settings import settings
+from .pooling import monitor_pool, pool_options
+from .replicas import ReplicaRoutingSession, RoundRobin
+from .sqlite_profile import apply_sqlite_profile, is_sqlite, is_sqlite_file, sqlite_pragmas
 
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    pool_pre_ping=True,
-    echo=settings.LOG_LEVEL == "DEBUG"
+    echo=settings.LOG_LEVEL == "DEBUG",
+    **pool_options(settings.DATABASE_URL, settings)
 )
+monitor_pool("primary", engine)
+
+if is_sqlite(settings.DATABASE_URL):
+    apply_sqlite_profile(engine, sqlite_pragmas(settings))
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -15,9 +22,64 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Mutations run on their own engine: on a SQLite file with SQLITE_SINGLE_WRITER that is
+# one pooled connection taking the write lock at BEGIN, elsewhere simply the main engine
+if settings.SQLITE_SINGLE_WRITER and is_sqlite_file(settings.DATABASE_URL):
+    writer_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        echo=settings.LOG_LEVEL == "DEBUG",
+        **dict(
+            pool_options(settings.DATABASE_URL, settings),
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=settings.SQLITE_WRITER_TIMEOUT
+        )
+    )
+    apply_sqlite_profile(writer_engine, sqlite_pragmas(settings), begin_immediate=True)
+    monitor_pool("writer", writer_engine)
+else:
+    writer_engine = engine
+
+WriterSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=writer_engine
+)
+
+
+def _replica_engine(url: str):
+    replica = create_engine(
+        url,
+        connect_args={"check_same_thread": False} if is_sqlite(url) else {},
+        echo=settings.LOG_LEVEL == "DEBUG",
+        **pool_options(url, settings)
+    )
+    if is_sqlite(url):
+        apply_sqlite_profile(replica, sqlite_pragmas(settings))
+    return replica
+
+
+read_engines = [_replica_engine(url) for url in settings.DATABASE_READ_URL]
+for index, read_engine in enumerate(read_engines):
+    monitor_pool(f"replica_{index}", read_engine)
+
+# Read-only use cases: a replica per session, round robin, back on the primary after a write
+if read_engines:
+    ReadSessionLocal = sessionmaker(
+        class_=ReplicaRoutingSession,
+        autocommit=False,
+        autoflush=False,
+        primary=engine,
+        replicas=RoundRobin(read_engines)
+    )
+else:
+    ReadSessionLocal = SessionLocal
+
 
 def init_db():
-    """Initialize database - create all tables."""
+    """Initialize database - create missing tables, then missing columns and indexes."""
     from .models import Base
+    from .schema_upgrade import upgrade_schema
     Base.metadata.create_all(bind=engine)
-
+    upgrade_schema(engine)
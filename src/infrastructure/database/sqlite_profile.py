@@ -0,0 +1,64 @@
+"""SQLite connection profile applied through engine connect events.
+
+Every new DBAPI connection gets the configured pragmas (WAL journal,
+relaxed fsync, larger page cache, memory-mapped I/O, busy timeout, foreign
+keys). A writer engine additionally starts each transaction with
+`BEGIN IMMEDIATE`: the write lock is taken up front, so two transactions
+never both read and then fail to upgrade ("database is locked"), and with a
+pool of one connection concurrent mutations queue in the process instead
+of retrying inside SQLite.
+"""
+from typing import List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+
+from ..config.settings import Settings
+
+
+def is_sqlite(url: str) -> bool:
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def is_sqlite_file(url: str) -> bool:
+    """A SQLite database other connections can share (not `:memory:`)."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def sqlite_pragmas(config: Settings) -> List[Tuple[str, object]]:
+    """The (pragma, value) pairs of the configured profile, in the order they are applied."""
+    return [
+        ("busy_timeout", config.SQLITE_BUSY_TIMEOUT_MS),
+        ("journal_mode", config.SQLITE_JOURNAL_MODE),
+        ("synchronous", config.SQLITE_SYNCHRONOUS),
+        ("cache_size", -config.SQLITE_CACHE_SIZE_KB),  # negative values are KiB, not pages
+        ("mmap_size", config.SQLITE_MMAP_SIZE),
+        ("temp_store", config.SQLITE_TEMP_STORE),
+        ("foreign_keys", "ON" if config.SQLITE_FOREIGN_KEYS else "OFF"),
+    ]
+
+
+def apply_sqlite_profile(
+    engine: Engine,
+    pragmas: List[Tuple[str, object]],
+    begin_immediate: bool = False
+) -> None:
+    """Run `pragmas` on every new connection of a (sync, or an async engine's `sync_engine`) engine."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        if begin_immediate:
+            # Stop the driver from issuing its own deferred BEGIN; `_on_begin` emits ours
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas:
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    if begin_immediate:
+        @event.listens_for(engine, "begin")
+        def _on_begin(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
@@ -0,0 +1,98 @@
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ...application.ports.unit_of_work import UnitOfWork
+from ...domain.entities.base import DomainEvent
+from ..cache.caching_repositories import CachingProjectRepository, CachingTaskRepository
+from ..cache.entity_cache import EntityCache
+from .repositories.outbox_repository import SQLAlchemyOutboxRepository
+from .repositories.project_repository import SQLAlchemyProjectRepository
+from .repositories.task_repository import SQLAlchemyTaskRepository
+
+
+class SQLAlchemyUnitOfWork(UnitOfWork):
+    """Adapter: Implements UnitOfWork port on top of one SQLAlchemy session.
+    
+    With `use_outbox` recorded events are inserted into the outbox table just
+    before the commit, so they become durable atomically with the change that
+    produced them, and `on_outbox_commit` (e.g. a dispatcher's wake-up) is
+    called afterwards; otherwise they are handed back by `collect_events`.
+    
+    With a `cache` the task and project repositories are wrapped in caching
+    decorators, and the rows they wrote are invalidated again once the
+    transaction commits or rolls back. Lookups are only served from the
+    cache with `cache_reads`, for units of work that do not write: the cache
+    is per process, so a cached row may predate another worker's write, and
+    writes derive completion flags and counter deltas from what they load.
+    A session that reads from a replica uses the cache but never fills it.
+    """
+    
+    def __init__(
+        self,
+        session: Session,
+        close_on_exit: bool = False,
+        use_outbox: bool = False,
+        on_outbox_commit: Optional[Callable[[], None]] = None,
+        cache: Optional[EntityCache] = None,
+        cache_reads: bool = False
+    ):
+        self.session = session
+        self.close_on_exit = close_on_exit
+        self.use_outbox = use_outbox
+        self.on_outbox_commit = on_outbox_commit
+        self.tasks = SQLAlchemyTaskRepository(session)
+        self.projects = SQLAlchemyProjectRepository(session)
+        self.outbox = SQLAlchemyOutboxRepository(session)
+        self.cache = cache
+        if cache is not None:
+            self.tasks = CachingTaskRepository(self.tasks, cache, self._reads_from_primary, cache_reads)
+            self.projects = CachingProjectRepository(
+                self.projects, cache, self._reads_from_primary, cache_reads
+            )
+        self._recorded: List[DomainEvent] = []
+        self._committed: List[DomainEvent] = []
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        super().__exit__(exc_type, exc_value, traceback)
+        if self.close_on_exit:
+            self.session.close()
+    
+    def commit(self) -> None:
+        """Commit the session transaction, together with any outboxed events."""
+        outboxed = self.use_outbox and bool(self._recorded)
+        if outboxed:
+            self.outbox.add(self._recorded)
+            self._recorded = []
+        
+        self.session.commit()
+        self._release_cache()
+        self._committed.extend(self._recorded)
+        self._recorded = []
+        
+        if outboxed and self.on_outbox_commit:
+            self.on_outbox_commit()
+    
+    def rollback(self) -> None:
+        """Roll back the session transaction and forget recorded events."""
+        self._recorded = []
+        self.session.rollback()
+        self._release_cache()
+    
+    def record(self, *events: DomainEvent) -> None:
+        """Stage domain events to go out with the next commit."""
+        self._recorded.extend(events)
+    
+    def collect_events(self) -> List[DomainEvent]:
+        """Hand over committed events that were not written to the outbox."""
+        events, self._committed = self._committed, []
+        return events
+    
+    def _reads_from_primary(self) -> bool:
+        return not getattr(self.session, "reads_from_replica", False)
+    
+    def _release_cache(self) -> None:
+        """Invalidate the cached rows written in the transaction that just ended."""
+        if self.cache is not None:
+            self.tasks.release()
+            self.projects.release()
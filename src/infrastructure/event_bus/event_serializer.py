@@ -0,0 +1,62 @@
+import json
+from dataclasses import fields
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Type, Union, get_args, get_origin, get_type_hints
+from uuid import UUID
+
+from ...domain.entities.base import DomainEvent
+from ...domain.events import project_events, task_events  # noqa: F401 - registers event types
+
+
+@lru_cache()
+def event_types() -> Dict[str, Type[DomainEvent]]:
+    """Every concrete DomainEvent subclass, by class name."""
+    registry = {}
+    pending = list(DomainEvent.__subclasses__())
+    while pending:
+        event_type = pending.pop()
+        registry[event_type.__name__] = event_type
+        pending.extend(event_type.__subclasses__())
+    return registry
+
+
+def serialize_event(event: DomainEvent) -> str:
+    """Encode an event's fields, including its id and timestamp, as JSON."""
+    return json.dumps({
+        f.name: _encode(getattr(event, f.name)) for f in fields(event)
+    }, separators=(",", ":"))
+
+
+def deserialize_event(event_type: str, payload: str) -> DomainEvent:
+    """Rebuild an event from `serialize_event` output, keeping its original id and timestamp."""
+    cls = event_types()[event_type]
+    data = json.loads(payload)
+    hints = get_type_hints(cls)
+
+    values = {f.name: _decode(hints[f.name], data.get(f.name)) for f in fields(cls)}
+    event = cls(**{f.name: values[f.name] for f in fields(cls) if f.init})
+    for f in fields(cls):
+        if not f.init:
+            setattr(event, f.name, values[f.name])
+    return event
+
+
+def _encode(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _decode(hint, value):
+    if value is None:
+        return None
+    if get_origin(hint) is Union:
+        hint = next(arg for arg in get_args(hint) if arg is not type(None))
+    if hint is UUID:
+        return UUID(value)
+    if hint is datetime:
+        return datetime.fromisoformat(value)
+    return value
@@ -1,35 +1,318 @@
-from typing import Dict, List, Callable, Type
+from typing import Dict, Iterable, List, Callable, Tuple, Type
 import logging
+import queue
+import threading
+import time
 
 from ...application.ports.event_bus import EventBus
 from ...domain.entities.base import DomainEvent
 
 logger = logging.getLogger(__name__)
 
+_STOP = object()
+
+# (per-event handlers, batch handlers) for one concrete event type
+DispatchEntry = Tuple[Tuple[Callable, ...], Tuple[Callable, ...]]
+
 
 class InMemoryEventBus(EventBus):
-    """Simple in-memory event bus for development."""
+    """Simple in-memory event bus for development.
+    
+    Subscribing to a class also subscribes to its subclasses (subscribe to
+    DomainEvent to see everything). Which handlers an event type reaches is
+    resolved once per concrete type and cached until the next `subscribe`,
+    so publishing is a single dict lookup.
     
-    def __init__(self):
-        self._handlers: Dict[Type[DomainEvent], List[Callable]] = {}
+    With `workers=0` handlers run inline inside `publish`. With `workers > 0`
+    `publish` only enqueues the event and worker threads run the handlers:
+    
+    - events are sharded by aggregate (task_id for task events, project_id
+      for project events), so the events of one aggregate are handled in the
+      order they were published;
+    - each shard queue holds at most `queue_size` items and a publisher that
+      finds its shard full blocks until a worker makes room. Under
+      ASYNC_DATABASE services publish from the event loop thread, so a full
+      queue stalls the whole loop until a worker catches up: size the queue
+      for the burst, and watch `blocked_publishes`;
+    - events published by a handler are dispatched inline on that worker,
+      which keeps them ordered after their cause and cannot deadlock on a
+      full queue.
+    """
+    
+    def __init__(self, workers: int = 0, queue_size: int = 1000):
+        self._subscriptions: Dict[Type[DomainEvent], List[Tuple[Callable, bool]]] = {}
+        self._dispatch_table: Dict[Type[DomainEvent], DispatchEntry] = {}
+        self._queues: List[queue.Queue] = []
+        self._threads: List[threading.Thread] = []
+        self._worker_state = threading.local()
+        self._closed = False
+        self._enqueue_lock = threading.Lock()  # `_closed` never flips between a publisher's check and its put
+        
+        self._stats_lock = threading.Lock()
+        self._published = 0
+        self._handled = 0
+        self._failed = 0
+        self._blocked = 0
+        self._lag_last = 0.0
+        self._lag_max = 0.0
+        
+        for index in range(workers):
+            shard = queue.Queue(maxsize=queue_size)
+            thread = threading.Thread(
+                target=self._work,
+                args=(shard,),
+                name=f"event-bus-{index}",
+                daemon=True
+            )
+            self._queues.append(shard)
+            self._threads.append(thread)
+            thread.start()
     
     def publish(self, event: DomainEvent) -> None:
         """Publish event to all registered handlers."""
-        event_type = type(event)
+        self._count_published(1)
+        entry = self._dispatch_table.get(type(event)) or self._resolve(type(event))
+        if not (entry[0] or entry[1]):
+            return
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Publishing event: %s", type(event).__name__)
+        
+        if self._inline():
+            self._dispatch_run([event], entry)
+        else:
+            self._enqueue(self._shard_index(event), [event], entry)
+    
+    def publish_many(self, events: Iterable[DomainEvent]) -> None:
+        """Publish events in order; each run of one type reaches batch handlers in a single call."""
+        for run in self._runs_by_type(events):
+            self._count_published(len(run))
+            
+            entry = self._dispatch_table.get(type(run[0])) or self._resolve(type(run[0]))
+            if not (entry[0] or entry[1]):
+                continue
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Publishing %d x %s", len(run), type(run[0]).__name__)
+            
+            if self._inline():
+                self._dispatch_run(run, entry)
+                continue
+            
+            shards: Dict[int, List[DomainEvent]] = {}
+            for event in run:
+                shards.setdefault(self._shard_index(event), []).append(event)
+            for index, shard_run in shards.items():
+                self._enqueue(index, shard_run, entry)
+    
+    def deliver_many(self, events: Iterable[DomainEvent]) -> List[DomainEvent]:
+        """Handle events on the calling thread, even in queued mode; returns the events that failed.
+        
+        Events the handlers publish are dispatched inline too, as on a worker.
+        """
+        nested = getattr(self._worker_state, "active", False)
+        self._worker_state.active = True
+        failed: List[DomainEvent] = []
+        try:
+            for run in self._runs_by_type(events):
+                self._count_published(len(run))
+                entry = self._dispatch_table.get(type(run[0])) or self._resolve(type(run[0]))
+                failed.extend(self._dispatch_run(run, entry))
+        finally:
+            self._worker_state.active = nested
+        return failed
+    
+    def has_subscribers(self, event_type: Type[DomainEvent]) -> bool:
+        """Check whether any handler, including base-class subscribers, receives an event type."""
+        entry = self._dispatch_table.get(event_type) or self._resolve(event_type)
+        return bool(entry[0] or entry[1])
+    
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable, batch: bool = False) -> None:
+        """Register a handler for an event type and its subclasses.
+        
+        With `batch=True` the handler is called with a list of events of one
+        concrete type instead of once per event.
+        """
+        self._subscriptions.setdefault(event_type, []).append((handler, batch))
+        self._dispatch_table = {}
+        logger.info(f"Subscribed handler to {event_type.__name__}")
+    
+    def shutdown(self, timeout: float = None) -> bool:
+        """Stop accepting queued work and wait for the workers to drain their queues.
+        
+        Events published afterwards, including by publishers still waiting
+        for room in a full shard, are handled inline. Returns False if some
+        worker was still busy when `timeout` (seconds, shared by all workers)
+        ran out; such a worker keeps going in the background.
+        """
+        with self._enqueue_lock:
+            if self._closed:
+                return True
+            self._closed = True
+        
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for shard in self._queues:
+            try:
+                shard.put(_STOP, timeout=self._remaining(deadline))
+            except queue.Full:
+                pass  # the worker is stuck on a handler; it is reported below
         
-        logger.info(f"Publishing event: {event_type.__name__}")
+        for thread in self._threads:
+            thread.join(self._remaining(deadline))
         
-        if event_type in self._handlers:
-            for handler in self._handlers[event_type]:
+        drained = not any(thread.is_alive() for thread in self._threads)
+        if not drained:
+            logger.warning("Event bus shut down with events still queued")
+        return drained
+    
+    def metrics(self) -> dict:
+        """Snapshot of dispatch counters, queue depth and handler lag."""
+        with self._stats_lock:
+            return {
+                "mode": "queued" if self._queues else "inline",
+                "workers": len(self._threads),
+                "queue_depth": sum(shard.qsize() for shard in self._queues),
+                "queue_capacity": sum(shard.maxsize for shard in self._queues),
+                "published": self._published,
+                "handled": self._handled,
+                "failed": self._failed,
+                "blocked_publishes": self._blocked,
+                "lag_ms_last": round(self._lag_last * 1000, 3),
+                "lag_ms_max": round(self._lag_max * 1000, 3),
+            }
+    
+    def _count_published(self, count: int) -> None:
+        """Count events handed to the bus, whether or not anyone listens."""
+        with self._stats_lock:
+            self._published += count
+    
+    def _resolve(self, event_type: Type[DomainEvent]) -> DispatchEntry:
+        """Collect the handlers of an event type and all of its base classes, once."""
+        single, batch = [], []
+        for cls in event_type.__mro__:
+            for handler, is_batch in self._subscriptions.get(cls, ()):
+                (batch if is_batch else single).append(handler)
+        
+        entry = (tuple(single), tuple(batch))
+        self._dispatch_table[event_type] = entry
+        return entry
+    
+    def _inline(self) -> bool:
+        """Whether to dispatch on the calling thread rather than through the queues."""
+        return not self._queues or self._closed or getattr(self._worker_state, "active", False)
+    
+    def _enqueue(self, index: int, run: List[DomainEvent], entry: DispatchEntry) -> None:
+        """Hand a run of events to a shard, blocking while it is full.
+        
+        If the bus shuts down meanwhile the run is handled inline instead, so
+        nothing is queued behind a worker's stop sentinel and lost.
+        """
+        shard = self._queues[index]
+        item = (run, time.monotonic())
+        blocked = False
+        while True:
+            with self._enqueue_lock:
+                if self._closed:
+                    break
+                try:
+                    shard.put_nowait(item)
+                    return
+                except queue.Full:
+                    pass
+            
+            if not blocked:
+                blocked = True
+                with self._stats_lock:
+                    self._blocked += 1
+            with shard.not_full:
+                # Woken by the worker's next `get`; the timeout notices a shutdown
+                # (or a slot freed before we started waiting)
+                shard.not_full.wait(0.1)
+        
+        self._dispatch_run(run, entry)
+    
+    def _dispatch_run(self, run: List[DomainEvent], entry: DispatchEntry) -> List[DomainEvent]:
+        """Run the handlers for a run of same-typed events, isolating their failures.
+        
+        Returns the events some handler failed on; a failed batch handler
+        fails the whole run.
+        """
+        handlers, batch_handlers = entry
+        failed_calls = 0
+        failed_events: List[DomainEvent] = []
+        
+        for event in run:
+            event_failed = False
+            for handler in handlers:
                 try:
                     handler(event)
                 except Exception as e:
-                    logger.error(f"Error handling {event_type.__name__}: {e}")
+                    failed_calls += 1
+                    event_failed = True
+                    logger.error(f"Error handling {type(event).__name__}: {e}")
+            if event_failed:
+                failed_events.append(event)
+        
+        for handler in batch_handlers:
+            try:
+                handler(run)
+            except Exception as e:
+                failed_calls += 1
+                failed_events = list(run)
+                logger.error(f"Error handling {len(run)} x {type(run[0]).__name__}: {e}")
+        
+        with self._stats_lock:
+            self._handled += len(run) * len(handlers) + len(batch_handlers) - failed_calls
+            self._failed += failed_calls
+        return failed_events
+    
+    def _work(self, shard: queue.Queue) -> None:
+        """Worker loop: handle one shard's events in order until told to stop."""
+        self._worker_state.active = True
+        while True:
+            item = shard.get()
+            if item is _STOP:
+                shard.task_done()
+                return
+            
+            run, enqueued_at = item
+            lag = time.monotonic() - enqueued_at
+            with self._stats_lock:
+                self._lag_last = lag
+                self._lag_max = max(self._lag_max, lag)
+            
+            entry = self._dispatch_table.get(type(run[0])) or self._resolve(type(run[0]))
+            self._dispatch_run(run, entry)
+            shard.task_done()
+    
+    @staticmethod
+    def _runs_by_type(events: Iterable[DomainEvent]) -> List[List[DomainEvent]]:
+        """Split events into maximal consecutive runs of one concrete type."""
+        runs: List[List[DomainEvent]] = []
+        for event in events:
+            if runs and type(runs[-1][0]) is type(event):
+                runs[-1].append(event)
+            else:
+                runs.append([event])
+        return runs
+    
+    @staticmethod
+    def _remaining(deadline):
+        return None if deadline is None else max(deadline - time.monotonic(), 0)
+    
+    def _shard_index(self, event: DomainEvent) -> int:
+        return hash(self._ordering_key(event)) % len(self._queues)
     
-    def subscribe(self, event_type: Type[DomainEvent], handler: Callable) -> None:
-        """Register a handler for an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
+    @staticmethod
+    def _ordering_key(event: DomainEvent):
+        """The aggregate whose events must stay in order.
         
-        self._handlers[event_type].append(handler)
-        logger.info(f"Subscribed handler to {event_type.__name__}")
\ No newline at end of file
+        Task events carry an optional, changing project_id (completed in a
+        project, then unlinked, then reopened without one), so they are keyed
+        by task_id alone; only events without a task belong to their project.
+        """
+        return (
+            getattr(event, "task_id", None)
+            or getattr(event, "project_id", None)
+            or event.event_id
+        )
@@ -0,0 +1,123 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+from ...application.ports.event_bus import EventBus
+from ...application.ports.unit_of_work import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxDispatcher:
+    """Delivers outboxed events to the event bus from a background thread.
+    
+    Each round claims up to `batch_size` events in sequence order with one
+    short transaction, runs their handlers on this thread (`deliver_many`,
+    also when the bus has queue workers), then deletes the claim with another.
+    Events survive restarts in the table: an event is only acknowledged once
+    every handler has run on it without raising. If the process dies
+    mid-batch the claim's lease expires and the whole batch is delivered
+    again (at-least-once, so handlers must tolerate repeats). When handlers
+    fail, the other events of the batch are acknowledged and the failed ones
+    are retried after the lease; one that failed `max_attempts` times is
+    parked in the table (reported by `metrics`) so it stops coming back.
+    A retried event can therefore be handled after later events.
+    """
+    
+    def __init__(
+        self,
+        unit_of_work_factory: Callable[[], UnitOfWork],
+        event_bus: EventBus,
+        batch_size: int = 500,
+        poll_interval: float = 0.5,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 5
+    ):
+        self.unit_of_work_factory = unit_of_work_factory
+        self.event_bus = event_bus
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        
+        self._delivered = 0
+        self._batches = 0
+        self._errors = 0
+    
+    def start(self) -> None:
+        """Start the background delivery loop."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+            self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Finish the batch in flight and stop; undelivered events stay in the outbox."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def wake(self) -> None:
+        """Skip the rest of the current poll wait, e.g. right after a commit added events."""
+        self._wakeup.set()
+    
+    def dispatch_once(self) -> int:
+        """Claim, handle and acknowledge one batch; returns how many events were delivered.
+        
+        Raises RuntimeError when a handler failed, after acknowledging the
+        events that were handled and recording the failed ones' attempt.
+        """
+        with self.unit_of_work_factory() as uow:
+            claim_token, events = uow.outbox.claim(self.batch_size, self.lease_seconds)
+            uow.commit()
+        
+        if not events:
+            return 0
+        
+        failed = self.event_bus.deliver_many(events)
+        with self.unit_of_work_factory() as uow:
+            parked = uow.outbox.record_failures(
+                claim_token, [event.event_id for event in failed], self.max_attempts
+            )
+            delivered = uow.outbox.acknowledge(claim_token)
+            uow.commit()
+        
+        self._delivered += delivered
+        self._batches += 1
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {len(events)} events failed; {parked} parked after "
+                f"{self.max_attempts} attempts, the rest retried after the {self.lease_seconds:g}s lease"
+            )
+        return delivered
+    
+    def metrics(self) -> dict:
+        """Delivery counters plus the number of events still waiting or parked."""
+        with self.unit_of_work_factory() as uow:
+            pending = uow.outbox.pending_count()
+            parked = uow.outbox.parked_count()
+        return {
+            "pending": pending,
+            "parked": parked,
+            "delivered": self._delivered,
+            "batches": self._batches,
+            "errors": self._errors,
+        }
+    
+    def _run(self) -> None:
+        """Deliver back-to-back while batches come back full, otherwise wait for the next poll."""
+        while not self._stopping:
+            try:
+                delivered = self.dispatch_once()
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Outbox dispatch failed: {e}")
+                delivered = 0
+            
+            if delivered < self.batch_size:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
@@ -0,0 +1,170 @@
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ...application.ports.event_bus import EventBus
+from ...application.ports.unit_of_work import UnitOfWork
+from ...domain.entities.base import event_batch
+from ...domain.events.task_events import (
+    TaskCompletedEvent,
+    TaskDeadlineApproachingEvent,
+    TaskDeadlineChangedEvent
+)
+
+logger = logging.getLogger(__name__)
+
+# (notify_at, deadline, task_id, project_id), ordered by when the warning is due
+_Entry = Tuple[datetime, datetime, UUID, Optional[UUID]]
+
+
+class DeadlineScheduler:
+    """Publishes TaskDeadlineApproachingEvent when an open task enters its warning window.
+    
+    Every `refresh_interval` seconds one indexed range query loads the open
+    tasks due before `now + window + refresh_interval` into a heap keyed by
+    the moment their warning is due; between refreshes the thread sleeps
+    until the earliest of those. Work per refresh follows the number of
+    tasks due soon, not the size of the tasks table.
+    
+    Each task is announced once per deadline. Completing a task or moving
+    its deadline drops the pending warning; a moved deadline is picked up
+    again by the next refresh.
+    """
+    
+    def __init__(
+        self,
+        unit_of_work_factory: Callable[[], UnitOfWork],
+        event_bus: EventBus,
+        window: timedelta = timedelta(hours=24),
+        refresh_interval: float = 60.0,
+        clock: Callable[[], datetime] = None
+    ):
+        self.unit_of_work_factory = unit_of_work_factory
+        self.event_bus = event_bus
+        self.window = window
+        self.refresh_interval = refresh_interval
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        
+        self._heap: List[_Entry] = []
+        self._scheduled: Dict[UUID, datetime] = {}
+        self._notified: Dict[UUID, datetime] = {}
+        self._next_refresh: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        
+        self._refreshes = 0
+        self._fired = 0
+        self._errors = 0
+    
+    def subscribe(self, event_bus: EventBus) -> None:
+        """Drop pending warnings for tasks that are completed or rescheduled."""
+        event_bus.subscribe(TaskCompletedEvent, self.forget, batch=True)
+        event_bus.subscribe(TaskDeadlineChangedEvent, self.forget, batch=True)
+    
+    def start(self) -> None:
+        """Start the background scheduling loop."""
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="deadline-scheduler", daemon=True)
+            self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the loop; pending warnings are rebuilt from the database on the next start."""
+        self._stopping = True
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def forget(self, events) -> None:
+        """Cancel the pending warnings of the tasks these events refer to."""
+        with self._lock:
+            for event in events:
+                self._scheduled.pop(event.task_id, None)
+    
+    def refresh(self, now: datetime) -> int:
+        """Reload the tasks whose warning falls before the next refresh; returns how many."""
+        horizon = now + self.window + timedelta(seconds=self.refresh_interval)
+        with self.unit_of_work_factory() as uow:
+            tasks = uow.tasks.find_due_between(now, horizon)
+        
+        heap = [
+            (task.deadline - self.window, task.deadline, task.id, task.project_id)
+            for task in tasks
+        ]
+        heapq.heapify(heap)
+        
+        with self._lock:
+            self._heap = heap
+            self._scheduled = {entry[2]: entry[1] for entry in heap}
+            self._notified = {
+                task_id: deadline for task_id, deadline in self._notified.items()
+                if self._scheduled.get(task_id) == deadline
+            }
+            self._next_refresh = now + timedelta(seconds=self.refresh_interval)
+            self._refreshes += 1
+        return len(heap)
+    
+    def fire_due(self, now: datetime) -> int:
+        """Publish the warnings that are due and not yet sent; returns how many."""
+        events = []
+        with self._lock, event_batch():
+            while self._heap and self._heap[0][0] <= now:
+                _, deadline, task_id, project_id = heapq.heappop(self._heap)
+                if self._scheduled.get(task_id) != deadline or deadline <= now:
+                    continue
+                if self._notified.get(task_id) == deadline:
+                    continue
+                self._notified[task_id] = deadline
+                events.append(TaskDeadlineApproachingEvent(
+                    task_id=task_id,
+                    project_id=project_id,
+                    deadline=deadline
+                ))
+            self._fired += len(events)
+        
+        if events:
+            self.event_bus.publish_many(events)
+        return len(events)
+    
+    def tick(self) -> float:
+        """Refresh if due, fire due warnings, and return the seconds until there is more to do."""
+        now = self.clock()
+        if self._next_refresh is None or now >= self._next_refresh:
+            self.refresh(now)
+        self.fire_due(now)
+        
+        with self._lock:
+            wake_at = self._next_refresh
+            if self._heap and self._heap[0][0] < wake_at:
+                wake_at = self._heap[0][0]
+        return max((wake_at - now).total_seconds(), 0.0)
+    
+    def metrics(self) -> dict:
+        """Scheduler counters and the number of warnings waiting in the heap."""
+        with self._lock:
+            return {
+                "scheduled": len(self._scheduled),
+                "notified": len(self._notified),
+                "fired": self._fired,
+                "refreshes": self._refreshes,
+                "errors": self._errors,
+            }
+    
+    def _run(self) -> None:
+        """Sleep until the next warning or refresh is due, then handle it."""
+        while not self._stopping:
+            try:
+                delay = self.tick()
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Deadline scheduling failed: {e}")
+                delay = self.refresh_interval
+            
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
@@ -7,6 +7,7 @@ from uuid import uuid4
 from src.infrastructure.database.models import Base
 from src.infrastructure.database.repositories.task_repository import SQLAlchemyTaskRepository
 from src.infrastructure.database.repositories.project_repository import SQLAlchemyProjectRepository
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 from src.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
 from src.domain.entities.task import Task
 from src.domain.entities.project import Project
@@ -39,6 +40,12 @@ def project_repository(db_session):
     return SQLAlchemyProjectRepository(db_session)
 
 
+@pytest.fixture
+def unit_of_work(db_session):
+    """Fixture for a unit of work sharing the test session."""
+    return SQLAlchemyUnitOfWork(db_session)
+
+
 @pytest.fixture
 def event_bus():
     """Fixture for event bus."""
@@ -0,0 +1,71 @@
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.async_project_service import AsyncProjectService
+from src.application.services.async_task_service import AsyncTaskService
+from src.domain.exceptions.domain_exceptions import TaskNotFoundError
+from src.infrastructure.database.async_unit_of_work import (
+    AsyncSQLAlchemyUnitOfWork,
+    ThreadedUnitOfWork
+)
+from src.infrastructure.database.models import Base
+from src.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """Fixture for a file-backed SQLite database with the schema created."""
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    return path
+
+
+@pytest_asyncio.fixture(params=["threaded", "async-driver"])
+async def async_unit_of_work(request, database_path):
+    """Fixture for both AsyncUnitOfWork adapters over the same schema."""
+    if request.param == "threaded":
+        engine = create_engine(f"sqlite:///{database_path}", connect_args={"check_same_thread": False})
+        session = sessionmaker(bind=engine)()
+        yield ThreadedUnitOfWork(session)
+        session.close()
+        engine.dispose()
+    else:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}")
+        async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+            yield AsyncSQLAlchemyUnitOfWork(session)
+        await engine.dispose()
+
+
+class TestAsyncServices:
+    """Test suite for the async service facades on both unit-of-work adapters."""
+    
+    @pytest.mark.asyncio
+    async def test_use_cases_round_trip(self, async_unit_of_work):
+        """Test that use cases commit and read back through an AsyncUnitOfWork."""
+        event_bus = InMemoryEventBus()
+        projects = AsyncProjectService(async_unit_of_work, event_bus)
+        tasks = AsyncTaskService(async_unit_of_work, event_bus)
+        now = datetime.now(timezone.utc)
+        
+        project = await projects.create_project("Async", now + timedelta(days=30))
+        task = await tasks.create_task("Do it", now + timedelta(days=1), project_id=project.id)
+        await tasks.complete_task(task.id, auto_complete_project=True)
+        
+        assert (await projects.get_project(project.id)).completed is True
+        assert (await projects.get_progress(project.id)).completed_count == 1
+        assert [t.id for t in await tasks.get_tasks_by_project(project.id)] == [task.id]
+    
+    @pytest.mark.asyncio
+    async def test_domain_errors_propagate(self, async_unit_of_work):
+        """Test that domain exceptions surface unchanged from the async facade."""
+        tasks = AsyncTaskService(async_unit_of_work, InMemoryEventBus())
+        
+        with pytest.raises(TaskNotFoundError):
+            await tasks.get_task(uuid4())
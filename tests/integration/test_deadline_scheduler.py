@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from src.domain.entities.task import Task
+from src.domain.events.task_events import TaskCompletedEvent, TaskDeadlineApproachingEvent
+from src.infrastructure.scheduling.deadline_scheduler import DeadlineScheduler
+
+
+class _Clock:
+    """Manually advanced clock for driving the scheduler deterministically."""
+    
+    def __init__(self):
+        self.now = datetime.now(timezone.utc)
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Fixture for a controllable clock."""
+    return _Clock()
+
+
+@pytest.fixture
+def scheduler(unit_of_work, event_bus, clock):
+    """Fixture for a scheduler with a one-hour warning window."""
+    scheduler = DeadlineScheduler(
+        unit_of_work_factory=lambda: unit_of_work,
+        event_bus=event_bus,
+        window=timedelta(hours=1),
+        refresh_interval=60,
+        clock=clock
+    )
+    scheduler.subscribe(event_bus)
+    return scheduler
+
+
+class TestDeadlineScheduler:
+    """Test suite for the due-soon deadline scheduler."""
+    
+    def test_find_due_between_returns_open_tasks_in_range(self, task_repository, clock):
+        """Test that only open tasks inside the window come back, soonest first."""
+        later = task_repository.save(Task(title="Later", deadline=clock.now + timedelta(minutes=50)))
+        sooner = task_repository.save(Task(title="Sooner", deadline=clock.now + timedelta(minutes=10)))
+        task_repository.save(Task(title="Far", deadline=clock.now + timedelta(days=3)))
+        task_repository.save(Task(title="Past", deadline=clock.now - timedelta(minutes=1)))
+        task_repository.save(Task(
+            title="Done", deadline=clock.now + timedelta(minutes=5), completed=True
+        ))
+        
+        due = task_repository.find_due_between(clock.now, clock.now + timedelta(hours=1))
+        
+        assert [task.id for task in due] == [sooner.id, later.id]
+    
+    def test_warns_once_when_task_enters_window(self, scheduler, task_repository, event_bus, clock):
+        """Test that a warning fires when the window opens and is not repeated."""
+        warned = []
+        event_bus.subscribe(TaskDeadlineApproachingEvent, warned.append)
+        inside = task_repository.save(Task(title="Inside", deadline=clock.now + timedelta(minutes=30)))
+        entering = task_repository.save(Task(title="Entering", deadline=clock.now + timedelta(minutes=61)))
+        
+        scheduler.tick()
+        assert [e.task_id for e in warned] == [inside.id]
+        
+        clock.now += timedelta(minutes=1, seconds=1)
+        scheduler.tick()
+        clock.now += timedelta(minutes=5)
+        scheduler.tick()
+        
+        assert [e.task_id for e in warned] == [inside.id, entering.id]
+        assert scheduler.metrics()["fired"] == 2
+    
+    def test_completed_task_is_not_warned(self, scheduler, task_repository, event_bus, clock):
+        """Test that completing a task cancels its pending warning."""
+        warned = []
+        event_bus.subscribe(TaskDeadlineApproachingEvent, warned.append)
+        task = task_repository.save(Task(title="Soon", deadline=clock.now + timedelta(minutes=61)))
+        scheduler.tick()
+        
+        event_bus.publish(TaskCompletedEvent(task_id=task.id, project_id=None, completed_at=clock.now))
+        clock.now += timedelta(seconds=30)
+        scheduler.tick()
+        
+        assert warned == []
@@ -0,0 +1,116 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import Column, MetaData, Table, create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from src.domain.entities.project import Project
+from src.domain.entities.task import Task
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.guid_migration import (
+    _target_metadata,
+    detect_guid_storage,
+    migrate_guid_storage
+)
+from src.infrastructure.database.models import GUID, Base
+from src.infrastructure.database.repositories.project_repository import SQLAlchemyProjectRepository
+from src.infrastructure.database.repositories.task_repository import SQLAlchemyTaskRepository
+
+
+def _storage(binary: bool) -> str:
+    return "binary" if binary else "text"
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """Fixture for a file-backed SQLite engine with the configured GUID storage and a few rows."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'guids.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    
+    project = SQLAlchemyProjectRepository(session).save(
+        Project(title="Project", deadline=datetime.utcnow() + timedelta(days=30))
+    )
+    tasks = SQLAlchemyTaskRepository(session)
+    for i in range(3):
+        tasks.save(Task(title=f"Task {i}", deadline=datetime.utcnow() + timedelta(days=5), project_id=project.id))
+    session.commit()
+    session.close()
+    
+    yield engine
+    engine.dispose()
+
+
+class TestBinaryGUID:
+    """Test suite for BINARY(16) GUID storage."""
+    
+    def test_binary_guid_round_trip(self):
+        """Test that binary GUIDs store 16 bytes and come back as UUIDs."""
+        engine = create_engine("sqlite:///:memory:")
+        table = Table("things", MetaData(), Column("id", GUID(binary=True), primary_key=True))
+        table.create(engine)
+        first, second = uuid4(), uuid4()
+        
+        with engine.begin() as connection:
+            connection.execute(table.insert(), [{"id": first}, {"id": str(second)}])
+            stored = connection.exec_driver_sql("SELECT typeof(id), length(id) FROM things").all()
+            found = connection.execute(select(table.c.id).where(table.c.id == second)).scalar_one()
+        
+        assert "BINARY(16)" in str(CreateTable(table).compile(engine))
+        assert stored == [("blob", 16), ("blob", 16)]
+        assert found == second
+
+
+class TestGUIDMigration:
+    """Test suite for the offline text <-> binary GUID migration."""
+    
+    def test_migrates_to_other_storage_and_back(self, file_engine):
+        """Test that ids survive a round trip and the configured schema works again afterwards."""
+        configured = settings.BINARY_GUIDS
+        with file_engine.connect() as connection:
+            before = connection.execute(select(Base.metadata.tables["tasks"])).all()
+        assert detect_guid_storage(file_engine) == _storage(configured)
+        
+        copied = migrate_guid_storage(file_engine, binary=not configured)
+        
+        assert copied["tasks"] == 3 and copied["projects"] == 1
+        assert detect_guid_storage(file_engine) == _storage(not configured)
+        with file_engine.connect() as connection:
+            tasks = _target_metadata(binary=not configured).tables["tasks"]
+            assert connection.execute(select(tasks)).all() == before
+        
+        migrate_guid_storage(file_engine, binary=configured)
+        
+        assert detect_guid_storage(file_engine) == _storage(configured)
+        session = sessionmaker(bind=file_engine)()
+        project_id = before[0].project_id
+        assert len(SQLAlchemyTaskRepository(session).find_by_project_id(project_id)) == 3
+        session.close()
+    
+    def test_migration_is_idempotent(self, file_engine):
+        """Test that migrating to the current storage copies rows unchanged."""
+        migrate_guid_storage(file_engine, binary=True, vacuum=False)
+        migrate_guid_storage(file_engine, binary=True, vacuum=False)
+        
+        with file_engine.connect() as connection:
+            kinds = connection.exec_driver_sql("SELECT DISTINCT typeof(project_id) FROM tasks").all()
+            indexes = connection.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'tasks'"
+            ).scalars().all()
+        
+        assert kinds == [("blob",)]
+        assert "ix_tasks_project_completed" in indexes
+    
+    def test_pooled_connection_keeps_its_foreign_keys_setting(self, tmp_path):
+        """Test that the migration hands its connection back with foreign keys enforced again."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'fk.db'}", pool_size=1, max_overflow=0)
+        event.listen(engine, "connect", lambda dbapi, _: dbapi.execute("PRAGMA foreign_keys=ON"))
+        Base.metadata.create_all(engine)
+        
+        migrate_guid_storage(engine, binary=True, vacuum=False)
+        
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        engine.dispose()
@@ -0,0 +1,169 @@
+import pytest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.domain.events.task_events import TaskCompletedEvent
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+from src.infrastructure.event_bus.outbox_dispatcher import OutboxDispatcher
+
+
+def _completed():
+    return TaskCompletedEvent(
+        task_id=uuid4(),
+        project_id=uuid4(),
+        completed_at=datetime.now(timezone.utc)
+    )
+
+
+@pytest.fixture
+def outbox_unit_of_work(db_session):
+    """Fixture for a unit of work that writes recorded events to the outbox."""
+    return SQLAlchemyUnitOfWork(db_session, use_outbox=True)
+
+
+class TestOutbox:
+    """Test suite for the transactional outbox and its dispatcher."""
+    
+    def test_events_are_written_with_the_commit(self, outbox_unit_of_work):
+        """Test that recorded events land in the outbox instead of being handed back."""
+        with outbox_unit_of_work as uow:
+            uow.record(_completed(), _completed())
+            uow.commit()
+        
+        assert outbox_unit_of_work.collect_events() == []
+        assert outbox_unit_of_work.outbox.pending_count() == 2
+    
+    def test_failed_transaction_writes_no_events(self, outbox_unit_of_work):
+        """Test that a rolled-back use case leaves no phantom events behind."""
+        with pytest.raises(RuntimeError):
+            with outbox_unit_of_work as uow:
+                uow.record(_completed())
+                raise RuntimeError("write failed")
+        
+        with outbox_unit_of_work as uow:
+            uow.commit()
+        
+        assert outbox_unit_of_work.outbox.pending_count() == 0
+    
+    def test_dispatcher_delivers_batches_in_order(self, outbox_unit_of_work, event_bus):
+        """Test that the dispatcher publishes events in sequence order and removes them."""
+        events = [_completed() for _ in range(5)]
+        with outbox_unit_of_work as uow:
+            uow.record(*events)
+            uow.commit()
+        
+        delivered = []
+        event_bus.subscribe(TaskCompletedEvent, delivered.append)
+        dispatcher = OutboxDispatcher(lambda: outbox_unit_of_work, event_bus, batch_size=2)
+        
+        assert [dispatcher.dispatch_once() for _ in range(4)] == [2, 2, 1, 0]
+        assert [e.event_id for e in delivered] == [e.event_id for e in events]
+        assert delivered[0] == events[0]
+        assert outbox_unit_of_work.outbox.pending_count() == 0
+    
+    def test_expired_claim_is_delivered_again(self, outbox_unit_of_work):
+        """Test that events of a dispatcher that died mid-batch are not lost."""
+        event = _completed()
+        with outbox_unit_of_work as uow:
+            uow.record(event)
+            uow.commit()
+        
+        _, first = outbox_unit_of_work.outbox.claim(10, lease_seconds=-1)
+        _, reclaimed = outbox_unit_of_work.outbox.claim(10, lease_seconds=60)
+        _, while_leased = outbox_unit_of_work.outbox.claim(10, lease_seconds=60)
+        
+        assert first == [event]
+        assert reclaimed == [event]
+        assert while_leased == []
+    
+    def test_batch_is_acknowledged_after_queued_handlers_ran(self, outbox_unit_of_work):
+        """Test that a bus with queue workers has handled the batch before it is deleted."""
+        events = [_completed() for _ in range(3)]
+        with outbox_unit_of_work as uow:
+            uow.record(*events)
+            uow.commit()
+        
+        bus = InMemoryEventBus(workers=2)
+        delivered = []
+        bus.subscribe(TaskCompletedEvent, delivered.append)
+        dispatcher = OutboxDispatcher(lambda: outbox_unit_of_work, bus)
+        
+        assert dispatcher.dispatch_once() == 3
+        assert delivered == events
+        assert outbox_unit_of_work.outbox.pending_count() == 0
+        bus.shutdown(timeout=5)
+    
+    def test_failed_handler_leaves_batch_in_outbox(self, outbox_unit_of_work, event_bus):
+        """Test that a batch whose handler raised is not acknowledged and comes back later."""
+        event = _completed()
+        with outbox_unit_of_work as uow:
+            uow.record(event)
+            uow.commit()
+        
+        attempts = []
+        
+        def flaky(e):
+            attempts.append(e)
+            if len(attempts) == 1:
+                raise ValueError("handler down")
+        
+        event_bus.subscribe(TaskCompletedEvent, flaky)
+        dispatcher = OutboxDispatcher(lambda: outbox_unit_of_work, event_bus, lease_seconds=-1)
+        
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch_once()
+        assert outbox_unit_of_work.outbox.pending_count() == 1
+        
+        assert dispatcher.dispatch_once() == 1
+        assert attempts == [event, event]
+        assert outbox_unit_of_work.outbox.pending_count() == 0
+    
+    def test_delivered_events_are_acknowledged_around_a_failed_one(self, outbox_unit_of_work, event_bus):
+        """Test that only the event whose handler raised stays in the outbox."""
+        events = [_completed() for _ in range(3)]
+        with outbox_unit_of_work as uow:
+            uow.record(*events)
+            uow.commit()
+        
+        def fail_second(e):
+            if e == events[1]:
+                raise ValueError("handler down")
+        
+        event_bus.subscribe(TaskCompletedEvent, fail_second)
+        dispatcher = OutboxDispatcher(lambda: outbox_unit_of_work, event_bus, lease_seconds=-1)
+        
+        with pytest.raises(RuntimeError):
+            dispatcher.dispatch_once()
+        
+        assert outbox_unit_of_work.outbox.pending_count() == 1
+        assert dispatcher.metrics()["delivered"] == 2
+        _, remaining = outbox_unit_of_work.outbox.claim(10, lease_seconds=60)
+        assert remaining == [events[1]]
+    
+    def test_event_failing_every_attempt_is_parked(self, outbox_unit_of_work, event_bus):
+        """Test that an event whose handler always fails is parked after max_attempts."""
+        event = _completed()
+        with outbox_unit_of_work as uow:
+            uow.record(event)
+            uow.commit()
+        
+        attempts = []
+        
+        def always_fails(e):
+            attempts.append(e)
+            raise ValueError("handler down")
+        
+        event_bus.subscribe(TaskCompletedEvent, always_fails)
+        dispatcher = OutboxDispatcher(
+            lambda: outbox_unit_of_work, event_bus, lease_seconds=-1, max_attempts=3
+        )
+        
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                dispatcher.dispatch_once()
+        
+        assert dispatcher.dispatch_once() == 0
+        assert len(attempts) == 3
+        metrics = dispatcher.metrics()
+        assert (metrics["pending"], metrics["parked"], metrics["delivered"]) == (0, 1, 0)
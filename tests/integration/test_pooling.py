@@ -0,0 +1,63 @@
+from sqlalchemy import create_engine
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.database.pooling import PoolMonitor, ping, pool_options
+
+
+class TestPoolOptions:
+    """Test suite for Settings-driven pool configuration."""
+    
+    def test_queue_pool_databases_get_size_options(self):
+        """Test that size, overflow and timeout are passed where a queue pool is used."""
+        config = Settings(DB_POOL_SIZE=3, DB_MAX_OVERFLOW=1, DB_POOL_TIMEOUT=2.5, DB_POOL_RECYCLE=600)
+        
+        options = pool_options("postgresql://db/tasks", config)
+        
+        assert options == {
+            "pool_pre_ping": True,
+            "pool_recycle": 600,
+            "pool_size": 3,
+            "max_overflow": 1,
+            "pool_timeout": 2.5,
+        }
+        assert "pool_size" in pool_options("sqlite:///./tasks.db", config)
+    
+    def test_other_pools_only_get_recycle_and_pre_ping(self):
+        """Test that in-memory SQLite and aiosqlite keep their own pool classes."""
+        config = Settings(DB_POOL_PRE_PING=False)
+        
+        for url in ("sqlite:///:memory:", "sqlite+aiosqlite:///./tasks.db"):
+            assert pool_options(url, config) == {"pool_pre_ping": False, "pool_recycle": -1}
+
+
+class TestPoolMonitor:
+    """Test suite for live pool metrics."""
+    
+    def test_reports_occupancy_and_saturation(self, tmp_path):
+        """Test checked-out/overflow numbers while connections are held, and after."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=1, max_overflow=1)
+        monitor = PoolMonitor(engine)
+        
+        first, second = engine.connect(), engine.connect()
+        held = monitor.metrics()
+        first.close()
+        second.close()
+        released = monitor.metrics()
+        
+        assert held["checked_out"] == 2 and held["overflow"] == 1
+        assert held["saturations"] == 1
+        assert released["checked_out"] == 0
+        assert released["peak_checked_out"] == 2
+        assert released["checkouts"] == 2 and released["connects"] == 2
+        engine.dispose()
+    
+    def test_ping_times_a_round_trip(self, tmp_path):
+        """Test that ping reports success with a latency, and failure with the error."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+        broken = create_engine(f"sqlite:///{tmp_path / 'missing' / 'pool.db'}")
+        
+        result = ping(engine)
+        
+        assert result["ok"] is True and result["latency_ms"] >= 0
+        assert ping(broken)["ok"] is False
+        engine.dispose()
@@ -0,0 +1,131 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.project import Project
+from src.domain.entities.task import Task
+from src.infrastructure.cache.entity_cache import EntityCache
+from src.infrastructure.database.models import Base
+from src.infrastructure.database.replicas import ReplicaRoutingSession, RoundRobin
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+
+
+def _task(title):
+    return Task(title=title, deadline=datetime.utcnow() + timedelta(days=5))
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """Fixture for a primary and two replica SQLite files, each holding one marker task."""
+    engines = {}
+    for name in ("primary", "replica_a", "replica_b"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.db")
+        Base.metadata.create_all(engine)
+        with SQLAlchemyUnitOfWork(sessionmaker(bind=engine)(), close_on_exit=True) as uow:
+            uow.tasks.save(_task(name))
+            uow.commit()
+        engines[name] = engine
+    
+    yield engines
+    
+    for engine in engines.values():
+        engine.dispose()
+
+
+def _titles(uow):
+    return sorted(task.title for task in uow.tasks.find_all())
+
+
+class TestReadReplicas:
+    """Test suite for replica routing of read-only sessions."""
+    
+    def test_sessions_read_from_replicas_in_turn(self, databases):
+        """Test that each new session reads from the next replica."""
+        factory = sessionmaker(
+            class_=ReplicaRoutingSession,
+            primary=databases["primary"],
+            replicas=RoundRobin([databases["replica_a"], databases["replica_b"]])
+        )
+        
+        seen = []
+        for _ in range(4):
+            with SQLAlchemyUnitOfWork(factory(), close_on_exit=True) as uow:
+                seen.append(_titles(uow))
+        
+        assert seen == [["replica_a"], ["replica_b"], ["replica_a"], ["replica_b"]]
+    
+    def test_session_sticks_to_primary_after_a_write(self, databases):
+        """Test that writes go to the primary and later reads of that session follow them."""
+        factory = sessionmaker(
+            class_=ReplicaRoutingSession,
+            primary=databases["primary"],
+            replicas=RoundRobin([databases["replica_a"]])
+        )
+        
+        with SQLAlchemyUnitOfWork(factory(), close_on_exit=True) as uow:
+            assert _titles(uow) == ["replica_a"]
+            
+            uow.tasks.save(_task("written"))
+            uow.commit()
+            
+            assert _titles(uow) == ["primary", "written"]
+        
+        with SQLAlchemyUnitOfWork(factory(), close_on_exit=True) as uow:
+            assert _titles(uow) == ["replica_a"]
+    
+    def test_without_replicas_everything_uses_the_primary(self, databases):
+        """Test that a routing session with no replicas is a plain primary session."""
+        factory = sessionmaker(class_=ReplicaRoutingSession, primary=databases["primary"])
+        
+        with SQLAlchemyUnitOfWork(factory(), close_on_exit=True) as uow:
+            assert _titles(uow) == ["primary"]
+    
+    def test_replica_reads_do_not_fill_the_shared_cache(self, databases):
+        """Test that a lagging replica row never reaches primary readers through the entity cache."""
+        task = _task("fresh")
+        with SQLAlchemyUnitOfWork(sessionmaker(bind=databases["primary"])(), close_on_exit=True) as uow:
+            uow.tasks.save(task)
+            uow.commit()
+        with SQLAlchemyUnitOfWork(sessionmaker(bind=databases["replica_a"])(), close_on_exit=True) as uow:
+            uow.tasks.save(Task(id=task.id, title="stale", deadline=task.deadline))
+            uow.commit()
+        
+        cache = EntityCache()
+        reader = sessionmaker(
+            class_=ReplicaRoutingSession,
+            primary=databases["primary"],
+            replicas=RoundRobin([databases["replica_a"]])
+        )
+        primary = sessionmaker(bind=databases["primary"])
+        
+        with SQLAlchemyUnitOfWork(reader(), close_on_exit=True, cache=cache, cache_reads=True) as uow:
+            assert uow.tasks.find_by_id(task.id).title == "stale"
+        with SQLAlchemyUnitOfWork(primary(), close_on_exit=True, cache=cache, cache_reads=True) as uow:
+            assert uow.tasks.find_by_id(task.id).title == "fresh"
+        with SQLAlchemyUnitOfWork(reader(), close_on_exit=True, cache=cache, cache_reads=True) as uow:
+            assert uow.tasks.find_by_id(task.id).title == "fresh"
+    
+    def test_replica_batch_reads_do_not_fill_the_shared_cache(self, databases):
+        """Test that projects loaded by id in bulk from a replica are not cached either."""
+        project = Project(title="fresh", deadline=datetime.utcnow() + timedelta(days=5))
+        with SQLAlchemyUnitOfWork(sessionmaker(bind=databases["primary"])(), close_on_exit=True) as uow:
+            uow.projects.save(project)
+            uow.commit()
+        with SQLAlchemyUnitOfWork(sessionmaker(bind=databases["replica_a"])(), close_on_exit=True) as uow:
+            uow.projects.save(Project(id=project.id, title="stale", deadline=project.deadline))
+            uow.commit()
+        
+        cache = EntityCache()
+        reader = sessionmaker(
+            class_=ReplicaRoutingSession,
+            primary=databases["primary"],
+            replicas=RoundRobin([databases["replica_a"]])
+        )
+        primary = sessionmaker(bind=databases["primary"])
+        
+        with SQLAlchemyUnitOfWork(reader(), close_on_exit=True, cache=cache, cache_reads=True) as uow:
+            assert [p.title for p in uow.projects.find_by_ids([project.id])] == ["stale"]
+        with SQLAlchemyUnitOfWork(primary(), close_on_exit=True, cache=cache, cache_reads=True) as uow:
+            assert [p.title for p in uow.projects.find_by_ids([project.id])] == ["fresh"]
+            assert uow.projects.find_by_id(project.id).title == "fresh"
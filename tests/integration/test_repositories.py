@@ -1,8 +1,13 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import event
 
 from src.domain.entities.task import Task
 from src.domain.entities.project import Project
+from src.domain.exceptions.domain_exceptions import InvalidCursorError
+from src.application.ports.repositories import TaskQuery
+from src.infrastructure.cache.entity_cache import EntityCache
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
 
 
 class TestTaskRepository:
@@ -42,6 +47,27 @@ class TestTaskRepository:
         assert updated_task.title == "Updated Title"
         assert updated_task.completed is True
     
+    def test_save_writes_only_changed_fields(self, task_repository):
+        """Test that concurrent edits to different fields do not overwrite each other."""
+        task = task_repository.save(Task(
+            title="Original",
+            description="Original description",
+            deadline=datetime.utcnow() + timedelta(days=7)
+        ))
+        
+        first_copy = task_repository.find_by_id(task.id)
+        second_copy = task_repository.find_by_id(task.id)
+        assert first_copy.dirty_fields == frozenset()
+        
+        first_copy.title = "Renamed"
+        task_repository.save(first_copy)
+        second_copy.description = "New description"
+        task_repository.save(second_copy)
+        
+        found = task_repository.find_by_id(task.id)
+        assert found.title == "Renamed"
+        assert found.description == "New description"
+    
     def test_find_all_tasks(self, task_repository):
         """Test retrieving all tasks."""
         for i in range(3):
@@ -80,6 +106,96 @@ class TestTaskRepository:
         
         found = task_repository.find_by_id(saved_task.id)
         assert found is None
+    
+    def test_find_combines_filters(self, task_repository, project_repository, sample_project):
+        """Test that project, completion and overdue filters apply together."""
+        project = project_repository.save(sample_project)
+        now = datetime.utcnow()
+        
+        overdue = Task(title="Overdue", deadline=now - timedelta(days=1), project_id=project.id)
+        upcoming = Task(title="Upcoming", deadline=now + timedelta(days=1), project_id=project.id)
+        done = Task(title="Done", deadline=now - timedelta(days=1), project_id=project.id)
+        done.mark_completed()
+        unlinked = Task(title="Unlinked", deadline=now - timedelta(days=1))
+        for task in (overdue, upcoming, done, unlinked):
+            task_repository.save(task)
+        
+        page = task_repository.find(TaskQuery(project_id=project.id, completed=False, overdue=True))
+        assert [t.title for t in page.items] == ["Overdue"]
+        
+        page = task_repository.find(TaskQuery(project_id=project.id, overdue=False, sort="deadline"))
+        assert [t.title for t in page.items] == ["Done", "Upcoming"]
+        
+        page = task_repository.find(TaskQuery(deadline_from=now, completed=False))
+        assert [t.title for t in page.items] == ["Upcoming"]
+    
+    def test_stream_yields_filtered_tasks_in_batches(self, task_repository):
+        """Test that streaming honours filters and sort across fetch batches."""
+        base = datetime.utcnow()
+        for i in range(5):
+            task = Task(title=f"Task {i}", deadline=base + timedelta(days=i))
+            if i % 2:
+                task.mark_completed()
+            task_repository.save(task)
+        
+        streamed = task_repository.stream(TaskQuery(completed=False, sort="-deadline"), batch_size=2)
+        
+        assert [t.title for t in streamed] == ["Task 4", "Task 2", "Task 0"]
+    
+    def test_find_page_walks_all_tasks_in_order(self, task_repository):
+        """Test that following cursors visits every task exactly once."""
+        base = datetime.utcnow()
+        for i in range(5):
+            task_repository.save(Task(
+                title=f"Task {i}",
+                deadline=base + timedelta(days=5 - i)
+            ))
+        
+        seen = []
+        cursor = None
+        while True:
+            page = task_repository.find(TaskQuery(limit=2, after=cursor, sort="deadline"))
+            seen.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        
+        assert [t.title for t in seen] == [f"Task {i}" for i in range(4, -1, -1)]
+    
+    @pytest.mark.parametrize("sort", ["created_at", "-updated_at", "deadline", "-deadline"])
+    def test_later_pages_seek_the_sort_index(self, db_session, task_repository, sort):
+        """Test that a cursor page starts inside the (sort, id) index instead of scanning or sorting."""
+        for i in range(3):
+            task_repository.save(Task(title=f"Task {i}", deadline=datetime.utcnow() + timedelta(days=i)))
+        cursor = task_repository.find(TaskQuery(limit=1, sort=sort)).next_cursor
+        
+        statements = []
+        listen = lambda conn, cur, statement, params, ctx, many: statements.append((statement, params))
+        engine = db_session.get_bind()
+        event.listen(engine, "before_cursor_execute", listen)
+        try:
+            task_repository.find(TaskQuery(limit=1, after=cursor, sort=sort))
+        finally:
+            event.remove(engine, "before_cursor_execute", listen)
+        
+        statement, params = statements[-1]
+        plan = " ".join(
+            row[-1] for row in db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", params)
+        )
+        assert f"SEARCH tasks USING INDEX ix_tasks_{sort.lstrip('-')}_id" in plan
+        assert "TEMP B-TREE" not in plan
+    
+    def test_find_page_rejects_cursor_from_other_sort(self, task_repository):
+        """Test that a cursor cannot be replayed against a different sort order."""
+        for i in range(3):
+            task_repository.save(Task(title=f"Task {i}", deadline=datetime.utcnow()))
+        
+        page = task_repository.find(TaskQuery(limit=1, sort="created_at"))
+        
+        with pytest.raises(InvalidCursorError):
+            task_repository.find(TaskQuery(limit=1, after=page.next_cursor, sort="deadline"))
+        with pytest.raises(InvalidCursorError):
+            task_repository.find(TaskQuery(limit=1, after="not-a-cursor"))
 
 
 class TestProjectRepository:
@@ -108,4 +224,114 @@ class TestProjectRepository:
             project_repository.save(project)
         
         all_projects = project_repository.find_all()
-        assert len(all_projects) == 2
\ No newline at end of file
+        assert len(all_projects) == 2
+    
+    def test_find_page_newest_first(self, project_repository):
+        """Test descending keyset pagination over projects."""
+        base = datetime.utcnow()
+        for i in range(3):
+            project_repository.save(Project(
+                title=f"Project {i}",
+                deadline=base + timedelta(days=30),
+                created_at=base + timedelta(minutes=i)
+            ))
+        
+        first = project_repository.find_page(limit=2)
+        second = project_repository.find_page(limit=2, after=first.next_cursor)
+        
+        assert [p.title for p in first.items] == ["Project 2", "Project 1"]
+        assert [p.title for p in second.items] == ["Project 0"]
+        assert second.next_cursor is None
+    
+    
+    def test_complete_if_no_open_tasks(self, project_repository, task_repository, sample_project):
+        """Test the conditional completion guard and that it fires only once."""
+        project = project_repository.save(sample_project)
+        assert project_repository.complete_if_no_open_tasks(project.id) is None
+        
+        task = task_repository.save(Task(
+            title="Last one",
+            deadline=datetime.utcnow(),
+            project_id=project.id
+        ))
+        assert task_repository.has_open_tasks(project.id) is True
+        assert project_repository.complete_if_no_open_tasks(project.id) is None
+        
+        task_repository.set_completed([task.id], completed=True)
+        assert task_repository.has_open_tasks(project.id) is False
+        assert project_repository.complete_if_no_open_tasks(project.id) is not None
+        assert project_repository.complete_if_no_open_tasks(project.id) is None
+        assert project_repository.find_by_id(project.id).completed is True
+    
+    
+    def test_version_probes_read_only_timestamps(self, project_repository, task_repository, sample_project):
+        """Test the updated_at probes used to answer conditional requests."""
+        project = project_repository.save(sample_project)
+        assert task_repository.project_tasks_version(project.id) == (0, None)
+        assert project_repository.find_updated_at(project.id) is not None
+        assert task_repository.find_updated_at(project.id) is None
+        
+        tasks = [
+            task_repository.save(Task(title=f"Task {i}", deadline=datetime.utcnow(), project_id=project.id))
+            for i in range(2)
+        ]
+        
+        count, latest = task_repository.project_tasks_version(project.id)
+        assert count == 2
+        assert latest == max(task_repository.find_updated_at(t.id) for t in tasks)
+
+
+class TestCachingRepositories:
+    """Test suite for the caching repository decorators."""
+    
+    def test_writing_unit_of_work_loads_past_the_cache(self, db_session):
+        """Test that a writer sees another process's change even while this process caches the old row."""
+        cache = EntityCache()
+        task = Task(title="Shared", deadline=datetime.now(timezone.utc))
+        with SQLAlchemyUnitOfWork(db_session) as uow:
+            uow.tasks.save(task)
+            uow.commit()
+        
+        reader = SQLAlchemyUnitOfWork(db_session, cache=cache, cache_reads=True)
+        with reader:
+            assert reader.tasks.find_by_id(task.id).completed is False
+        
+        with SQLAlchemyUnitOfWork(db_session) as other_process:
+            done = other_process.tasks.find_by_id(task.id)
+            done.mark_completed()
+            other_process.tasks.save(done)
+            other_process.commit()
+        
+        with reader:
+            assert reader.tasks.find_by_id(task.id).completed is False
+        
+        writer = SQLAlchemyUnitOfWork(db_session, cache=cache)
+        with writer:
+            assert writer.tasks.find_by_id(task.id).completed is True
+        with reader:
+            assert reader.tasks.find_by_id(task.id).completed is True
+    
+    def test_cached_unit_of_work_serves_committed_rows_only(self, db_session):
+        """Test read-through caching, write bypass and invalidation at commit."""
+        cache = EntityCache()
+        uow = SQLAlchemyUnitOfWork(db_session, cache=cache, cache_reads=True)
+        task = Task(title="Cached", deadline=datetime.now(timezone.utc))
+        
+        with uow:
+            uow.tasks.save(task)
+            assert uow.tasks.find_by_id(task.id).title == "Cached"
+            assert cache.stats()["size"] == 0
+            uow.commit()
+        
+        with uow:
+            uow.tasks.find_by_id(task.id)
+            assert uow.tasks.find_by_id(task.id).title == "Cached"
+            assert cache.stats()["hits"] == 1
+            
+            renamed = uow.tasks.find_by_id(task.id)
+            renamed.title = "Renamed"
+            uow.tasks.save(renamed)
+            uow.commit()
+        
+        with uow:
+            assert uow.tasks.find_by_id(task.id).title == "Renamed"
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, MetaData, String, Table, create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from src.application.services.project_service import ProjectService
+from src.infrastructure.database.models import GUID
+from src.infrastructure.database.schema_upgrade import upgrade_schema
+from src.infrastructure.database.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+
+def _baseline_metadata() -> MetaData:
+    """The projects and tasks tables as the first release created them, before the counters."""
+    metadata = MetaData()
+    Table(
+        "projects", metadata,
+        Column("id", GUID(), primary_key=True),
+        Column("title", String(200), nullable=False, index=True),
+        Column("deadline", DateTime, nullable=False, index=True),
+        Column("completed", Boolean, nullable=False, index=True),
+        Column("created_at", DateTime, nullable=False),
+        Column("updated_at", DateTime, nullable=False),
+    )
+    Table(
+        "tasks", metadata,
+        Column("id", GUID(), primary_key=True),
+        Column("title", String(200), nullable=False, index=True),
+        Column("description", String(1000)),
+        Column("deadline", DateTime, nullable=False, index=True),
+        Column("completed", Boolean, nullable=False, index=True),
+        Column("project_id", GUID(), ForeignKey("projects.id", ondelete="SET NULL"), index=True),
+        Column("created_at", DateTime, nullable=False),
+        Column("updated_at", DateTime, nullable=False),
+    )
+    return metadata
+
+
+class TestSchemaUpgrade:
+    """Test suite for upgrading a database created from the baseline schema."""
+    
+    def test_adds_counter_columns_and_indexes_then_reconciles(self, tmp_path):
+        """Test that a baseline database gains the new columns and can be reconciled."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+        baseline = _baseline_metadata()
+        baseline.create_all(engine)
+        
+        now = datetime.utcnow()
+        project_id = uuid4()
+        projects, tasks = baseline.tables["projects"], baseline.tables["tasks"]
+        with engine.begin() as connection:
+            connection.execute(projects.insert(), [{
+                "id": project_id, "title": "Old", "deadline": now + timedelta(days=30),
+                "completed": False, "created_at": now, "updated_at": now,
+            }])
+            connection.execute(tasks.insert(), [
+                {
+                    "id": uuid4(), "title": f"Task {i}", "deadline": now + timedelta(days=2 * i - 1),
+                    "completed": i == 2, "project_id": project_id, "created_at": now, "updated_at": now,
+                }
+                for i in range(3)
+            ])
+        
+        added = upgrade_schema(engine)
+        
+        assert {"projects.task_count", "projects.completed_count"} <= set(added)
+        assert "ix_tasks_deadline_id" in added
+        columns = {column["name"]: column for column in inspect(engine).get_columns("projects")}
+        assert columns["task_count"]["nullable"] is False
+        assert upgrade_schema(engine) == []
+        
+        uow = SQLAlchemyUnitOfWork(sessionmaker(bind=engine)(), close_on_exit=True)
+        service = ProjectService(uow, InMemoryEventBus())
+        assert service.reconcile_counters() == 1
+        progress = service.get_progress(project_id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (3, 1, 1)
+        engine.dispose()
@@ -0,0 +1,66 @@
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.database.sqlite_profile import (
+    apply_sqlite_profile,
+    is_sqlite_file,
+    sqlite_pragmas
+)
+
+
+@pytest.fixture
+def database_path(tmp_path):
+    """Fixture for the path of a fresh SQLite database file."""
+    return tmp_path / "profile.db"
+
+
+def _engine(path, **profile):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    apply_sqlite_profile(engine, sqlite_pragmas(Settings()), **profile)
+    return engine
+
+
+class TestSQLiteProfile:
+    """Test suite for the SQLite pragma profile and the writer engine."""
+    
+    def test_pragmas_are_applied_to_new_connections(self, database_path):
+        """Test that every configured pragma is in effect on a pooled connection."""
+        engine = _engine(database_path)
+        
+        with engine.connect() as connection:
+            pragma = lambda name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("cache_size") == -Settings().SQLITE_CACHE_SIZE_KB
+            assert pragma("temp_store") == 2  # MEMORY
+            assert pragma("busy_timeout") == Settings().SQLITE_BUSY_TIMEOUT_MS
+            assert pragma("foreign_keys") == 1
+        engine.dispose()
+    
+    def test_writer_takes_the_write_lock_at_begin(self, database_path):
+        """Test that a writer transaction blocks other writers but not WAL readers."""
+        engine = _engine(database_path, begin_immediate=True)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+        
+        other = sqlite3.connect(database_path, timeout=0.05, isolation_level=None)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("SELECT count(*) FROM items").scalar()
+            
+            assert other.execute("SELECT count(*) FROM items").fetchone() == (0,)
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("BEGIN IMMEDIATE")
+        
+        other.execute("BEGIN IMMEDIATE")
+        other.execute("ROLLBACK")
+        other.close()
+        engine.dispose()
+    
+    def test_in_memory_databases_have_no_separate_writer(self):
+        """Test that only file databases qualify for a second (writer) engine."""
+        assert is_sqlite_file("sqlite:///./tasks.db")
+        assert not is_sqlite_file("sqlite:///:memory:")
+        assert not is_sqlite_file("postgresql://localhost/tasks")
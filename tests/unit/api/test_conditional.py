@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from fastapi import Response
+from starlette.requests import Request
+
+from src.api.conditional import is_not_modified, make_etag, set_validators
+
+
+def _request(**headers):
+    return Request({
+        "type": "http",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+class TestConditionalRequests:
+    """Test suite for ETag/Last-Modified validation."""
+    
+    def test_etag_changes_with_version_and_variant(self):
+        """Test that the tag is stable per version and distinct across versions and variants."""
+        entity_id, updated_at = uuid4(), datetime.now(timezone.utc)
+        
+        assert make_etag(entity_id, updated_at) == make_etag(entity_id, updated_at.replace(tzinfo=None))
+        assert make_etag(entity_id, updated_at) != make_etag(entity_id, updated_at + timedelta(microseconds=1))
+        assert make_etag(entity_id, updated_at) != make_etag(entity_id, updated_at, "progress")
+    
+    def test_if_none_match_takes_precedence(self):
+        """Test list, weak and wildcard matching, and that If-Modified-Since is then ignored."""
+        updated_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        etag = make_etag("id", updated_at)
+        
+        assert is_not_modified(_request(if_none_match=f'"other", W/{etag}'), etag, updated_at)
+        assert is_not_modified(_request(if_none_match="*"), etag, updated_at)
+        assert not is_not_modified(
+            _request(if_none_match='"other"', if_modified_since="Tue, 01 Jan 2030 00:00:00 GMT"),
+            etag,
+            updated_at
+        )
+    
+    def test_if_modified_since_uses_second_precision(self):
+        """Test date comparison against the truncated Last-Modified value."""
+        updated_at = datetime(2030, 1, 1, 0, 0, 0, 500000, tzinfo=timezone.utc)
+        response = Response()
+        set_validators(response, make_etag("id", updated_at), updated_at)
+        last_modified = response.headers["Last-Modified"]
+        
+        assert last_modified == "Tue, 01 Jan 2030 00:00:00 GMT"
+        assert is_not_modified(_request(if_modified_since=last_modified), "", updated_at)
+        assert not is_not_modified(
+            _request(if_modified_since="Mon, 31 Dec 2029 23:59:59 GMT"), "", updated_at
+        )
+        assert not is_not_modified(_request(if_modified_since="garbage"), "", updated_at)
@@ -0,0 +1,84 @@
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import msgpack
+from starlette.requests import Request
+
+from src.api.schemas.project_schemas import ProjectDetailResponse
+from src.api.schemas.task_schemas import TaskResponse
+from src.api.serialization import RowSerializer, list_response, negotiate
+from src.domain.entities.project import Project
+from src.domain.entities.task import Task
+
+
+def _request(accept="application/json"):
+    return Request({"type": "http", "headers": [(b"accept", accept.encode())]})
+
+
+def _tasks():
+    now = datetime.now(timezone.utc)
+    return [
+        Task(title="Plain", deadline=now),
+        Task(title="Ünïcode", description="d", deadline=now + timedelta(microseconds=1), project_id=uuid4()),
+    ]
+
+
+class TestListSerialization:
+    """Test suite for the validation-free list encoding."""
+    
+    def test_json_matches_response_model_output(self):
+        """Test that the fast path produces the same JSON as pydantic does."""
+        tasks = _tasks()
+        
+        response = list_response(_request(), tasks, RowSerializer(TaskResponse))
+        
+        expected = [TaskResponse.model_validate(task).model_dump(mode="json") for task in tasks]
+        assert json.loads(response.body) == expected
+        assert response.headers["vary"] == "Accept"
+    
+    def test_msgpack_is_negotiated(self):
+        """Test that clients accepting msgpack get the same rows as MessagePack."""
+        tasks = _tasks()
+        
+        response = list_response(
+            _request("application/msgpack, application/json;q=0.5"),
+            tasks,
+            RowSerializer(TaskResponse),
+            headers={"X-Next-Cursor": "abc"}
+        )
+        
+        assert response.media_type == "application/msgpack"
+        assert response.headers["x-next-cursor"] == "abc"
+        assert msgpack.unpackb(response.body) == json.loads(
+            list_response(_request(), tasks, RowSerializer(TaskResponse)).body
+        )
+    
+    def test_excluded_fields_and_extensions(self):
+        """Test that excluded schema fields are left out and `extend` can add members."""
+        project = Project(title="P", deadline=datetime.now(timezone.utc))
+        
+        response = list_response(
+            _request(),
+            [project],
+            RowSerializer(ProjectDetailResponse, exclude=("progress",)),
+            extend=lambda obj, row: row.update(extra=obj.title)
+        )
+        
+        row = json.loads(response.body)[0]
+        assert "progress" not in row
+        assert row["extra"] == "P"
+    
+    @pytest.mark.parametrize("accept, expected", [
+        ("application/json, application/msgpack;q=0.1", "application/json"),
+        ("application/msgpack;q=0.9, application/json;q=0.2", "application/msgpack"),
+        ("application/x-msgpack", "application/msgpack"),
+        ("application/msgpack;q=0, */*", "application/json"),
+        ("application/*;q=0.5, application/msgpack", "application/msgpack"),
+        ("*/*", "application/json"),
+        ("", "application/json"),
+    ])
+    def test_negotiation_honours_q_values(self, accept, expected):
+        """Test that the media type with the highest q-value wins, JSON on ties."""
+        assert negotiate(_request(accept)) == expected
@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.api.schemas.task_schemas import TaskResponse
+from src.api.serialization import RowSerializer
+from src.api.streaming import closing_stream, encode_rows
+from src.domain.entities.task import Task
+
+
+def _tasks():
+    now = datetime.now(timezone.utc)
+    return [
+        Task(title="Plain", deadline=now),
+        Task(title="Ünïcode, \"quoted\"", description="d", deadline=now + timedelta(days=1), project_id=uuid4()),
+        Task(title="Done", deadline=now, completed=True),
+    ]
+
+
+class TestEncodeRows:
+    """Test suite for the export encoders."""
+    
+    def test_ndjson_matches_response_model_output(self):
+        """Test that exported lines equal pydantic's JSON for each row, across chunks."""
+        tasks = _tasks()
+        
+        chunks = list(encode_rows(tasks, RowSerializer(TaskResponse), "ndjson", chunk_rows=2))
+        
+        assert len(chunks) == 2
+        lines = b"".join(chunks).decode().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            json.loads(TaskResponse.model_validate(task).model_dump_json()) for task in tasks
+        ]
+    
+    def test_csv_matches_response_model_output(self):
+        """Test that CSV cells hold the JSON-mode values, with a header and empty cells for None."""
+        tasks = _tasks()
+        
+        body = b"".join(encode_rows(tasks, RowSerializer(TaskResponse), "csv", chunk_rows=2)).decode()
+        
+        rows = list(csv.reader(io.StringIO(body)))
+        fields = list(TaskResponse.model_fields)
+        assert rows[0] == fields
+        for task, row in zip(tasks, rows[1:]):
+            values = TaskResponse.model_validate(task).model_dump(mode="json")
+            assert row == ["" if values[f] is None else str(values[f]) for f in fields]
+
+
+class TestClosingStream:
+    """Test suite for releasing export resources when the stream ends."""
+    
+    def test_closes_after_last_chunk(self):
+        """Test that the resource is released once the stream is exhausted."""
+        closed = []
+        
+        assert list(closing_stream(iter(["a", "b"]), lambda: closed.append(True))) == ["a", "b"]
+        assert closed == [True]
+    
+    def test_closes_when_encoding_fails(self):
+        """Test that a stream that raises mid-way still releases its resource."""
+        closed = []
+        
+        def chunks():
+            yield "a"
+            raise RuntimeError("row failed")
+        
+        stream = closing_stream(chunks(), lambda: closed.append(True))
+        assert next(stream) == "a"
+        with pytest.raises(RuntimeError):
+            next(stream)
+        assert closed == [True]
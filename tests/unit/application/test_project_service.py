@@ -0,0 +1,164 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from src.application.services.project_service import ProjectService
+from src.domain.entities.task import Task
+from src.domain.events.task_events import TaskDeadlineChangedEvent, TaskUnlinkedEvent
+
+
+@pytest.fixture
+def project_service(unit_of_work, event_bus):
+    """Fixture for a project service wired to the test database."""
+    return ProjectService(unit_of_work, event_bus)
+
+
+class TestDeleteProject:
+    """Test suite for project deletion."""
+    
+    def test_delete_unlinks_tasks_and_notifies_subscribers(
+        self, project_service, unit_of_work, event_bus
+    ):
+        """Test that deleting a project detaches its tasks in bulk."""
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("Doomed", now + timedelta(days=30))
+        tasks = [
+            Task(title=f"Task {i}", deadline=now + timedelta(days=1), project_id=project.id)
+            for i in range(3)
+        ]
+        unit_of_work.tasks.save_many(tasks)
+        
+        published = []
+        event_bus.subscribe(TaskUnlinkedEvent, published.append)
+        
+        assert project_service.delete_project(project.id) is True
+        
+        assert unit_of_work.projects.find_by_id(project.id) is None
+        assert all(t.project_id is None for t in unit_of_work.tasks.find_all())
+        assert {e.task_id for e in published} == {t.id for t in tasks}
+
+
+class TestUpdateProject:
+    """Test suite for project updates that clamp task deadlines."""
+    
+    def test_pulling_deadline_in_clamps_late_tasks(self, project_service, unit_of_work, event_bus):
+        """Test that late tasks move with the project in one commit and are counted."""
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("P", now + timedelta(days=30))
+        early = Task(title="Early", deadline=now + timedelta(days=5), project_id=project.id)
+        late = Task(title="Late", deadline=now + timedelta(days=20), project_id=project.id)
+        other = Task(title="Other", deadline=now + timedelta(days=20))
+        unit_of_work.tasks.save_many([early, late, other])
+        
+        published = []
+        event_bus.subscribe(TaskDeadlineChangedEvent, published.append)
+        new_deadline = now + timedelta(days=10)
+        
+        result = project_service.update_project(project.id, deadline=new_deadline)
+        
+        assert result.adjusted_tasks == 1
+        assert result.project.deadline == new_deadline
+        assert [e.task_id for e in published] == [late.id]
+        assert published[0].old_deadline == late.deadline
+        assert unit_of_work.tasks.find_by_id(late.id).deadline == new_deadline
+        assert unit_of_work.tasks.find_by_id(early.id).deadline == early.deadline
+        assert unit_of_work.tasks.find_by_id(other.id).deadline == other.deadline
+    
+    def test_extending_deadline_moves_no_tasks(self, project_service, unit_of_work):
+        """Test that a later deadline leaves task deadlines alone."""
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("P", now + timedelta(days=10))
+        task = Task(title="T", deadline=now + timedelta(days=5), project_id=project.id)
+        unit_of_work.tasks.save_many([task])
+        
+        result = project_service.update_project(project.id, title="Renamed", deadline=now + timedelta(days=20))
+        
+        assert result.adjusted_tasks == 0
+        assert result.project.title == "Renamed"
+        assert unit_of_work.tasks.find_by_id(task.id).deadline == task.deadline
+
+
+class TestProjectProgress:
+    """Test suite for the maintained per-project task counters."""
+    
+    def test_counters_follow_task_lifecycle(self, project_service, unit_of_work, event_bus):
+        """Test that create, complete, reopen, unlink and delete keep counters exact."""
+        from src.application.services.task_service import TaskService
+        task_service = TaskService(unit_of_work, event_bus)
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("Tracked", now + timedelta(days=30))
+        
+        first = task_service.create_task("First", now + timedelta(days=1), project_id=project.id)
+        late = task_service.create_task("Late", now - timedelta(days=1), project_id=project.id)
+        task_service.create_tasks([
+            {"title": "Bulk", "deadline": now + timedelta(days=2), "project_id": project.id}
+        ])
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (3, 0, 1)
+        
+        task_service.complete_task(late.id)
+        task_service.complete_tasks([first.id])
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (3, 2, 0)
+        assert progress.percent_complete == 66.7
+        
+        task_service.reopen_tasks([late.id])
+        project_service.unlink_task(project.id, first.id)
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (2, 0, 1)
+        
+        task_service.delete_task(late.id)
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (1, 0, 0)
+    
+    def test_counter_writes_keep_project_updated_at(self, project_service, unit_of_work, event_bus):
+        """Test that task writes move the counters but not the project's Last-Modified."""
+        from src.application.services.task_service import TaskService
+        task_service = TaskService(unit_of_work, event_bus)
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("Stable", now + timedelta(days=30))
+        updated_at = project_service.get_project_last_modified(project.id)
+        
+        task = task_service.create_task("T", now + timedelta(days=1), project_id=project.id)
+        task_service.complete_task(task.id)
+        task_service.delete_task(task.id)
+        project_service.reconcile_counters()
+        
+        assert project_service.get_project_last_modified(project.id) == updated_at
+    
+    def test_task_completed_after_its_deadline_passed(self, project_service, unit_of_work, event_bus):
+        """Test that a task which aged past its deadline is counted as overdue until it is completed."""
+        from src.application.services.task_service import TaskService
+        task_service = TaskService(unit_of_work, event_bus)
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("Aging", now + timedelta(days=30))
+        task = task_service.create_task("Soon", now + timedelta(hours=1), project_id=project.id)
+        assert project_service.get_progress(project.id).overdue_count == 0
+        
+        # Time passes: the deadline is now behind us without the task being written through the service
+        with unit_of_work as uow:
+            uow.tasks.clamp_deadlines(project.id, now - timedelta(hours=1))
+            uow.commit()
+        assert project_service.get_progress(project.id).overdue_count == 1
+        
+        task_service.complete_task(task.id)
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (1, 1, 0)
+        
+        task_service.delete_task(task.id)
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (0, 0, 0)
+    
+    def test_reconcile_rebuilds_drifted_counters(self, project_service, unit_of_work):
+        """Test that reconciliation recounts projects whose counters drifted."""
+        now = datetime.now(timezone.utc)
+        project = project_service.create_project("Drifted", now + timedelta(days=30))
+        unit_of_work.tasks.save_many([
+            Task(title="Done", deadline=now + timedelta(days=1), project_id=project.id, completed=True),
+            Task(title="Late", deadline=now - timedelta(days=1), project_id=project.id),
+        ])
+        assert project_service.get_progress(project.id).task_count == 0
+        
+        assert project_service.reconcile_counters() == 1
+        progress = project_service.get_progress(project.id)
+        assert (progress.task_count, progress.completed_count, progress.overdue_count) == (2, 1, 1)
+        assert project_service.reconcile_counters() == 0
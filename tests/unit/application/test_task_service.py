@@ -0,0 +1,122 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from src.application.event_handlers.setup import setup_event_handlers
+from src.application.services.task_service import TaskService
+from src.domain.entities.base import DomainEvent
+from src.domain.entities.project import Project
+from src.domain.events.project_events import ProjectCompletedEvent
+from src.domain.events.task_events import TaskCompletedEvent, TaskCreatedEvent
+
+
+@pytest.fixture
+def task_service(unit_of_work, event_bus):
+    """Fixture for a task service wired to the test database."""
+    return TaskService(unit_of_work, event_bus)
+
+
+class TestBulkCreateTasks:
+    """Test suite for bulk task creation."""
+    
+    def test_creates_valid_items_and_reports_invalid_ones(
+        self, task_service, project_repository, task_repository, event_bus
+    ):
+        """Test that one bad item does not block the rest of the batch."""
+        now = datetime.now(timezone.utc)
+        project = project_repository.save(
+            Project(title="Bulk Target", deadline=now + timedelta(days=10))
+        )
+        published = []
+        event_bus.subscribe(TaskCreatedEvent, published.append)
+        
+        result = task_service.create_tasks([
+            {"title": "Fits", "deadline": now + timedelta(days=5), "project_id": project.id},
+            {"title": "Too late", "deadline": now + timedelta(days=20), "project_id": project.id},
+            {"title": "Orphan", "deadline": now, "project_id": uuid4()},
+            {"title": "Standalone", "deadline": now},
+        ])
+        
+        assert [t.title for t in result.created] == ["Fits", "Standalone"]
+        assert [e.index for e in result.errors] == [1, 2]
+        assert len(task_repository.find_all()) == 2
+        assert {e.task_id for e in published} == {t.id for t in result.created}
+
+
+
+class TestBulkCompleteTasks:
+    """Test suite for bulk completion and reopening."""
+    
+    def test_complete_and_reopen_update_projects_once(
+        self, task_service, project_repository, event_bus
+    ):
+        """Test bulk completion auto-completes the project and bulk reopen reverts it."""
+        now = datetime.now(timezone.utc)
+        project = project_repository.save(
+            Project(title="Sprint", deadline=now + timedelta(days=10))
+        )
+        created = task_service.create_tasks([
+            {"title": f"Task {i}", "deadline": now + timedelta(days=1), "project_id": project.id}
+            for i in range(3)
+        ]).created
+        ids = [t.id for t in created]
+        published = []
+        event_bus.subscribe(TaskCompletedEvent, published.append)
+        
+        completed = task_service.complete_tasks(ids + [uuid4()], auto_complete_project=True)
+        
+        assert {t.id for t in completed} == set(ids)
+        assert len(published) == 3
+        assert project_repository.find_by_id(project.id).completed is True
+        assert task_service.complete_tasks(ids) == []
+        
+        reopened = task_service.reopen_tasks(ids[:1])
+        
+        assert [t.id for t in reopened] == ids[:1]
+        assert reopened[0].completed is False
+        assert project_repository.find_by_id(project.id).completed is False
+    
+    def test_service_is_the_only_owner_of_project_auto_completion(
+        self, task_service, unit_of_work, project_repository, event_bus
+    ):
+        """Test that registered handlers neither complete projects nor duplicate the service's event."""
+        setup_event_handlers(event_bus, lambda: unit_of_work)
+        now = datetime.now(timezone.utc)
+        projects = [
+            project_repository.save(Project(title=title, deadline=now + timedelta(days=10)))
+            for title in ("Manual", "Auto")
+        ]
+        task_ids = [
+            task_service.create_tasks([
+                {"title": "Only", "deadline": now + timedelta(days=1), "project_id": project.id}
+            ]).created[0].id
+            for project in projects
+        ]
+        completions = []
+        event_bus.subscribe(ProjectCompletedEvent, completions.append)
+        
+        task_service.complete_tasks(task_ids[:1])
+        task_service.complete_tasks(task_ids[1:], auto_complete_project=True)
+        
+        assert project_repository.find_by_id(projects[0].id).completed is False
+        assert project_repository.find_by_id(projects[1].id).completed is True
+        assert [e.project_id for e in completions] == [projects[1].id]
+    
+    def test_project_completion_is_published_after_its_task_completions(
+        self, task_service, project_repository, event_bus
+    ):
+        """Test that ProjectCompletedEvent follows the TaskCompletedEvents that caused it."""
+        now = datetime.now(timezone.utc)
+        project = project_repository.save(Project(title="Ordered", deadline=now + timedelta(days=10)))
+        ids = [t.id for t in task_service.create_tasks([
+            {"title": f"Task {i}", "deadline": now + timedelta(days=1), "project_id": project.id}
+            for i in range(2)
+        ]).created]
+        published = []
+        event_bus.subscribe(DomainEvent, published.append)
+        
+        task_service.complete_tasks(ids, auto_complete_project=True)
+        
+        assert [type(e) for e in published] == [
+            TaskCompletedEvent, TaskCompletedEvent, ProjectCompletedEvent
+        ]
@@ -0,0 +1,66 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.domain.entities.base import EventIdGenerator, event_batch, set_event_clock
+from src.domain.events.task_events import TaskCompletedEvent, TaskReopenedEvent
+
+
+def _completed():
+    return TaskCompletedEvent(task_id=uuid4(), project_id=None, completed_at=datetime.now(timezone.utc))
+
+
+class TestEventIds:
+    """Test suite for sequence-based UUIDv7 event ids."""
+    
+    def test_ids_are_increasing_uuid7(self):
+        """Test that event ids are UUIDv7 and strictly increasing."""
+        ids = [_completed().event_id for _ in range(100)]
+        
+        assert all(event_id.version == 7 for event_id in ids)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+    
+    def test_ids_stay_unique_across_sequence_wrap(self):
+        """Test that a wrapped sequence moves to a new, later prefix."""
+        class TinyGenerator(EventIdGenerator):
+            _SEQUENCE_BITS = 2
+        
+        generator = TinyGenerator()
+        ids = [generator() for _ in range(20)]
+        
+        assert len(set(ids)) == 20
+        assert ids == sorted(ids)
+
+
+class TestEventClock:
+    """Test suite for the injectable event clock and batch timestamps."""
+    
+    def test_injected_clock_stamps_events(self):
+        """Test that set_event_clock controls occurred_at until it is reset."""
+        fixed = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        set_event_clock(lambda: fixed)
+        try:
+            assert _completed().occurred_at == fixed
+        finally:
+            set_event_clock()
+        
+        assert _completed().occurred_at != fixed
+    
+    def test_event_batch_shares_one_timestamp(self):
+        """Test that events created in a batch share occurred_at, and only inside it."""
+        with event_batch() as occurred_at:
+            events = [_completed() for _ in range(5)]
+            events.append(TaskReopenedEvent(task_id=uuid4(), project_id=None))
+        
+        assert {event.occurred_at for event in events} == {occurred_at}
+        assert len({event.event_id for event in events}) == len(events)
+        assert _completed().occurred_at is not occurred_at
+    
+    def test_event_batch_accepts_explicit_timestamp(self):
+        """Test stamping a batch with a caller-supplied time."""
+        at = datetime(2031, 6, 1, 12, 0, tzinfo=timezone.utc)
+        
+        with event_batch(at):
+            event = _completed()
+        
+        assert event.occurred_at == at
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from benchmarks.bench_entity_memory import _event, _loaded_task, bytes_per_object
+from src.domain.entities.project import Project
+from src.domain.entities.task import Task
+from src.domain.events.task_events import TaskCompletedEvent
+
+
+class TestEntityMemory:
+    """Guards the compact (slotted, lazily buffered) entity and event layout."""
+    
+    def test_entities_and_events_have_no_instance_dict(self):
+        """Test that entities and events are slotted all the way down."""
+        now = datetime.now(timezone.utc)
+        task = Task(title="Task", deadline=now + timedelta(days=1))
+        project = Project(title="Project", deadline=now + timedelta(days=1))
+        event = TaskCompletedEvent(task_id=uuid4(), project_id=None, completed_at=now)
+        
+        for obj in (task, project, event):
+            assert not hasattr(obj, "__dict__")
+    
+    def test_loaded_task_holds_no_change_set_or_event_buffer(self):
+        """Test that a clean task without events allocates neither."""
+        task = _loaded_task(uuid4(), datetime.now(timezone.utc))
+        
+        assert task._dirty is None
+        assert task._events is None
+        assert task.collect_events() == []
+    
+    def test_loaded_task_footprint(self):
+        """Test bytes per loaded Task stay well under the pre-slots ~490."""
+        assert bytes_per_object(_loaded_task, 20000) < 250
+    
+    def test_event_footprint(self):
+        """Test bytes per TaskCompletedEvent stay under the pre-slots ~270."""
+        assert bytes_per_object(_event, 20000) < 250
@@ -135,3 +135,17 @@ class TestTaskEntity:
         
         approaching_task.mark_completed()
         assert approaching_task.is_deadline_approaching(hours=24) is False
+
+    
+    def test_dirty_fields_track_changes(self):
+        """Test that assignments are recorded until the entity is marked clean."""
+        task = Task(
+            title="Task",
+            deadline=datetime.utcnow() + timedelta(days=5)
+        )
+        assert "title" in task.dirty_fields
+        
+        task.mark_clean()
+        task.mark_completed()
+        
+        assert task.dirty_fields == {"completed", "updated_at"}
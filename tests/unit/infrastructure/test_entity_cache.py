@@ -0,0 +1,80 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.domain.entities.task import Task
+from src.domain.events.task_events import TaskCompletedEvent
+from src.infrastructure.cache.entity_cache import EntityCache
+
+
+def _task():
+    return Task(title="Cached", deadline=datetime.now(timezone.utc))
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class TestEntityCache:
+    """Test suite for the LRU/TTL entity cache."""
+    
+    def test_get_returns_private_copies(self):
+        """Test that mutating a cache hit leaves the cached snapshot untouched."""
+        cache = EntityCache()
+        task = _task()
+        cache.put(("task", task.id), task, cache.token())
+        
+        hit = cache.get(("task", task.id))
+        hit.title = "Changed"
+        
+        assert hit is not task
+        assert hit.dirty_fields == {"title"}
+        assert cache.get(("task", task.id)).title == "Cached"
+        assert cache.stats()["hits"] == 2
+    
+    def test_lru_eviction_and_ttl_expiry(self):
+        """Test that the least recently used entry is evicted and old entries expire."""
+        clock = _Clock()
+        cache = EntityCache(max_entries=2, ttl_seconds=10, clock=clock)
+        first, second, third = _task(), _task(), _task()
+        for task in (first, second):
+            cache.put(("task", task.id), task, cache.token())
+        cache.get(("task", first.id))
+        cache.put(("task", third.id), third, cache.token())
+        
+        assert cache.get(("task", second.id)) is None
+        assert cache.get(("task", first.id)) is not None
+        
+        clock.now = 11
+        assert cache.get(("task", first.id)) is None
+        stats = cache.stats()
+        assert (stats["evictions"], stats["expirations"]) == (1, 1)
+    
+    def test_load_racing_an_invalidation_is_not_stored(self):
+        """Test that a value read before a concurrent invalidation is discarded."""
+        cache = EntityCache()
+        task = _task()
+        token = cache.token()
+        cache.invalidate([("task", uuid4())])
+        cache.put(("task", task.id), task, token)
+        
+        assert cache.get(("task", task.id)) is None
+    
+    def test_events_invalidate_referenced_entities(self):
+        """Test that bus events drop both the task and its project."""
+        cache = EntityCache()
+        task = _task()
+        task.project_id = uuid4()
+        cache.put(("task", task.id), task, cache.token())
+        
+        cache.invalidate_events([TaskCompletedEvent(
+            task_id=task.id, project_id=task.project_id, completed_at=datetime.now(timezone.utc)
+        )])
+        
+        assert cache.get(("task", task.id)) is None
+        assert cache.stats()["invalidations"] == 1
@@ -0,0 +1,211 @@
+import threading
+import time
+from uuid import uuid4
+
+from src.domain.entities.base import DomainEvent
+from src.domain.events.task_events import (
+    TaskCompletedEvent,
+    TaskDeadlineChangedEvent,
+    TaskReopenedEvent,
+    TaskUnlinkedEvent,
+)
+from src.infrastructure.event_bus.in_memory_event_bus import InMemoryEventBus
+
+
+def _completed(project_id, index, task_id=None):
+    return TaskCompletedEvent(task_id=task_id or uuid4(), project_id=project_id, completed_at=index)
+
+
+class TestQueuedDispatch:
+    """Test suite for the worker-queue dispatch mode."""
+    
+    def test_events_of_one_aggregate_keep_publish_order(self):
+        """Test that per-task order survives concurrent workers."""
+        bus = InMemoryEventBus(workers=4, queue_size=100)
+        seen = {}
+        lock = threading.Lock()
+        
+        def record(event):
+            with lock:
+                seen.setdefault(event.task_id, []).append(event.completed_at)
+        
+        bus.subscribe(TaskCompletedEvent, record)
+        tasks = [uuid4() for _ in range(5)]
+        for index in range(50):
+            for task_id in tasks:
+                bus.publish(_completed(uuid4(), index, task_id))
+        
+        assert bus.shutdown(timeout=5) is True
+        assert all(seen[t] == list(range(50)) for t in tasks)
+        assert bus.metrics()["handled"] == 250
+    
+    def test_task_events_with_and_without_project_share_a_shard(self):
+        """Test that a task's events stay ordered while its project_id comes and goes."""
+        bus = InMemoryEventBus(workers=4, queue_size=100)
+        seen = {}
+        lock = threading.Lock()
+        
+        def record(event):
+            with lock:
+                seen.setdefault(event.task_id, []).append(type(event).__name__)
+        
+        bus.subscribe(DomainEvent, record)
+        tasks = [uuid4() for _ in range(20)]
+        expected = []
+        for task_id in tasks:
+            project_id = uuid4()
+            events = [
+                _completed(project_id, 0, task_id),
+                TaskDeadlineChangedEvent(task_id=task_id, old_deadline=None, new_deadline=None),
+                TaskUnlinkedEvent(task_id=task_id, project_id=project_id),
+                TaskReopenedEvent(task_id=task_id, project_id=None),
+            ]
+            expected = [type(event).__name__ for event in events]
+            for event in events:
+                bus.publish(event)
+        
+        assert bus.shutdown(timeout=5) is True
+        assert all(seen[t] == expected for t in tasks)
+    
+    def test_full_queue_blocks_publisher(self):
+        """Test that a full shard applies backpressure instead of dropping events."""
+        bus = InMemoryEventBus(workers=1, queue_size=1)
+        release = threading.Event()
+        handled = []
+        bus.subscribe(TaskCompletedEvent, lambda e: (release.wait(5), handled.append(e)))
+        
+        project_id = uuid4()
+        bus.publish(_completed(project_id, 0))
+        time.sleep(0.05)
+        bus.publish(_completed(project_id, 1))
+        
+        publisher = threading.Thread(target=bus.publish, args=(_completed(project_id, 2),))
+        publisher.start()
+        publisher.join(0.1)
+        assert publisher.is_alive()
+        assert bus.metrics()["queue_depth"] == 1
+        
+        release.set()
+        publisher.join(5)
+        assert bus.shutdown(timeout=5) is True
+        assert [e.completed_at for e in handled] == [0, 1, 2]
+        assert bus.metrics()["blocked_publishes"] == 1
+    
+    def test_shutdown_respects_timeout_with_a_stuck_handler(self):
+        """Test that a full shard behind a stuck handler cannot hang shutdown."""
+        bus = InMemoryEventBus(workers=1, queue_size=1)
+        release = threading.Event()
+        handled = []
+        bus.subscribe(TaskCompletedEvent, lambda e: (release.wait(5), handled.append(e)))
+        
+        task_id = uuid4()
+        bus.publish(_completed(None, 0, task_id))
+        time.sleep(0.05)
+        bus.publish(_completed(None, 1, task_id))
+        publisher = threading.Thread(target=bus.publish, args=(_completed(None, 2, task_id),))
+        publisher.start()
+        publisher.join(0.1)
+        
+        start = time.monotonic()
+        assert bus.shutdown(timeout=0.2) is False
+        assert time.monotonic() - start < 1
+        
+        # The waiting publisher handles its event itself instead of queueing it behind the stop
+        release.set()
+        publisher.join(5)
+        assert not publisher.is_alive()
+        time.sleep(0.1)
+        assert sorted(e.completed_at for e in handled) == [0, 1, 2]
+    
+    def test_handler_events_are_dispatched_on_the_worker(self):
+        """Test that events published by a handler run inline after their cause."""
+        bus = InMemoryEventBus(workers=2)
+        order = []
+        
+        def on_completed(event):
+            order.append("completed")
+            bus.publish(TaskReopenedEvent(task_id=event.task_id, project_id=event.project_id))
+            order.append("completed-done")
+        
+        bus.subscribe(TaskCompletedEvent, on_completed)
+        bus.subscribe(TaskReopenedEvent, lambda e: order.append("reopened"))
+        bus.publish(_completed(uuid4(), 0))
+        
+        assert bus.shutdown(timeout=5) is True
+        assert order == ["completed", "reopened", "completed-done"]
+    
+    def test_inline_mode_is_default(self):
+        """Test that without workers handlers run before publish returns."""
+        bus = InMemoryEventBus()
+        handled = []
+        bus.subscribe(TaskCompletedEvent, handled.append)
+        
+        bus.publish(_completed(uuid4(), 0))
+        
+        assert len(handled) == 1
+        assert bus.metrics()["mode"] == "inline"
+
+
+class TestDispatchTable:
+    """Test suite for base-class subscriptions and batch publishing."""
+    
+    def test_base_class_subscription_receives_subclass_events(self):
+        """Test that subscribing to DomainEvent sees every event type."""
+        bus = InMemoryEventBus()
+        seen = []
+        bus.subscribe(DomainEvent, seen.append)
+        
+        completed = _completed(uuid4(), 0)
+        reopened = TaskReopenedEvent(task_id=uuid4(), project_id=None)
+        bus.publish(completed)
+        bus.publish(reopened)
+        
+        assert seen == [completed, reopened]
+        assert bus.has_subscribers(TaskReopenedEvent)
+    
+    def test_subscribe_after_publish_refreshes_dispatch(self):
+        """Test that a late subscription is picked up by already-resolved types."""
+        bus = InMemoryEventBus()
+        assert not bus.has_subscribers(TaskCompletedEvent)
+        
+        handled = []
+        bus.subscribe(DomainEvent, handled.append)
+        bus.publish(_completed(uuid4(), 0))
+        
+        assert bus.has_subscribers(TaskCompletedEvent)
+        assert len(handled) == 1
+    
+    def test_publish_many_batches_consecutive_events_of_one_type(self):
+        """Test that batch handlers get one call per run while order is preserved."""
+        bus = InMemoryEventBus()
+        batches, singles = [], []
+        bus.subscribe(TaskCompletedEvent, lambda events: batches.append(list(events)), batch=True)
+        bus.subscribe(DomainEvent, singles.append)
+        
+        project_id = uuid4()
+        first = [_completed(project_id, i) for i in range(3)]
+        reopened = TaskReopenedEvent(task_id=uuid4(), project_id=project_id)
+        last = _completed(project_id, 3)
+        bus.publish_many(first + [reopened, last])
+        
+        assert batches == [first, [last]]
+        assert singles == first + [reopened, last]
+        assert bus.metrics()["handled"] == 7
+    
+    def test_publish_many_in_queued_mode_keeps_order(self):
+        """Test that runs split across shards still reach handlers in order per task."""
+        bus = InMemoryEventBus(workers=2, queue_size=10)
+        seen = {}
+        lock = threading.Lock()
+        
+        def record(events):
+            with lock:
+                for event in events:
+                    seen.setdefault(event.task_id, []).append(event.completed_at)
+        
+        bus.subscribe(TaskCompletedEvent, record, batch=True)
+        tasks = [uuid4() for _ in range(4)]
+        bus.publish_many(_completed(None, i, t) for i in range(20) for t in tasks)
+        
+        assert bus.shutdown(timeout=5) is True
+        assert all(seen[t] == list(range(20)) for t in tasks)